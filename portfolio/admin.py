@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
-from django.utils.html import format_html
+from django.utils.html import format_html, format_html_join
 from django.urls import reverse
 from django.contrib.admin import AdminSite
 from django.contrib.auth.decorators import user_passes_test
@@ -12,12 +12,14 @@ from .models import (
     Tag, SearchQuery, FAQ, Timeline, Collaboration, Resource, Analytics,
     CVDocument
 )
+from .ratelimit import CONFIGURABLE_LIMITS, get_counters
 
 @admin.register(Profile)
 class ProfileAdmin(admin.ModelAdmin):
     list_display = ('name', 'title', 'email', 'availability_status', 'updated_at')
     search_fields = ('name', 'title', 'email')
-    readonly_fields = ('created_at', 'updated_at', 'age', 'years_of_experience')
+    readonly_fields = ('created_at', 'updated_at', 'age', 'years_of_experience',
+                       'projects_total', 'certifications_total', 'skills_total')
     list_filter = ('availability_status', 'updated_at')
     
     fieldsets = (
@@ -34,7 +36,8 @@ class ProfileAdmin(admin.ModelAdmin):
             'fields': ('resume_summary', 'languages_spoken')
         }),
         (_('Métadonnées'), {
-            'fields': ('age', 'years_of_experience', 'created_at', 'updated_at'),
+            'fields': ('age', 'years_of_experience', 'projects_total', 'certifications_total',
+                       'skills_total', 'created_at', 'updated_at'),
             'classes': ('collapse',)
         }),
     )
@@ -156,6 +159,7 @@ class BlogCategoryAdmin(admin.ModelAdmin):
 @admin.register(BlogPost)
 class BlogPostAdmin(admin.ModelAdmin):
     list_display = ('title', 'category', 'author', 'is_published', 'is_featured', 'views_count', 'published_at')
+    list_select_related = ('category', 'author')
     list_filter = ('category', 'is_published', 'is_featured', 'created_at', 'published_at')
     search_fields = ('title', 'content', 'tags')
     prepopulated_fields = {'slug': ('title',)}
@@ -166,10 +170,11 @@ class BlogPostAdmin(admin.ModelAdmin):
 
 @admin.register(Testimonial)
 class TestimonialAdmin(admin.ModelAdmin):
-    list_display = ('display_name', 'company', 'rating', 'is_featured', 'is_approved', 'is_anonymous', 'created_at')
+    list_display = ('display_name', 'company', 'project_related', 'rating', 'is_featured', 'is_approved', 'is_anonymous', 'created_at')
+    list_select_related = ('project_related',)
     list_filter = ('rating', 'is_featured', 'is_approved', 'is_anonymous', 'created_at')
     search_fields = ('name', 'company', 'content')
-    readonly_fields = ('ip_address', 'user_agent', 'created_at')
+    readonly_fields = ('ip_address', 'user_agent', 'created_at', 'photo_original_bytes', 'photo_stored_bytes')
     list_editable = ('is_featured', 'is_approved')
     ordering = ['-created_at']
     
@@ -235,17 +240,35 @@ class VisitorStatsAdmin(admin.ModelAdmin):
 class SiteCustomizationAdmin(admin.ModelAdmin):
     list_display = ('color_scheme', 'layout_style', 'font_family', 'is_active', 'updated_at')
     list_filter = ('color_scheme', 'layout_style', 'font_family', 'is_active')
-    readonly_fields = ('created_at', 'updated_at')
+    readonly_fields = ('created_at', 'updated_at', 'logo_image_original_bytes', 'logo_image_stored_bytes')
     list_editable = ('is_active',)
     ordering = ['-updated_at']
 
 @admin.register(SiteSettings)
 class SiteSettingsAdmin(admin.ModelAdmin):
     list_display = ('site_title', 'maintenance_mode', 'allow_testimonials', 'moderate_testimonials')
+    readonly_fields = ('rate_limit_counters',)
     
     def has_add_permission(self, request):
         return not SiteSettings.objects.exists()
     
+    def rate_limit_counters(self, obj):
+        # Compteurs du cache : avec un cache local ils ne couvrent que le processus de l'admin
+        scopes = list(CONFIGURABLE_LIMITS)
+        header = format_html_join('', '<th>{}</th>', ((scope,) for scope in scopes))
+        rows = format_html_join('', '<tr><td>{}</td>{}</tr>', (
+            (day.strftime('%d/%m/%Y'), format_html_join('', '<td>{} / <strong>{}</strong></td>', (
+                counters[scope] for scope in scopes
+            )))
+            for day, counters in get_counters(scopes)
+        ))
+        return format_html(
+            '<table><thead><tr><th>{}</th>{}</tr></thead><tbody>{}</tbody></table>'
+            '<p class="help">{}</p>',
+            _('Jour'), header, rows, _('Requêtes acceptées / bloquées (429) par adresse IP et par portée'),
+        )
+    rate_limit_counters.short_description = _('Limitation de débit')
+    
     def has_delete_permission(self, request, obj=None):
         return False
 
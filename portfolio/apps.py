@@ -3,4 +3,7 @@ from django.apps import AppConfig
 class PortfolioConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'portfolio'
-    verbose_name = 'Portfolio'
\ No newline at end of file
+    verbose_name = 'Portfolio'
+
+    def ready(self):
+        from . import ratelimit, signals  # noqa: F401
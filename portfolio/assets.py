@@ -0,0 +1,181 @@
+"""Regroupement, minification et précompression des fichiers statiques du site"""
+import gzip
+import re
+
+import brotli
+from django.conf import settings
+
+# Fichier regroupé -> fichiers sources, dans l'ordre de chargement
+ASSET_BUNDLES = getattr(settings, 'ASSET_BUNDLES', {
+    'css/site.css': [
+        'css/style.css',
+        'css/animations.css',
+        'css/components.css',
+        'css/responsive-improvements.css',
+    ],
+    'js/site.js': [
+        'js/main.js',
+        'js/enhanced-features.js',
+    ],
+})
+
+# Extensions dont on écrit des variantes .gz et .br à côté du fichier haché
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.json', '.svg', '.txt', '.xml', '.html', '.map')
+
+# Chaînes (conservées telles quelles), puis ce qui peut être réduit autour
+_CSS_STRING = r'"(?:\\.|[^"\\])*"' + '|' + r"'(?:\\.|[^'\\])*'"
+_CSS_COMMENTS = re.compile(rf'({_CSS_STRING})|/\*.*?\*/', re.S)
+# Le `;` précédant une `}` est superflu
+_CSS_TOKENS = re.compile(rf'({_CSS_STRING})|\s*(?:;\s*(?=\}}))?([{{}};,>])\s*|(:)\s+|(\s+)')
+# Indentation, espaces de fin de ligne et lignes vides du code (hors chaînes)
+_JS_LINE_BREAK = re.compile(r'[ \t]*\n\s*')
+# Après ces mots ou ces caractères, `/` ouvre une expression régulière et non une division
+_JS_REGEX_KEYWORDS = frozenset({
+    'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw', 'case', 'do', 'else',
+    'yield', 'await',
+})
+_JS_REGEX_AFTER = frozenset('(,=:[!&|?{};+-*%<>~^')
+
+
+def _css_token(match):
+    string, punctuation, colon, space = match.groups()
+    return string or punctuation or colon or ' '
+
+
+def minify_css(source):
+    source = _CSS_COMMENTS.sub(lambda match: match.group(1) or '', source)
+    return _CSS_TOKENS.sub(_css_token, source).strip()
+
+
+def _skip_js_string(source, index, quote):
+    """Position qui suit la chaîne ou le gabarit ouvert en index"""
+    index += 1
+    while index < len(source):
+        char = source[index]
+        if char == '\\':
+            index += 2
+            continue
+        if char == quote or (char == '\n' and quote != '`'):
+            return index + 1
+        if quote == '`' and source.startswith('${', index):
+            index = _skip_js_expression(source, index + 2)
+            continue
+        index += 1
+    return index
+
+
+def _skip_js_expression(source, index):
+    """Position qui suit l'expression ${...} d'un gabarit, accolades et chaînes imbriquées comprises"""
+    depth = 1
+    while index < len(source) and depth:
+        char = source[index]
+        if char in '\'"`':
+            index = _skip_js_string(source, index, char)
+            continue
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+        index += 1
+    return index
+
+
+def _skip_js_regex(source, index):
+    """Position qui suit l'expression régulière ouverte en index, drapeaux compris"""
+    index += 1
+    in_class = False
+    while index < len(source):
+        char = source[index]
+        if char == '\\':
+            index += 2
+            continue
+        if char == '\n':
+            return index
+        if char == '[':
+            in_class = True
+        elif char == ']':
+            in_class = False
+        elif char == '/' and not in_class:
+            index += 1
+            while index < len(source) and (source[index].isalnum() or source[index] in '_$'):
+                index += 1
+            return index
+        index += 1
+    return index
+
+
+def _js_tokens(source):
+    """
+    Découpe source en (littéral, texte) : chaînes, gabarits et expressions
+    régulières sont des littéraux ; les commentaires deviennent une espace, ou
+    un retour à la ligne s'ils en contenaient un.
+    """
+    index, code, last = 0, [], ''
+    while index < len(source):
+        char = source[index]
+        if char in '\'"`' or (char == '/' and not source.startswith(('//', '/*'), index)
+                               and (not last or last in _JS_REGEX_AFTER or last in _JS_REGEX_KEYWORDS)):
+            end = _skip_js_regex(source, index) if char == '/' else _skip_js_string(source, index, char)
+            if code:
+                yield False, ''.join(code)
+                code = []
+            yield True, source[index:end]
+            index, last = end, '"'
+        elif source.startswith('//', index):
+            end = source.find('\n', index)
+            index = len(source) if end == -1 else end
+        elif source.startswith('/*', index):
+            end = source.find('*/', index + 2)
+            end = len(source) if end == -1 else end + 2
+            code.append('\n' if '\n' in source[index:end] else ' ')
+            index = end
+        elif char.isalnum() or char in '_$':
+            end = index + 1
+            while end < len(source) and (source[end].isalnum() or source[end] in '_$'):
+                end += 1
+            last = source[index:end]
+            code.append(last)
+            index = end
+        else:
+            if not char.isspace():
+                last = char
+            code.append(char)
+            index += 1
+    if code:
+        yield False, ''.join(code)
+
+
+def minify_js(source):
+    """
+    Minification prudente : commentaires, indentation et lignes vides sont
+    retirés du code, jamais des chaînes ni des gabarits. Les retours à la ligne
+    sont conservés pour ne jamais changer l'insertion automatique des
+    points-virgules.
+    """
+    return ''.join(
+        text if literal else _JS_LINE_BREAK.sub('\n', text) for literal, text in _js_tokens(source)
+    ).strip()
+
+
+def minify(name, source):
+    if name.endswith('.css'):
+        return minify_css(source)
+    if name.endswith('.js'):
+        return minify_js(source)
+    return source
+
+
+def build_bundle(name, sources):
+    """Concatène des sources déjà minifiées (le `;` isole les fichiers JS entre eux)"""
+    separator = '\n;\n' if name.endswith('.js') else '\n'
+    return separator.join(sources)
+
+
+def precompress(data):
+    """Variantes compressées qui valent la peine d'être servies : {'.gz': octets, '.br': octets}"""
+    variants = {
+        # mtime=0 : sortie déterministe, collectstatic ne réécrit rien si le contenu n'a pas changé
+        '.gz': gzip.compress(data, compresslevel=9, mtime=0),
+        '.br': brotli.compress(data, quality=11),
+    }
+    return {suffix: compressed for suffix, compressed in variants.items() if len(compressed) < len(data)}
@@ -0,0 +1 @@
+"""Suite de benchmarks des vues publiques et des API (voir la commande run_benchmarks)"""
@@ -0,0 +1,27 @@
+"""Jeu de données des commandes de mesure : généré par generate_load_data, jamais conservé"""
+from contextlib import contextmanager
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import transaction
+
+
+@contextmanager
+def rolled_back():
+    """Transaction toujours annulée : les lignes générées et écrites pendant la mesure disparaissent"""
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
+
+
+def generate_dataset(scale, seed=42, stdout=None, **volumes):
+    """
+    Remplit la base avec generate_load_data ; volumes fixe le nombre de lignes
+    d'un modèle (ex. VisitorStats=0). Les lignes déjà générées avec la même
+    graine sont remplacées : à appeler dans rolled_back().
+    """
+    call_command(
+        'generate_load_data', scale=scale, seed=seed, clear=True,
+        volume=[f'{model}={count}' for model, count in volumes.items()],
+        stdout=stdout or StringIO(),
+    )
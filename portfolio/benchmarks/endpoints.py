@@ -0,0 +1,103 @@
+"""Routes de portfolio/urls.py mesurées par run_benchmarks et manière de les appeler"""
+from django.urls import URLPattern, reverse
+
+from ..models import BlogPost, FAQ, Project, Resource
+
+
+def _first(queryset, field):
+    return queryset.order_by('pk').values_list(field, flat=True).first()
+
+
+def _kwargs(**values):
+    # Aucune ligne utilisable dans le jeu de données : la route est ignorée
+    return None if None in values.values() else values
+
+
+def _thumbnail_kwargs():
+    image = _first(Project.objects.exclude(image=''), 'image')
+    return _kwargs(spec='400x300-crop', path=image)
+
+
+def _contact(index):
+    return {
+        'name': f'Benchmark {index}', 'email': f'benchmark-{index}@example.com',
+        'subject': 'Benchmark', 'message': 'Message de mesure de performance',
+    }
+
+
+# Routes qui ne sont pas de simples GET anonymes sans paramètre :
+# - kwargs : appelée une fois le jeu de données créé, None pour ignorer la route
+# - data : numéro de requête -> corps envoyé, pour que chaque POST soit distinct
+# - login : requête faite par un superutilisateur
+ENDPOINT_OPTIONS = {
+    'universal_search': {'query': {'q': 'django'}},
+    'project_detail': {'kwargs': lambda: _kwargs(pk=_first(Project.objects.all(), 'pk'))},
+    'blog_detail': {'kwargs': lambda: _kwargs(slug=_first(BlogPost.objects.filter(is_published=True), 'slug'))},
+    'resource_download': {
+        'kwargs': lambda: _kwargs(resource_id=_first(Resource.objects.filter(is_public=True).exclude(file=''), 'pk')),
+    },
+    'download_cv_type': {'kwargs': lambda: {'cv_type': 'main'}},
+    'thumbnail': {'kwargs': _thumbnail_kwargs},
+    'admin_dashboard': {'login': True},
+    'admin_customization': {'login': True},
+    'advanced_analytics': {'login': True},
+    'contact_api': {'method': 'post', 'json': True, 'data': _contact},
+    'newsletter_api': {'method': 'post', 'json': True, 'data': lambda index: {'email': f'benchmark-{index}@example.com'}},
+    'newsletter_subscribe_api': {
+        'method': 'post', 'json': True, 'data': lambda index: {'email': f'benchmark-subscribe-{index}@example.com'},
+    },
+    'search_suggestions_api': {'query': {'q': 'dja'}},
+    'faq_helpful_api': {'method': 'post', 'kwargs': lambda: _kwargs(faq_id=_first(FAQ.objects.all(), 'pk'))},
+    'customization_preview_api': {
+        # Une couleur différente à chaque fois : la compilation est mesurée, pas le cache d'aperçus
+        'method': 'post', 'login': True, 'data': lambda index: {'primary_color': f'#{index % 0xffffff:06x}'},
+    },
+}
+
+
+class Endpoint:
+    """Une route nommée et la requête qui la sollicite"""
+
+    def __init__(self, name, options):
+        self.name = name
+        self.method = options.get('method', 'get')
+        self.login = options.get('login', False)
+        self.json = options.get('json', False)
+        self.query = options.get('query')
+        self.data = options.get('data')
+        self.kwargs = options.get('kwargs')
+        self.url = None
+
+    def prepare(self):
+        """Résout l'URL sur le jeu de données ; False si la route ne peut pas être mesurée"""
+        kwargs = self.kwargs() if self.kwargs else {}
+        if kwargs is None:
+            return False
+        self.url = reverse(self.name, kwargs=kwargs)
+        return True
+
+    def call(self, client, index):
+        # Une adresse par requête : les limites de débit ne faussent pas la mesure
+        extra = {'REMOTE_ADDR': f'10.{(index >> 16) & 255}.{(index >> 8) & 255}.{index & 255}'}
+        if self.method == 'get':
+            response = client.get(self.url, self.query, **extra)
+        else:
+            data = self.data(index) if self.data else {}
+            if self.json:
+                response = client.post(self.url, data, content_type='application/json', **extra)
+            else:
+                response = client.post(self.url, data, **extra)
+        if response.streaming:
+            # Un téléchargement n'est servi qu'une fois son contenu entièrement lu
+            b''.join(response.streaming_content)
+            response.close()
+        return response
+
+
+def discover_endpoints(urlconf_module, namespace):
+    """Toutes les routes nommées de l'URLconf, y compris celles ajoutées après ce module"""
+    endpoints = []
+    for pattern in urlconf_module.urlpatterns:
+        if isinstance(pattern, URLPattern) and pattern.name:
+            endpoints.append(Endpoint(f'{namespace}:{pattern.name}', ENDPOINT_OPTIONS.get(pattern.name, {})))
+    return endpoints
@@ -0,0 +1,240 @@
+"""Charge HTTP réelle : un mélange de trafic pondéré rejoué par des clients concurrents"""
+import http.client
+import json
+import random
+import socket
+import threading
+import time
+from collections import Counter, defaultdict
+from http.cookies import SimpleCookie
+from urllib.parse import quote
+
+from django.urls import reverse
+
+from ..models import BlogPost, Project
+from .runner import latency_summary
+
+
+class Scenario:
+    """Un type de requête du mélange de trafic et son poids relatif"""
+
+    def __init__(self, name, weight, build, records_visit=False, requires=None):
+        self.name = name
+        self.weight = weight
+        self.build = build
+        # Vue qui enregistre une VisitorStats : sert à compter les écritures perdues
+        self.records_visit = records_visit
+        self.requires = requires
+
+
+def _page(url_name):
+    return lambda rng, sample: ('GET', sample['urls'][url_name], None)
+
+
+def _blog_detail(rng, sample):
+    return 'GET', reverse('portfolio:blog_detail', kwargs={'slug': rng.choice(sample['blog_slugs'])}), None
+
+
+def _search(rng, sample):
+    return 'GET', f"{sample['urls']['portfolio:universal_search']}?q={quote(rng.choice(sample['terms']))}", None
+
+
+def _typeahead(rng, sample):
+    # Saisie en cours : un préfixe du terme, à partir de deux caractères
+    term = rng.choice(sample['terms']).lower()
+    prefix = term[:rng.randint(2, max(len(term), 2))]
+    return 'GET', f"{sample['urls']['portfolio:search_suggestions_api']}?q={quote(prefix)}", None
+
+
+def _contact(rng, sample):
+    return 'POST', sample['urls']['portfolio:contact_api'], {
+        'name': 'Load test', 'email': f'load-{rng.getrandbits(32):08x}@example.com',
+        'subject': 'Test de charge', 'message': 'Message envoyé par le test de charge',
+    }
+
+
+TRAFFIC_MIX = [
+    Scenario('home', 25, _page('portfolio:home'), records_visit=True),
+    Scenario('blog_list', 15, _page('portfolio:blog'), records_visit=True),
+    Scenario('blog_detail', 20, _blog_detail, records_visit=True, requires='blog_slugs'),
+    Scenario('search', 10, _search, records_visit=True),
+    Scenario('suggestions', 20, _typeahead),
+    Scenario('download_cv', 5, _page('portfolio:download_cv')),
+    Scenario('contact_post', 5, _contact),
+]
+
+
+def load_sample(limit=200):
+    """URLs et valeurs réelles de la base utilisées par les scénarios"""
+    technologies = set()
+    for value in Project.objects.values_list('technologies', flat=True)[:limit]:
+        technologies.update(technology.strip() for technology in value.split(',') if technology.strip())
+    url_names = [
+        'portfolio:home', 'portfolio:blog', 'portfolio:contact', 'portfolio:universal_search',
+        'portfolio:search_suggestions_api', 'portfolio:download_cv', 'portfolio:contact_api',
+    ]
+    return {
+        'urls': {name: reverse(name) for name in url_names},
+        'blog_slugs': list(
+            BlogPost.objects.filter(is_published=True).order_by('-published_at').values_list('slug', flat=True)[:limit]
+        ),
+        'terms': sorted(technologies) or ['django', 'python'],
+    }
+
+
+def loopback_sources(host):
+    """
+    Vrai si chaque utilisateur peut se connecter depuis sa propre adresse 127.x.y.z
+    (Linux route tout 127.0.0.0/8 sur la boucle locale) : le serveur voit alors des
+    clients distincts dans REMOTE_ADDR et les limites par IP s'appliquent à chacun.
+    """
+    if not host.startswith('127.'):
+        return False
+    try:
+        with socket.socket() as sock:
+            sock.bind((source_address(0), 0))
+    except OSError:
+        return False
+    return True
+
+
+def source_address(index):
+    index += 2
+    return f'127.{(index >> 16) & 255}.{(index >> 8) & 255}.{index & 255}'
+
+
+class VirtualUser(threading.Thread):
+    """Client HTTP/1.1 persistant qui rejoue le mélange de trafic jusqu'à l'échéance"""
+
+    def __init__(self, index, host, port, scenarios, sample, seed, timeout, distinct_sources=False):
+        super().__init__(name=f'virtual-user-{index}', daemon=True)
+        self.host, self.port, self.timeout = host, port, timeout
+        self.scenarios = scenarios
+        self.weights = [scenario.weight for scenario in scenarios]
+        self.sample = sample
+        self.rng = random.Random(seed * 100003 + index)
+        # Adresse source propre à l'utilisateur ; sinon tous partagent les limites d'une seule IP
+        self.source = (source_address(index), 0) if distinct_sources else None
+        self.deadline = None
+        self.records = []
+        self.connection = None
+        self.csrf_token = ''
+
+    def prepare(self):
+        """Récupère le cookie CSRF nécessaire aux POST, hors de la période mesurée"""
+        status, headers = self.send('GET', self.sample['urls']['portfolio:contact'], None)
+        cookie = SimpleCookie()
+        for header, value in headers:
+            if header.lower() == 'set-cookie':
+                cookie.load(value)
+        if 'csrftoken' in cookie:
+            self.csrf_token = cookie['csrftoken'].value
+
+    def send(self, method, path, body):
+        headers = {'User-Agent': 'portfolio-load-test'}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body)
+            headers.update({
+                'Content-Type': 'application/json',
+                'X-CSRFToken': self.csrf_token,
+                'Cookie': f'csrftoken={self.csrf_token}',
+            })
+        for attempt in range(2):
+            reused = self.connection is not None
+            if not reused:
+                self.connection = http.client.HTTPConnection(
+                    self.host, self.port, timeout=self.timeout, source_address=self.source
+                )
+            try:
+                self.connection.request(method, path, body=payload, headers=headers)
+                response = self.connection.getresponse()
+                response.read()
+                if response.getheader('Connection', '').lower() == 'close':
+                    self.close()
+                return response.status, response.getheaders()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                # Connexion persistante fermée par le serveur entre deux requêtes : une seule reprise
+                self.close()
+                if not reused or attempt:
+                    raise
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def run(self):
+        try:
+            while time.perf_counter() < self.deadline:
+                scenario = self.rng.choices(self.scenarios, self.weights)[0]
+                method, path, body = scenario.build(self.rng, self.sample)
+                error = None
+                start = time.perf_counter()
+                try:
+                    status, _ = self.send(method, path, body)
+                    if status >= 400:
+                        error = f'HTTP {status}'
+                except socket.timeout:
+                    error = 'timeout'
+                    self.close()
+                except (OSError, http.client.HTTPException):
+                    error = 'connexion'
+                    self.close()
+                self.records.append((scenario, (time.perf_counter() - start) * 1000, error))
+        finally:
+            self.close()
+
+
+def _summary(timings, errors, elapsed=None):
+    count = len(timings)
+    summary = {'requests': count}
+    if elapsed is not None:
+        summary['throughput_rps'] = round(count / elapsed, 1)
+    if count >= 2:
+        summary.update(latency_summary(timings))
+    summary['error_rate'] = round(sum(errors.values()) / count, 4) if count else 0
+    summary['errors'] = dict(errors)
+    return summary
+
+
+def run_level(host, port, concurrency, duration, sample, seed, timeout, scenarios, before_start=None,
+              distinct_sources=False):
+    """Un palier de concurrence : résultats globaux et par scénario"""
+    users = [
+        VirtualUser(index, host, port, scenarios, sample, seed, timeout, distinct_sources)
+        for index in range(concurrency)
+    ]
+    for user in users:
+        user.prepare()
+    if before_start:
+        before_start()
+
+    start = time.perf_counter()
+    for user in users:
+        user.deadline = start + duration
+        user.start()
+    for user in users:
+        user.join()
+    elapsed = time.perf_counter() - start
+
+    timings, errors = [], Counter()
+    by_scenario = defaultdict(lambda: ([], Counter()))
+    visits_expected = 0
+    for user in users:
+        for scenario, latency, error in user.records:
+            timings.append(latency)
+            by_scenario[scenario.name][0].append(latency)
+            if error:
+                errors[error] += 1
+                by_scenario[scenario.name][1][error] += 1
+            elif scenario.records_visit:
+                visits_expected += 1
+
+    result = {'concurrency': concurrency, 'duration_s': round(elapsed, 2), **_summary(timings, errors, elapsed)}
+    result['visits_expected'] = visits_expected
+    result['scenarios'] = {
+        scenario.name: _summary(*by_scenario[scenario.name])
+        for scenario in scenarios if scenario.name in by_scenario
+    }
+    return result
@@ -0,0 +1,97 @@
+"""Mesure d'une route et comparaison avec une référence enregistrée"""
+import gc
+import statistics
+import time
+import tracemalloc
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+class RequestCounter:
+    """Numéro unique de chaque requête envoyée pendant une campagne de mesure"""
+
+    def __init__(self):
+        self.value = 0
+
+    def next(self):
+        self.value += 1
+        return self.value
+
+
+def latency_summary(timings):
+    """Moyenne et percentiles p50/p95/p99 (ms) d'une série d'au moins deux mesures"""
+    percentiles = statistics.quantiles(timings, n=100, method='inclusive')
+    return {
+        'mean_ms': round(statistics.fmean(timings), 3),
+        'p50_ms': round(percentiles[49], 3),
+        'p95_ms': round(percentiles[94], 3),
+        'p99_ms': round(percentiles[98], 3),
+    }
+
+
+def measure(endpoint, client, counter, repeat, warmup, memory_samples):
+    """Latences (p50/p95/p99), requêtes SQL et mémoire allouée pour une route"""
+    statuses = set()
+    for _ in range(warmup):
+        statuses.add(endpoint.call(client, counter.next()).status_code)
+
+    # Boucle de latence sans instrumentation : tracemalloc ralentit fortement l'interpréteur.
+    # Comme timeit, le ramasse-miettes est suspendu : ses pauses dépendent des routes
+    # mesurées avant celle-ci et rendraient le p95 imprévisible d'une campagne à l'autre.
+    timings = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            index = counter.next()
+            start = time.perf_counter()
+            response = endpoint.call(client, index)
+            timings.append((time.perf_counter() - start) * 1000)
+            statuses.add(response.status_code)
+    finally:
+        gc.enable()
+
+    allocations = []
+    query_counts = []
+    tracemalloc.start()
+    try:
+        for _ in range(memory_samples):
+            index = counter.next()
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            with CaptureQueriesContext(connection) as queries:
+                statuses.add(endpoint.call(client, index).status_code)
+            allocations.append(tracemalloc.get_traced_memory()[1] - baseline)
+            query_counts.append(len(queries))
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'url': endpoint.url,
+        'method': endpoint.method.upper(),
+        'status': sorted(statuses),
+        'requests': repeat,
+        **latency_summary(timings),
+        'queries': max(query_counts),
+        'memory_kb': round(statistics.median(allocations) / 1024, 1),
+    }
+
+
+def compare(results, baseline, threshold, min_delta_ms=1.0, min_delta_kb=64):
+    """Régressions de results par rapport à baseline, au-delà de threshold (0.2 = +20 %)"""
+    regressions = []
+    for name, current in results['endpoints'].items():
+        previous = baseline['endpoints'].get(name)
+        if not previous:
+            continue
+        # Les écarts absolus minimaux évitent de signaler le bruit des routes très rapides
+        if (current['p95_ms'] > previous['p95_ms'] * (1 + threshold)
+                and current['p95_ms'] - previous['p95_ms'] >= min_delta_ms):
+            regressions.append(f"{name} : p95 {previous['p95_ms']:.1f}ms -> {current['p95_ms']:.1f}ms")
+        if current['queries'] > previous['queries']:
+            regressions.append(f"{name} : {previous['queries']} -> {current['queries']} requêtes SQL")
+        if (current['memory_kb'] > previous['memory_kb'] * (1 + threshold)
+                and current['memory_kb'] - previous['memory_kb'] >= min_delta_kb):
+            regressions.append(f"{name} : mémoire {previous['memory_kb']:.0f} -> {current['memory_kb']:.0f} Ko")
+    return regressions
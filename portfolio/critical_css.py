@@ -0,0 +1,285 @@
+"""CSS critique : règles utilisées au-dessus de la ligne de flottaison, inlinées dans <head>"""
+import html as html_module
+import os
+import re
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+
+from .assets import ASSET_BUNDLES, minify_css
+
+CRITICAL_CSS_DIR = getattr(settings, 'CRITICAL_CSS_DIR', os.path.join(settings.BASE_DIR, 'critical_css'))
+# Au-delà, le CSS inliné ne tient plus dans la première fenêtre TCP (~14 Ko)
+CRITICAL_CSS_BUDGET = getattr(settings, 'CRITICAL_CSS_BUDGET', 14 * 1024)
+# Nombre maximal d'éléments considérés comme visibles sans défilement
+CRITICAL_FOLD_ELEMENTS = getattr(settings, 'CRITICAL_FOLD_ELEMENTS', 300)
+
+# Pages publiques rendues par extract_critical_css et check_render_budget
+CRITICAL_PAGES = [
+    'portfolio:home', 'portfolio:academic', 'portfolio:experience', 'portfolio:certifications',
+    'portfolio:projects', 'portfolio:contact', 'portfolio:testimonials', 'portfolio:blog',
+    'portfolio:services', 'portfolio:faq', 'portfolio:timeline', 'portfolio:collaborations',
+    'portfolio:resources', 'portfolio:achievements',
+]
+
+ALWAYS_KEPT_SELECTORS = {':root', '*', 'html', 'body'}
+SKIPPED_AT_RULES = ('@font-face', '@import', '@charset', '@page', '@media print')
+
+_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_PSEUDO = re.compile(r'::?[a-zA-Z-]+(\((?:[^()]|\([^()]*\))*\))?')
+_ATTRIBUTE = re.compile(r'\[[^\]]*\]')
+_CLASS = re.compile(r'\.((?:\\.|[\w-])+)')
+_ID = re.compile(r'#((?:\\.|[\w-])+)')
+_TAG = re.compile(r'(?:^|(?<=[\s>+~]))([a-zA-Z][a-zA-Z0-9-]*)')
+_URL = re.compile(r'''url\(\s*(['"]?)([^'")]+)\1\s*\)''')
+_KEYFRAMES = re.compile(r'@(?:-webkit-)?keyframes\s+([\w-]+)')
+_COVERS = re.compile(r'^/\* covers: (.*?) \*/\n')
+_FINGERPRINT = re.compile(r'\.[0-9a-f]{12}(\.\w+)$')
+# Source -> fichier regroupé qui la contient en production (asset_bundle)
+_BUNDLE_OF = {source: bundle for bundle, sources in ASSET_BUNDLES.items() for source in sources}
+
+
+class FoldCollector(HTMLParser):
+    """Balises, classes et identifiants présents avant la fin de la première <section> du <main>"""
+    VOID_ELEMENTS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+
+    def __init__(self, max_elements=CRITICAL_FOLD_ELEMENTS):
+        super().__init__()
+        self.tags, self.classes, self.ids = set(), set(), set()
+        self.stylesheets = []
+        self.max_elements = max_elements
+        self.in_body = False
+        self.in_main = False
+        self.section_depth = None
+        self.depth = 0
+        self.count = 0
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'link' and (attrs.get('rel') == 'stylesheet' or attrs.get('as') == 'style') and attrs.get('href'):
+            if attrs['href'] not in self.stylesheets:
+                self.stylesheets.append(attrs['href'])
+        if tag == 'body':
+            self.in_body = True
+        if not self.in_body or self.done:
+            return
+
+        if tag == 'main':
+            self.in_main = True
+        if tag not in self.VOID_ELEMENTS:
+            self.depth += 1
+        if tag == 'section' and self.in_main and self.section_depth is None:
+            self.section_depth = self.depth
+
+        self.tags.add(tag)
+        self.classes.update((attrs.get('class') or '').split())
+        if attrs.get('id'):
+            self.ids.add(attrs['id'])
+        self.count += 1
+        if self.count >= self.max_elements:
+            self.done = True
+
+    def handle_endtag(self, tag):
+        if not self.in_body or self.done or tag in self.VOID_ELEMENTS:
+            return
+        if tag == 'section' and self.section_depth == self.depth:
+            self.done = True
+        self.depth -= 1
+
+
+def collect_fold(html):
+    collector = FoldCollector()
+    collector.feed(html)
+    return collector
+
+
+def _block_end(css, start):
+    """Index de l'accolade fermante correspondant à celle ouverte en `start`"""
+    depth, index, quote = 0, start, None
+    while index < len(css):
+        char = css[index]
+        if quote:
+            if char == '\\':
+                index += 1
+            elif char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return index
+        index += 1
+    return len(css)
+
+
+def parse_rules(css):
+    """Liste de (prélude, corps) de premier niveau ; les instructions @import/@charset sont ignorées"""
+    rules, index = [], 0
+    while index < len(css):
+        brace = css.find('{', index)
+        semicolon = css.find(';', index)
+        if brace == -1:
+            break
+        if semicolon != -1 and semicolon < brace:
+            index = semicolon + 1
+            continue
+        end = _block_end(css, brace)
+        rules.append((css[index:brace].strip(), css[brace + 1:end]))
+        index = end + 1
+    return rules
+
+
+def selector_used(selector, fold):
+    selector = selector.strip()
+    if selector in ALWAYS_KEPT_SELECTORS:
+        return True
+    bare = _ATTRIBUTE.sub('', _PSEUDO.sub('', selector))
+    classes = {value.replace('\\', '') for value in _CLASS.findall(bare)}
+    ids = set(_ID.findall(bare))
+    tags = {tag.lower() for tag in _TAG.findall(_ID.sub(' ', _CLASS.sub(' ', bare)))}
+    return classes <= fold.classes and ids <= fold.ids and tags <= (fold.tags | {'html', 'body'})
+
+
+def _absolutize(body, base_url):
+    def replace(match):
+        url = match.group(2)
+        if url.startswith(('data:', 'http:', 'https:', '/', '#')):
+            return match.group(0)
+        return f'url("{urljoin(base_url, url)}")'
+    return _URL.sub(replace, body)
+
+
+def _filter_rules(rules, fold, base_url, keyframes):
+    kept = []
+    for prelude, body in rules:
+        if prelude.startswith(SKIPPED_AT_RULES):
+            continue
+        match = _KEYFRAMES.match(prelude)
+        if match:
+            keyframes[match.group(1)] = f'{prelude}{{{body}}}'
+            continue
+        if prelude.startswith('@'):
+            # @media, @supports... : filtrage récursif de leur contenu
+            inner = _filter_rules(parse_rules(body), fold, base_url, keyframes)
+            if inner:
+                kept.append(f'{prelude}{{{"".join(inner)}}}')
+            continue
+        selectors = [selector for selector in prelude.split(',') if selector_used(selector, fold)]
+        if selectors:
+            kept.append(f'{",".join(selectors)}{{{_absolutize(body, base_url)}}}')
+    return kept
+
+
+def extract_critical_css(html, stylesheets):
+    """
+    CSS critique d'une page rendue. `stylesheets` : liste de (URL, contenu CSS)
+    dans l'ordre de la cascade. Les @keyframes ne sont conservées que si une
+    règle retenue les utilise.
+    """
+    fold = collect_fold(html)
+    kept, keyframes = [], {}
+    for url, css in stylesheets:
+        kept.extend(_filter_rules(parse_rules(_COMMENT.sub('', css)), fold, url, keyframes))
+
+    css = ''.join(kept)
+    used_keyframes = [rule for name, rule in keyframes.items() if re.search(rf'\b{re.escape(name)}\b', css)]
+    return minify_css(css + ''.join(used_keyframes))
+
+
+def fetch_asset(url, timeout=10):
+    """Contenu d'une feuille de style ou d'un script : fichier statique local ou URL externe"""
+    if url.startswith(settings.STATIC_URL):
+        name = url[len(settings.STATIC_URL):].split('?')[0]
+        path = finders.find(name)
+        if path:
+            with open(path, 'rb') as handle:
+                return handle.read()
+        with staticfiles_storage.open(name) as handle:
+            return handle.read()
+    if url.startswith('//'):
+        url = 'https:' + url
+    # Certains CDN (Google Fonts) adaptent la réponse au navigateur
+    request = Request(url, headers={'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) Chrome/120.0 Safari/537.36'})
+    with urlopen(request, timeout=timeout) as response:
+        return response.read()
+
+
+def critical_css_path(template_name):
+    return os.path.join(CRITICAL_CSS_DIR, template_name.replace('/', '__') + '.css')
+
+
+def normalize_href(href):
+    """
+    URL sans empreinte, une source de regroupement remplacée par son regroupement :
+    /static/css/site.0123456789ab.css et /static/css/style.css -> /static/css/site.css.
+    L'extraction (sources en DEBUG) et la page de production (regroupement) donnent le même nom.
+    """
+    href = _FINGERPRINT.sub(r'\1', href.split('?')[0])
+    if href.startswith(settings.STATIC_URL):
+        name = href[len(settings.STATIC_URL):]
+        href = settings.STATIC_URL + _BUNDLE_OF.get(name, name)
+    return href
+
+
+def save_critical_css(template_name, css, covered_hrefs):
+    os.makedirs(CRITICAL_CSS_DIR, exist_ok=True)
+    with open(critical_css_path(template_name), 'w', encoding='utf-8') as handle:
+        # Seules les feuilles ayant contribué au CSS critique peuvent être différées
+        covered = sorted({normalize_href(href) for href in covered_hrefs})
+        handle.write(f'/* covers: {" ".join(covered)} */\n{css}')
+
+
+_loaded = {}
+
+
+def load_critical_css(template_name):
+    """(css, feuilles couvertes) pour un template, relu uniquement si le fichier a changé"""
+    path = critical_css_path(template_name)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+
+    cached = _loaded.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, encoding='utf-8') as handle:
+        content = handle.read()
+    match = _COVERS.match(content)
+    covered = set(match.group(1).split()) if match else set()
+    css = content[match.end():] if match else content
+    # Le CSS est inséré dans une balise <style> : « </ » ne doit jamais la refermer
+    result = (css.replace('</', '<\\/'), covered)
+    _loaded[path] = (mtime, result)
+    return result
+
+
+def is_enabled():
+    return getattr(settings, 'CRITICAL_CSS_ENABLED', not settings.DEBUG)
+
+
+_STYLESHEET_LINK = re.compile(r'<link\b[^>]*\brel=["\']stylesheet["\'][^>]*>', re.I)
+_HREF = re.compile(r'\bhref=["\']([^"\']+)["\']', re.I)
+_REL_STYLESHEET = re.compile(r'\brel=["\']stylesheet["\']', re.I)
+
+
+def defer_stylesheets(html, covered_hrefs):
+    """Transforme les <link rel="stylesheet"> couverts en préchargements non bloquants"""
+    def replace(match):
+        tag = match.group(0)
+        href = _HREF.search(tag)
+        if not href or normalize_href(html_module.unescape(href.group(1))) not in covered_hrefs:
+            return tag
+        preload = _REL_STYLESHEET.sub('rel="preload" as="style"', tag)
+        preload = preload[:-1].rstrip('/ ') + ' onload="this.onload=null;this.rel=\'stylesheet\'">'
+        return f'{preload}<noscript>{tag}</noscript>'
+    return _STYLESHEET_LINK.sub(replace, html)
@@ -0,0 +1,41 @@
+"""
+Génération du CV PDF automatique. ReportLab est lourd à importer : ce module
+n'est chargé qu'au premier téléchargement d'un CV généré, jamais au démarrage.
+"""
+import io
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
+
+def build_cv_pdf(profile):
+    """Octets d'un CV d'une page construit à partir du profil"""
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    styles = getSampleStyleSheet()
+    story = []
+
+    # Titre
+    story.append(Paragraph(f"<b>{profile.name}</b>", styles['Title']))
+    story.append(Spacer(1, 12))
+
+    # Sous-titre
+    story.append(Paragraph(profile.title, styles['Heading2']))
+    story.append(Spacer(1, 12))
+
+    # Contact
+    contact_info = f"""
+    <b>Contact:</b><br/>
+    Email: {profile.email}<br/>
+    Téléphone: {profile.phone or 'Non renseigné'}<br/>
+    Localisation: {profile.location or 'Non renseignée'}
+    """
+    story.append(Paragraph(contact_info, styles['Normal']))
+    story.append(Spacer(1, 12))
+
+    # Bio
+    story.append(Paragraph(f"<b>Profil:</b><br/>{profile.bio}", styles['Normal']))
+
+    doc.build(story)
+    return buffer.getvalue()
@@ -0,0 +1,208 @@
+"""Polices et icônes hébergées localement, réduites aux glyphes réellement utilisés"""
+import functools
+import os
+import re
+from io import BytesIO
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.db import models
+
+from .critical_css import parse_rules
+
+VENDOR_DIR = 'vendor'
+FONTS_CSS = f'{VENDOR_DIR}/fonts/fonts.css'
+ICONS_CSS = f'{VENDOR_DIR}/fontawesome/css/all.min.css'
+
+GOOGLE_FONTS_URL = 'https://fonts.googleapis.com/css2?family={families}&display=swap'
+GOOGLE_FONT_WEIGHTS = getattr(settings, 'VENDORED_FONT_WEIGHTS', (400, 600, 700))
+FONT_AWESOME_URL = getattr(
+    settings, 'FONT_AWESOME_URL', 'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css'
+)
+
+# Toujours conservés : ASCII imprimable, espaces insécables, ponctuation typographique française
+BASE_CHARACTERS = (
+    ''.join(chr(code) for code in range(0x20, 0x7F))
+    + '\u00a0\u202f’‘“”«»–—…€•·°×'
+)
+
+# Contenus publiés dont les caractères sont conservés : modèle -> filtre des lignes affichées.
+# Messages, recherches et statistiques de visite (texte saisi par les visiteurs) en sont exclus
+FONT_CONTENT_MODELS = getattr(settings, 'VENDORED_FONT_CONTENT_MODELS', {
+    'Profile': {},
+    'CVDocument': {'is_public': True},
+    'Education': {},
+    'Experience': {},
+    'Skill': {},
+    'Certification': {},
+    'Project': {},
+    'BlogCategory': {'is_active': True},
+    'BlogPost': {'is_published': True},
+    'Testimonial': {'is_approved': True},
+    'Service': {'is_active': True},
+    'Achievement': {},
+    'SiteSettings': {},
+    'Tag': {},
+    'FAQ': {'is_active': True},
+    'Timeline': {},
+    'Collaboration': {'is_active': True},
+    'Resource': {'is_public': True},
+})
+
+_FONT_FACE = re.compile(r'(?:/\*\s*([\w-]+)\s*\*/\s*)?@font-face\s*\{(.*?)\}', re.S)
+_DESCRIPTOR = re.compile(r'([\w-]+)\s*:\s*([^;]+);?')
+_SRC_URL = re.compile(r'url\(([^)]+)\)\s*format\([\'"]?woff2[\'"]?\)')
+_ICON_NAME = re.compile(r'\bfa-([a-z0-9]+(?:-[a-z0-9]+)*)\b')
+_ICON_SELECTOR = re.compile(r'^\.fa-([a-z0-9-]+)(?:::?before)?$')
+_ICON_CODEPOINT = re.compile(r'(?:content|--fa)\s*:\s*["\']\\([0-9a-fA-F]+)["\']')
+_TRUETYPE_SRC = re.compile(r',\s*url\([^)]+\.ttf\)\s*format\(["\']truetype["\']\)')
+_WEBFONT_URL = re.compile(r'url\((\.\./webfonts/[\w.-]+\.woff2)\)')
+
+
+def parse_unicode_range(value):
+    """« U+0000-00FF, U+0131, U+4?? » -> ensemble de points de code"""
+    codepoints = set()
+    for part in value.split(','):
+        part = part.strip().upper().removeprefix('U+')
+        if not part:
+            continue
+        if '?' in part:
+            start, end = int(part.replace('?', '0'), 16), int(part.replace('?', 'F'), 16)
+        elif '-' in part:
+            start, end = (int(bound, 16) for bound in part.split('-'))
+        else:
+            start = end = int(part, 16)
+        codepoints.update(range(start, end + 1))
+    return codepoints
+
+
+def parse_font_faces(css):
+    """Liste de dicts {subset, descripteurs..., url} pour les @font-face woff2 d'une feuille Google Fonts"""
+    faces = []
+    for subset_name, body in _FONT_FACE.findall(css):
+        descriptors = {name.lower(): value.strip() for name, value in _DESCRIPTOR.findall(body)}
+        url = _SRC_URL.search(descriptors.get('src', ''))
+        if url:
+            descriptors['url'] = url.group(1).strip('\'"')
+            descriptors['subset'] = subset_name or 'all'
+            faces.append(descriptors)
+    return faces
+
+
+def subset_font(data, codepoints, flavor='woff2'):
+    """Police réduite aux points de code donnés (None si aucun glyphe n'est concerné)"""
+    # fontTools n'est utile qu'à vendor_fonts : les templates importent ce module (vendored_url)
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    font = TTFont(BytesIO(data))
+    available = set(font.getBestCmap() or {})
+    wanted = available & set(codepoints)
+    if not wanted:
+        return None
+
+    options = subset.Options()
+    options.flavor = flavor
+    options.name_IDs = ['*']
+    options.notdef_outline = True
+    subsetter = subset.Subsetter(options=options)
+    subsetter.populate(unicodes=wanted)
+    subsetter.subset(font)
+
+    output = BytesIO()
+    font.flavor = flavor
+    font.save(output)
+    return output.getvalue()
+
+
+def _text_fields(model):
+    # Adresses et slugs ne sont pas affichés dans la police du site
+    return [
+        field.name for field in model._meta.get_fields()
+        if isinstance(field, (models.CharField, models.TextField)) and not field.choices
+        and not isinstance(field, (models.URLField, models.EmailField, models.SlugField))
+    ]
+
+
+def used_characters(template_dirs=None, locale_dirs=None):
+    """Caractères des templates, des traductions fr/en/ar et du contenu publié en base"""
+    characters = set(BASE_CHARACTERS)
+    template_dirs = template_dirs or [str(path) for path in settings.TEMPLATES[0]['DIRS']]
+    locale_dirs = locale_dirs or [str(path) for path in settings.LOCALE_PATHS]
+    for directory, extensions in [(path, ('.html', '.txt')) for path in template_dirs] + \
+                                 [(path, ('.po',)) for path in locale_dirs]:
+        for root, _, files in os.walk(directory):
+            for filename in files:
+                if filename.endswith(extensions):
+                    with open(os.path.join(root, filename), encoding='utf-8', errors='ignore') as handle:
+                        characters.update(handle.read())
+
+    for model_name, published in FONT_CONTENT_MODELS.items():
+        model = apps.get_model('portfolio', model_name)
+        fields = _text_fields(model)
+        if fields:
+            for row in model.objects.filter(**published).values_list(*fields).iterator():
+                for value in row:
+                    if value:
+                        characters.update(value)
+    return {ord(character) for character in characters if character.isprintable() or character in BASE_CHARACTERS}
+
+
+def used_icons(source_dirs=None):
+    """Noms d'icônes Font Awesome cités dans les templates, le JavaScript et les champs `icon`"""
+    source_dirs = source_dirs or [str(path) for path in settings.TEMPLATES[0]['DIRS']] + \
+        [str(path) for path in settings.STATICFILES_DIRS] + [os.path.dirname(__file__)]
+    names = set()
+    for directory in source_dirs:
+        for root, dirs, files in os.walk(directory):
+            # Ne pas relire la copie locale de Font Awesome : elle cite toutes les icônes
+            dirs[:] = [name for name in dirs if name != VENDOR_DIR]
+            for filename in files:
+                if filename.endswith(('.html', '.js', '.py')):
+                    with open(os.path.join(root, filename), encoding='utf-8', errors='ignore') as handle:
+                        names.update(_ICON_NAME.findall(handle.read()))
+
+    for model in apps.get_app_config('portfolio').get_models():
+        if any(field.name == 'icon' for field in model._meta.get_fields()):
+            for icon in model.objects.values_list('icon', flat=True).iterator():
+                names.update(_ICON_NAME.findall(icon or ''))
+    return names
+
+
+def icon_codepoints(css):
+    """{nom d'icône: point de code} d'après la feuille de style de Font Awesome"""
+    icons = {}
+    for prelude, body in parse_rules(css):
+        codepoint = _ICON_CODEPOINT.search(body)
+        if not codepoint:
+            continue
+        for selector in prelude.split(','):
+            name = _ICON_SELECTOR.match(selector.strip())
+            if name:
+                icons[name.group(1)] = int(codepoint.group(1), 16)
+    return icons
+
+
+def trim_icon_css(css, used):
+    """Supprime les règles des icônes inutilisées et les sources TrueType redondantes"""
+    kept = []
+    for prelude, body in parse_rules(css):
+        names = [_ICON_SELECTOR.match(selector.strip()) for selector in prelude.split(',')]
+        if all(names) and _ICON_CODEPOINT.search(body):
+            selectors = [selector for selector, name in zip(prelude.split(','), names) if name.group(1) in used]
+            if not selectors:
+                continue
+            prelude = ','.join(selectors)
+        kept.append(f'{prelude}{{{body}}}')
+    return _TRUETYPE_SRC.sub('', ''.join(kept))
+
+
+def webfont_urls(css):
+    return sorted(set(_WEBFONT_URL.findall(css)))
+
+
+@functools.lru_cache(maxsize=None)
+def vendored_url(name):
+    """Chemin statique du fichier local s'il a été généré par vendor_fonts, sinon None"""
+    return name if finders.find(name) else None
@@ -2,6 +2,40 @@ from django import forms
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import EmailValidator
 from .models import Contact, Testimonial, SiteCustomization
+from .uploads import UPLOAD_IMAGE_MAX_BYTES
+
+
+class NormalizedImageFormMixin:
+    """
+    Refuse les fichiers trop lourds puis marque les images téléversées pour
+    normalisation en arrière-plan (voir portfolio/uploads.py).
+    """
+    normalized_image_fields = ()
+
+    def clean(self):
+        cleaned_data = super().clean()
+        for field_name in self.normalized_image_fields:
+            upload = cleaned_data.get(field_name)
+            if upload and field_name in self.changed_data and upload.size > UPLOAD_IMAGE_MAX_BYTES:
+                self.add_error(field_name, _("L'image ne doit pas dépasser %(size)d Mo") % {
+                    'size': UPLOAD_IMAGE_MAX_BYTES // (1024 * 1024)
+                })
+        return cleaned_data
+
+    def save(self, commit=True):
+        instance = super().save(commit=False)
+        # Lu par le signal post_save qui planifie la normalisation
+        instance._normalize_image_fields = [
+            field_name for field_name in self.normalized_image_fields
+            if field_name in self.changed_data and getattr(instance, field_name)
+        ]
+        if commit:
+            instance.save()
+            self._save_m2m()
+        else:
+            self.save_m2m = self._save_m2m
+        return instance
+
 
 class ContactForm(forms.ModelForm):
     class Meta:
@@ -66,7 +100,9 @@ class ContactForm(forms.ModelForm):
             if not field.widget.attrs.get('class'):
                 field.widget.attrs.update({'class': 'form-control'})
 
-class TestimonialForm(forms.ModelForm):
+class TestimonialForm(NormalizedImageFormMixin, forms.ModelForm):
+    normalized_image_fields = ('photo',)
+
     class Meta:
         model = Testimonial
         fields = ['name', 'email', 'company', 'position', 'location', 'website', 'phone', 
@@ -132,7 +168,9 @@ class TestimonialForm(forms.ModelForm):
             "Cochez cette case si vous souhaitez rester anonyme"
         )
 
-class SiteCustomizationForm(forms.ModelForm):
+class SiteCustomizationForm(NormalizedImageFormMixin, forms.ModelForm):
+    normalized_image_fields = ('logo_image',)
+
     class Meta:
         model = SiteCustomization
         fields = [
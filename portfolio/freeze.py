@@ -0,0 +1,440 @@
+"""Export statique du site public : pages rendues par les vraies vues, liens réécrits, reconstruction incrémentale"""
+import hashlib
+import html
+import json
+import mimetypes
+import os
+import re
+import shutil
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path, PurePosixPath
+from urllib.parse import parse_qsl, unquote, urlencode, urljoin, urlsplit
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import ManifestFilesMixin, staticfiles_storage
+from django.core.files.storage import default_storage
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import Resolver404, resolve, reverse, translate_url
+from django.utils import translation
+from django.utils.text import slugify
+
+MANIFEST_NAME = '.freeze-manifest.json'
+
+# Routes jamais exportées : recherche, formulaires envoyés, administration
+EXCLUDED_ROUTES = {
+    'universal_search', 'advanced_analytics', 'admin_dashboard', 'admin_customization',
+    'contact_success', 'testimonial_success', 'set_language',
+}
+# Réponses qui ne sont pas des pages : enregistrées sous un nom haché
+ASSET_ROUTES = {'thumbnail', 'download_cv', 'download_cv_type', 'resource_download'}
+# Documents publiés à une adresse fixe
+DOCUMENT_ROUTES = {'sitemap_index', 'django.contrib.sitemaps.views.sitemap', 'service_worker'}
+# Paramètres d'URL traduits en segments de chemin ; un lien avec d'autres paramètres n'est pas suivi
+PATH_PARAMS = ('tag', 'page')
+# Compteurs modifiés à chaque consultation : ils ne rendent pas une page obsolète
+IGNORED_FIELDS = frozenset({'views_count', 'helpful_votes', 'download_count'})
+# Un hébergement statique ne négocie pas le format des vignettes : WebP, lu par tous les navigateurs récents
+ASSET_ACCEPT = 'image/webp,image/*,*/*;q=0.8'
+
+URL_ATTRIBUTE_RE = re.compile(r'''(\b(?:href|src|poster|content)=)(["'])(.*?)\2''', re.IGNORECASE | re.DOTALL)
+SRCSET_RE = re.compile(r'''(\bsrcset=)(["'])(.*?)\2''', re.IGNORECASE | re.DOTALL)
+CSS_URL_RE = re.compile(r'''url\((["']?)([^'")]+)\1\)''')
+TABLE_RE = re.compile(r'''\b(?:FROM|JOIN)\s+["`]?(\w+)["`]?''', re.IGNORECASE)
+HASHED_NAME_RE = re.compile(r'\.[0-9a-f]{12}$')
+# Sélecteur de langue : formulaires POST vers set_language, sans serveur pour les recevoir
+FORM_RE = re.compile(r'''<form\b[^>]*\baction=(["'])(.*?)\1[^>]*>(.*?)</form>''', re.IGNORECASE | re.DOTALL)
+LANGUAGE_INPUT_RE = re.compile(r'''<input\b[^>]*\bname=["']language["'][^>]*\bvalue=["']([^"']*)["']''', re.IGNORECASE)
+BUTTON_RE = re.compile(r'''<button\b[^>]*\bclass=(["'])(.*?)\1[^>]*>(.*?)</button>''', re.IGNORECASE | re.DOTALL)
+# Jeton CSRF : aléatoire à chaque rendu, il rendrait chaque export différent du précédent
+CSRF_INPUT_RE = re.compile(r'''\s*<input\b[^>]*\bname=["']csrfmiddlewaretoken["'][^>]*>''', re.IGNORECASE)
+
+
+def fingerprint(name, content):
+    """'css/site.css' -> 'css/site.3f2a9c0d1b7e.css' ; un nom déjà haché est conservé"""
+    path = PurePosixPath(name)
+    if HASHED_NAME_RE.search(path.stem):
+        return name
+    digest = hashlib.md5(content).hexdigest()[:12]
+    return str(path.with_name(f'{path.stem}.{digest}{path.suffix}'))
+
+
+def _path_segment(value):
+    slug = slugify(value)
+    if slug == value:
+        return value
+    # Deux valeurs réduites au même slug ne doivent pas partager un fichier
+    return f"{slug or 'x'}-{hashlib.md5(value.encode()).hexdigest()[:6]}"
+
+
+def page_url(path, query):
+    """'/blog/', {'tag': 'C++', 'page': '2'} -> '/blog/tag/c-1b2d3e/page/2/'"""
+    segments = [segment for segment in path.strip('/').split('/') if segment]
+    for param in PATH_PARAMS:
+        value = query.get(param)
+        if value and not (param == 'page' and value == '1'):
+            segments += [param, _path_segment(value)]
+    return '/' + ''.join(f'{segment}/' for segment in segments)
+
+
+def request_url(path, query):
+    return path + ('?' + urlencode(sorted(query.items())) if query else '')
+
+
+class Freezer:
+    """Parcourt le site depuis ses sitemaps et écrit chaque page, document et fichier lié"""
+
+    def __init__(self, output, origin, workers=4, incremental=False):
+        self.output = Path(output)
+        self.origin = origin.rstrip('/')
+        parts = urlsplit(self.origin)
+        self.host, self.secure = parts.netloc, parts.scheme == 'https'
+        self.workers = workers
+        self.incremental = incremental
+        # Toujours lu : les fichiers de l'export précédent qui ne sont plus produits sont supprimés
+        self.previous = self.load_manifest()
+        self.models_by_table = {
+            model._meta.db_table: model for model in apps.get_models(include_auto_created=True)
+        }
+        self.signatures = {}
+        self.media = {}
+        # Fichiers liés dont la vue n'a pas répondu 200 : adresse -> code HTTP
+        self.failed = {}
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    # Parcours
+
+    def run(self, seeds):
+        pages = {}
+        seen = set(seeds)
+        with ThreadPoolExecutor(self.workers) as pool:
+            pending = {pool.submit(self.freeze, url): url for url in seeds}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = pending.pop(future)
+                    pages[url] = entry = future.result()
+                    for link in entry.get('links', ()):
+                        if link not in seen:
+                            seen.add(link)
+                            pending[pool.submit(self.freeze, link)] = link
+        return pages
+
+    def freeze(self, url):
+        previous = self.previous['pages'].get(url)
+        if self.incremental and previous and self.is_fresh(previous):
+            return dict(previous, skipped=True)
+
+        entry = {'links': [], 'assets': []}
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, secure=self.secure)
+            entry['status'] = response.status_code
+            if response.status_code in (301, 302) and response.get('Location'):
+                # La cible de la redirection est exportée à la place de l'adresse demandée
+                self.link(response['Location'], url, entry)
+            elif response.status_code == 200:
+                self.write_response(url, response, entry)
+        entry['tables'] = sorted({table for query in queries for table in TABLE_RE.findall(query['sql'])})
+        for table in entry['tables']:
+            self.signature(table)
+        return entry
+
+    @property
+    def client(self):
+        # Un client par thread : chaque rendu passe par les middlewares et l'URLconf
+        if not hasattr(self.local, 'client'):
+            self.local.client = Client(raise_request_exception=False, HTTP_HOST=self.host)
+        return self.local.client
+
+    def write_response(self, url, response, entry):
+        path, query = self.split(url)
+        kind = self.classify(path)
+        content = response.content
+        content_type = response.get('Content-Type', '')
+        if kind == 'document':
+            name = path.lstrip('/')
+            if query.get('p', '1') != '1':
+                stem, suffix = os.path.splitext(name)
+                name = f"{stem}-{query['p']}{suffix}"
+            if 'xml' in content_type:
+                content = self.rewrite_sitemap(content, entry)
+        else:
+            name = page_url(path, query).lstrip('/') + 'index.html'
+            if 'text/html' in content_type:
+                content = self.rewrite_html(content.decode(response.charset or 'utf-8'), url, entry).encode('utf-8')
+        entry['file'] = name
+        self.write(name, content)
+
+    # Réécriture des liens
+
+    def rewrite_html(self, text, base, entry):
+        def attribute(match):
+            # content= n'est une adresse que dans les balises meta og:image, twitter:image...
+            if match.group(1).lower().startswith('content') and not match.group(3).startswith(('/', 'http')):
+                return match.group(0)
+            return match.group(1) + match.group(2) + self.rewrite(match.group(3), base, entry) + match.group(2)
+
+        def srcset(match):
+            candidates = []
+            for candidate in match.group(3).split(','):
+                url, _, descriptor = candidate.strip().partition(' ')
+                candidates.append(' '.join(filter(None, [self.rewrite(url, base, entry), descriptor.strip()])))
+            return match.group(1) + match.group(2) + ', '.join(candidates) + match.group(2)
+
+        def css_url(match):
+            return f'url({match.group(1)}{self.rewrite(match.group(2), base, entry)}{match.group(1)})'
+
+        text = self.rewrite_language_switcher(text, base)
+        text = CSRF_INPUT_RE.sub('', text)
+        text = URL_ATTRIBUTE_RE.sub(attribute, text)
+        text = SRCSET_RE.sub(srcset, text)
+        return CSS_URL_RE.sub(css_url, text)
+
+    def rewrite_language_switcher(self, text, base):
+        """Chaque formulaire vers set_language devient un lien vers la même page dans l'autre langue"""
+        action = reverse('set_language')
+        source = translation.get_language_from_path(urlsplit(base).path) or settings.LANGUAGE_CODE
+
+        def form(match):
+            language = LANGUAGE_INPUT_RE.search(match.group(3))
+            button = BUTTON_RE.search(match.group(3))
+            if html.unescape(match.group(2)) != action or not language or not button:
+                return match.group(0)
+            # translate_url ne résout l'adresse que dans la langue qu'elle porte
+            with translation.override(source):
+                target = translate_url(base, language.group(1))
+            return f'<a href="{html.escape(target)}" class="{button.group(2)}">{button.group(3)}</a>'
+
+        return FORM_RE.sub(form, text)
+
+    def rewrite_sitemap(self, content, entry):
+        # Les sitemaps donnent les adresses de départ ; ?p=N devient sitemap-<section>-N.xml
+        def loc(match):
+            url = html.unescape(match.group(1).decode())
+            path, query = self.split(url)
+            kind = self.classify(path) if url.startswith(self.origin + '/') else None
+            if kind:
+                entry['links'].append(request_url(path, query))
+            if kind == 'document' and query.get('p', '1') != '1':
+                stem, suffix = os.path.splitext(path)
+                url = f"{self.origin}{stem}-{query['p']}{suffix}"
+            return b'<loc>' + html.escape(url).encode() + b'</loc>'
+        return re.sub(rb'<loc>(.*?)</loc>', loc, content)
+
+    def rewrite(self, raw, base, entry):
+        """Adresse de l'export pour un lien interne ; les autres liens sont inchangés"""
+        new = self.link(html.unescape(raw.strip()), base, entry)
+        return html.escape(new) if new else raw
+
+    def link(self, url, base, entry):
+        """Adresse exportée d'un lien interne (None s'il reste inchangé) ; les pages liées sont à suivre"""
+        if not url or url.startswith(('#', 'mailto:', 'tel:', 'javascript:', 'data:')):
+            return None
+        parts = urlsplit(urljoin(self.origin + base, url))
+        if f'{parts.scheme}://{parts.netloc}' != self.origin:
+            return None
+        absolute = url.startswith(('http://', 'https://', '//'))
+        fragment = f'#{parts.fragment}' if parts.fragment else ''
+        path, query = parts.path, dict(parse_qsl(parts.query))
+
+        if path.startswith(settings.MEDIA_URL):
+            target = self.media_file(unquote(path[len(settings.MEDIA_URL):]))
+            if target:
+                entry['assets'].append(target)
+        elif path.startswith(settings.STATIC_URL):
+            # Arborescence statique copiée telle quelle : noms déjà hachés par ManifestStaticFilesStorage
+            return None
+        else:
+            kind = self.classify(path)
+            if kind == 'asset':
+                target = self.fetched_asset(request_url(path, query))
+                if target:
+                    entry['assets'].append(target)
+            elif kind == 'document':
+                entry['links'].append(request_url(path, query))
+                target = path
+            elif kind == 'page':
+                if 'cursor' in query:
+                    # « Voir plus » de la liste : même contenu que la page numérotée suivante,
+                    # dont la pagination complète prend le relais dans l'export
+                    base_path, base_query = self.split(base)
+                    if base_path != path:
+                        return None
+                    query = {**base_query, 'page': str(int(base_query.get('page', 1)) + 1)}
+                if set(query) - set(PATH_PARAMS):
+                    return None
+                entry['links'].append(request_url(path, query))
+                target = page_url(path, query)
+            else:
+                return None
+        if not target:
+            return None
+        return (self.origin if absolute else '') + target + fragment
+
+    def classify(self, path):
+        """'page', 'asset', 'document' ou None pour une route non exportée"""
+        language = translation.get_language_from_path(path) or settings.LANGUAGE_CODE
+        try:
+            # i18n_patterns ne reconnaît que le préfixe de la langue active
+            with translation.override(language):
+                match = resolve(path)
+        except Resolver404:
+            return None
+        name = match.url_name
+        if name in DOCUMENT_ROUTES:
+            return 'document'
+        if 'admin' in match.namespaces or name in EXCLUDED_ROUTES or not name or name.endswith('_api'):
+            return None
+        return 'asset' if name in ASSET_ROUTES else 'page'
+
+    def split(self, url):
+        parts = urlsplit(url)
+        return parts.path, dict(parse_qsl(parts.query))
+
+    # Fichiers liés
+
+    def media_file(self, name):
+        """Copie d'un fichier média sous un nom haché, mis en cache sans limite par le CDN"""
+        with self.lock:
+            if name in self.media:
+                return self.media[name]
+        target = None
+        if name and default_storage.exists(name):
+            with default_storage.open(name, 'rb') as handle:
+                content = handle.read()
+            target = settings.MEDIA_URL + fingerprint(name, content)
+            self.write(target.lstrip('/'), content, overwrite=False)
+        with self.lock:
+            self.media[name] = target
+        return target
+
+    def fetched_asset(self, url):
+        """Vignette ou téléchargement produit par une vue, enregistré sous un nom haché"""
+        with self.lock:
+            if url in self.media:
+                return self.media[url]
+        target = None
+        response = self.client.get(url, secure=self.secure, HTTP_ACCEPT=ASSET_ACCEPT)
+        if response.status_code == 200:
+            content = b''.join(response.streaming_content) if response.streaming else response.content
+            response.close()
+            path = self.split(url)[0]
+            directory, name = (path, '') if path.endswith('/') else path.rsplit('/', 1)
+            filename = re.search(r'''filename\*?=(?:utf-8'')?"?([^";]+)''', response.get('Content-Disposition', ''))
+            name = PurePosixPath(unquote(filename.group(1)) if filename else name or 'index')
+            extension = mimetypes.guess_extension(response.get('Content-Type', '').split(';')[0].strip())
+            if extension and mimetypes.guess_type(name.name)[0] != mimetypes.guess_type(f'x{extension}')[0]:
+                name = name.with_suffix(extension)
+            target = '/' + fingerprint('/'.join(filter(None, [directory.strip('/'), name.name])), content)
+            self.write(target.lstrip('/'), content, overwrite=False)
+        with self.lock:
+            self.media[url] = target
+            if target is None:
+                self.failed[url] = response.status_code
+        return target
+
+    def write(self, name, content, overwrite=True):
+        path = self.output / name
+        if not overwrite and path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f'.{path.name}.{threading.get_ident()}.tmp')
+        temporary.write_bytes(content)
+        os.replace(temporary, path)
+
+    def copy_static(self):
+        """Arborescence statique complète : les feuilles de style référencent polices et images"""
+        if isinstance(staticfiles_storage, ManifestFilesMixin):
+            sources = [
+                (str(path.relative_to(settings.STATIC_ROOT)), path)
+                for path in Path(settings.STATIC_ROOT).rglob('*') if path.is_file()
+            ]
+        else:
+            sources = {}
+            for finder in finders.get_finders():
+                for name, storage in finder.list([]):
+                    sources.setdefault(name, Path(storage.path(name)))
+            sources = sources.items()
+
+        copied, names = 0, []
+        prefix = settings.STATIC_URL.strip('/')
+        for name, source in sources:
+            name = f"{prefix}/{name.replace(os.sep, '/')}"
+            names.append(name)
+            destination = self.output / name
+            stat = source.stat()
+            if destination.exists() and destination.stat().st_size == stat.st_size \
+                    and destination.stat().st_mtime == stat.st_mtime:
+                continue
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, destination)
+            copied += 1
+        return copied, names
+
+    # Reconstruction incrémentale
+
+    def signature(self, table):
+        """Empreinte du contenu d'une table, hors compteurs de consultation"""
+        with self.lock:
+            if table in self.signatures:
+                return self.signatures[table]
+        model = self.models_by_table.get(table)
+        value = None
+        if model is not None:
+            fields = [field.attname for field in model._meta.concrete_fields if field.name not in IGNORED_FIELDS]
+            digest = hashlib.sha1()
+            for row in model._base_manager.order_by('pk').values_list(*fields).iterator(chunk_size=2000):
+                digest.update(repr(row).encode())
+            value = digest.hexdigest()
+        with self.lock:
+            self.signatures[table] = value
+        return value
+
+    def is_fresh(self, entry):
+        """Page déjà exportée dont aucune table lue au rendu n'a changé depuis"""
+        if entry.get('status') == 200 and not (self.output / entry.get('file', '')).is_file():
+            return False
+        return all(
+            self.signature(table) == self.previous['signatures'].get(table) for table in entry.get('tables', ())
+        )
+
+    def load_manifest(self):
+        try:
+            with open(self.output / MANIFEST_NAME, encoding='utf-8') as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {'pages': {}, 'signatures': {}, 'static': []}
+
+    def save(self, pages, static_names):
+        """Enregistre le manifeste et supprime les fichiers de l'export précédent devenus inutiles"""
+        keep = set(static_names)
+        for entry in pages.values():
+            keep.update(filter(None, [entry.get('file')]))
+            keep.update(asset.lstrip('/') for asset in entry.get('assets', ()))
+
+        previous = set(self.previous['static'])
+        for entry in self.previous['pages'].values():
+            previous.update(filter(None, [entry.get('file')]))
+            previous.update(asset.lstrip('/') for asset in entry.get('assets', ()))
+        removed = sorted(previous - keep)
+        for name in removed:
+            path = self.output / name
+            path.unlink(missing_ok=True)
+            for parent in path.parents:
+                if parent == self.output or any(parent.iterdir()):
+                    break
+                parent.rmdir()
+
+        manifest = {
+            'pages': {url: {key: value for key, value in entry.items() if key != 'skipped'}
+                      for url, entry in sorted(pages.items())},
+            'signatures': {table: self.signatures[table] for table in sorted(self.signatures)},
+            'static': sorted(static_names),
+        }
+        self.write(MANIFEST_NAME, json.dumps(manifest, indent=1).encode('utf-8'))
+        return removed
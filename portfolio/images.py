@@ -0,0 +1,122 @@
+"""Déclinaisons redimensionnées (WebP/AVIF) des images téléversées"""
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps, features
+
+logger = logging.getLogger(__name__)
+
+DERIVATIVE_WIDTHS = getattr(settings, 'IMAGE_DERIVATIVE_WIDTHS', (320, 640, 960, 1280, 1920))
+DERIVATIVE_QUALITY = getattr(settings, 'IMAGE_DERIVATIVE_QUALITY', {'webp': 80, 'avif': 60})
+DERIVATIVES_DIR = 'derivatives'
+
+# Formats modernes disponibles dans ce build de Pillow, du plus compact au moins compact
+DERIVATIVE_FORMATS = [fmt for fmt in ('avif', 'webp') if features.check(fmt)]
+
+# (modèle, champ image) traités à l'enregistrement et par generate_image_derivatives
+IMAGE_FIELDS = (
+    ('Project', 'image'),
+    ('BlogPost', 'featured_image'),
+    ('Testimonial', 'photo'),
+    ('Timeline', 'image'),
+    ('Collaboration', 'image'),
+    ('Profile', 'profile_image'),
+)
+
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'IMAGE_DERIVATIVE_WORKERS', 2),
+    thread_name_prefix='image-derivatives',
+)
+
+
+def manifest_name(name):
+    return f'{DERIVATIVES_DIR}/{name}.json'
+
+
+def derivative_name(name, width, fmt):
+    stem, _ = os.path.splitext(name)
+    return f'{DERIVATIVES_DIR}/{stem}-{width}w.{fmt}'
+
+
+def _manifest_cache_key(name):
+    return f'image-derivatives:{name}'
+
+
+def target_widths(original_width):
+    """Largeurs à produire : jamais d'agrandissement, la largeur d'origine incluse"""
+    widths = [width for width in DERIVATIVE_WIDTHS if width < original_width]
+    return widths + [original_width]
+
+
+def generate_derivatives(name, storage=None, force=False):
+    """Produit les déclinaisons d'une image et écrit leur manifeste ; retourne le manifeste"""
+    storage = storage or default_storage
+    if not force and storage.exists(manifest_name(name)):
+        return load_manifest(name, storage)
+
+    with storage.open(name, 'rb') as source:
+        image = Image.open(source)
+        image = ImageOps.exif_transpose(image)
+        image.load()
+
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'transparency' in image.info else 'RGB')
+
+    variants = {fmt: [] for fmt in DERIVATIVE_FORMATS}
+    for width in target_widths(image.width):
+        height = round(image.height * width / image.width)
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for fmt in DERIVATIVE_FORMATS:
+            buffer = BytesIO()
+            resized.save(buffer, format=fmt.upper(), quality=DERIVATIVE_QUALITY.get(fmt, 80))
+            path = derivative_name(name, width, fmt)
+            if storage.exists(path):
+                storage.delete(path)
+            storage.save(path, ContentFile(buffer.getvalue()))
+            variants[fmt].append([width, path])
+
+    manifest = {'width': image.width, 'height': image.height, 'variants': variants}
+    if storage.exists(manifest_name(name)):
+        storage.delete(manifest_name(name))
+    storage.save(manifest_name(name), ContentFile(json.dumps(manifest).encode()))
+    cache.set(_manifest_cache_key(name), manifest, None)
+    return manifest
+
+
+def load_manifest(name, storage=None):
+    """Manifeste des déclinaisons d'une image, ou None si elles n'existent pas encore"""
+    key = _manifest_cache_key(name)
+    manifest = cache.get(key)
+    if manifest is not None:
+        return manifest or None
+
+    storage = storage or default_storage
+    try:
+        with storage.open(manifest_name(name), 'rb') as handle:
+            manifest = json.loads(handle.read())
+    except (FileNotFoundError, OSError, ValueError):
+        manifest = {}
+    # Un manifeste absent est mis en cache brièvement pour ne pas solliciter le disque à chaque rendu
+    cache.set(key, manifest, None if manifest else 60)
+    return manifest or None
+
+
+def _generate_safely(name):
+    try:
+        generate_derivatives(name)
+    except Exception:
+        logger.exception("Échec de génération des déclinaisons pour %s", name)
+
+
+def schedule_derivatives(name):
+    """Génère les déclinaisons en arrière-plan, sans bloquer la requête"""
+    if name and DERIVATIVE_FORMATS:
+        return _executor.submit(_generate_safely, name)
+    return None
@@ -0,0 +1,62 @@
+from django.core.management.base import BaseCommand
+from django.core.paginator import Paginator
+from portfolio.benchmarks.dataset import generate_dataset, rolled_back
+from portfolio.models import BlogPost, Project
+from portfolio.pagination import KeysetPaginator
+from portfolio.views import PROJECT_KEYSET_ORDERING, BLOG_KEYSET_ORDERING
+import statistics
+import time
+
+
+class Command(BaseCommand):
+    help = 'Compare offset and cursor pagination cost on the first and deepest pages'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100_000, help='Projets et articles générés')
+        parser.add_argument('--repeat', type=int, default=20, help='Mesures par cas (médiane retenue)')
+
+    def handle(self, *args, **options):
+        # Le jeu de données de mesure n'est jamais conservé
+        with rolled_back():
+            self.stdout.write(f"Génération de {options['rows']} projets et {options['rows']} articles...")
+            # Seules les deux listes paginées sont remplies à ce volume
+            generate_dataset(0, Project=options['rows'], BlogPost=options['rows'])
+            self.stdout.write(f"{'Cas':45} {'page 1':>10} {'dernière':>10}")
+            self.compare(
+                'Projets', Project.objects.all(), PROJECT_KEYSET_ORDERING, 9, options['repeat']
+            )
+            self.compare(
+                'Articles', BlogPost.objects.filter(is_published=True), BLOG_KEYSET_ORDERING, 6, options['repeat']
+            )
+
+    def measure(self, func, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return statistics.median(timings) * 1000
+
+    def compare(self, label, queryset, ordering, per_page, repeat):
+        keyset = KeysetPaginator(queryset, ordering, per_page)
+        offset = Paginator(keyset.ordered_queryset(), per_page)
+        last_page = offset.num_pages
+
+        def offset_page(number):
+            # Paginator recalcule le COUNT(*) à chaque requête HTTP
+            paginator = Paginator(keyset.ordered_queryset(), per_page)
+            list(paginator.page(number).object_list)
+
+        # Curseur pointant juste avant la dernière page (calculé hors mesure)
+        last_cursor = keyset.encode_cursor(
+            keyset.ordered_queryset()[(last_page - 1) * per_page - 1]
+        ) if last_page > 1 else None
+
+        rows = [
+            ('offset (Paginator)', offset_page, 1, last_page),
+            ('curseur (KeysetPaginator)', lambda cursor: list(keyset.page(cursor)), None, last_cursor),
+        ]
+        for name, func, first, last in rows:
+            first_ms = self.measure(lambda: func(first), repeat)
+            last_ms = self.measure(lambda: func(last), repeat)
+            self.stdout.write(f'{label + " — " + name:45} {first_ms:8.2f}ms {last_ms:8.2f}ms')
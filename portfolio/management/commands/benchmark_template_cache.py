@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.test.utils import setup_test_environment
+from django.urls import reverse
+from portfolio.benchmarks.dataset import rolled_back
+from portfolio.critical_css import CRITICAL_PAGES
+from portfolio.warmup import reset_template_cache, warm_templates
+import statistics
+import time
+
+
+class Command(BaseCommand):
+    help = 'Compare the response time of each public page with an empty and a warm template cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=10, help='Mesures par page et par mode (médiane retenue)')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        client = Client()
+        repeat = options['repeat']
+        # Les statistiques de visite enregistrées pendant la mesure sont annulées
+        with rolled_back():
+            self.stdout.write(f"{'Page':35} {'à froid':>10} {'à chaud':>10} {'écart':>10}")
+            for url_name in CRITICAL_PAGES:
+                url = reverse(url_name)
+                cold = self.measure(client, url, repeat, reset_template_cache)
+                warm = self.measure(client, url, repeat)
+                self.stdout.write(f'{url_name:35} {cold:8.2f}ms {warm:8.2f}ms {cold - warm:8.2f}ms')
+
+        reset_template_cache()
+        compiled, _, elapsed = warm_templates()
+        self.stdout.write(f'Précompilation de {compiled} templates : {elapsed * 1000:.0f}ms par processus')
+
+    def measure(self, client, url, repeat, before=None):
+        timings = []
+        for _ in range(repeat):
+            if before:
+                before()
+            start = time.perf_counter()
+            client.get(url)
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
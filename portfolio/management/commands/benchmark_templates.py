@@ -0,0 +1,58 @@
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.template import Context
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+from portfolio.benchmarks.dataset import generate_dataset, rolled_back
+import statistics
+import time
+
+
+# Pages dont le rendu sollicite le plus les filtres (split, trim, duration...)
+BENCHMARKED_PAGES = ['portfolio:home', 'portfolio:projects']
+
+
+class Command(BaseCommand):
+    help = 'Measure template render time (without SQL) of the pages using the filter library'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=200, help='Rendus mesurés par page')
+        parser.add_argument('--warmup', type=int, default=20, help='Rendus non mesurés avant la mesure')
+
+    def handle(self, *args, **options):
+        # Le jeu de données de mesure n'est jamais conservé
+        with rolled_back():
+            # Quelques centaines de projets : assez pour que la une ait des projets mis en avant
+            generate_dataset(0.3)
+            self.stdout.write(f"{'Page':30} {'médiane':>10} {'p95':>10} {'min':>10}")
+            for url_name in BENCHMARKED_PAGES:
+                self.benchmark(url_name, options['repeat'], options['warmup'])
+
+    def benchmark(self, url_name, repeat, warmup):
+        request = RequestFactory().get(reverse(url_name))
+        request.user = AnonymousUser()
+        request.session = {}
+        response = resolve(request.path).func(request)
+
+        # Le contexte est figé une fois (requêtes SQL et context processors compris) :
+        # seul le rendu du template, et donc le coût des filtres, est mesuré ensuite
+        template = response.resolve_template(response.template_name)
+        data = {}
+        for processor in template.backend.engine.template_context_processors:
+            data.update(processor(request))
+        data.update(response.context_data)
+        template.template.render(Context(data))
+
+        for _ in range(warmup):
+            template.template.render(Context(data))
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            template.template.render(Context(data))
+            timings.append((time.perf_counter() - start) * 1000)
+
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        self.stdout.write(
+            f'{url_name:30} {statistics.median(timings):8.3f}ms {p95:8.3f}ms {timings[0]:8.3f}ms'
+        )
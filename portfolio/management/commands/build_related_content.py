@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from portfolio.models import RelatedContent
+from portfolio.related import RELATED_PER_KIND, rebuild_related_content
+import time
+
+
+class Command(BaseCommand):
+    help = 'Recompute the related posts, projects and collaborations of every published item'
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        rows = rebuild_related_content()
+        sources = RelatedContent.objects.values('source_kind', 'source_id').distinct().count()
+        self.stdout.write(self.style.SUCCESS(
+            f'{rows} voisins ({RELATED_PER_KIND} au plus par type) pour {sources} contenus '
+            f'en {time.perf_counter() - start:.1f}s'
+        ))
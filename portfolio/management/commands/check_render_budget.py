@@ -0,0 +1,103 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import override_settings, setup_test_environment
+from django.urls import reverse
+from portfolio.critical_css import CRITICAL_PAGES, CRITICAL_CSS_BUDGET, fetch_asset
+from html.parser import HTMLParser
+import gzip
+
+
+class BlockingResources(HTMLParser):
+    """Ressources du <head> qui bloquent le premier affichage"""
+
+    def __init__(self):
+        super().__init__()
+        self.in_head = False
+        self.in_style = False
+        self.in_noscript = False
+        self.blocking = []
+        self.inline_css = 0
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'head':
+            self.in_head = True
+        elif tag == 'body':
+            self.in_head = False
+        if tag == 'noscript':
+            # Repli sans JavaScript : ignoré par un navigateur qui exécute les scripts
+            self.in_noscript = True
+        if not self.in_head or self.in_noscript:
+            return
+        if tag == 'link' and attrs.get('rel') == 'stylesheet' and attrs.get('media', 'all') != 'print':
+            self.blocking.append(attrs['href'])
+        elif tag == 'script' and attrs.get('src') and not {'async', 'defer'} & set(attrs) and attrs.get('type') != 'module':
+            self.blocking.append(attrs['src'])
+        elif tag == 'style':
+            self.in_style = True
+
+    def handle_endtag(self, tag):
+        if tag == 'style':
+            self.in_style = False
+        elif tag == 'noscript':
+            self.in_noscript = False
+        elif tag == 'head':
+            self.in_head = False
+
+    def handle_data(self, data):
+        if self.in_style:
+            self.inline_css += len(data.encode('utf-8'))
+
+
+class Command(BaseCommand):
+    help = 'Report bytes blocking first render per page, with and without critical CSS'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--budget', type=int, default=60, help='Ko bloquants (gzip) maximum par page')
+        parser.add_argument('--offline', action='store_true', help='Ne pas télécharger les ressources externes')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        client = Client()
+        sizes = {}
+        failures = []
+
+        self.stdout.write(f"{'Page':35} {'mode':9} {'requêtes':>8} {'bloquant':>12} {'gzip':>10} {'inline':>9}")
+        for url_name in CRITICAL_PAGES:
+            for label, enabled in (('standard', False), ('critique', True)):
+                with override_settings(CRITICAL_CSS_ENABLED=enabled):
+                    response = client.get(reverse(url_name))
+                parser = BlockingResources()
+                parser.feed(response.content.decode('utf-8'))
+
+                raw = compressed = 0
+                unknown = 0
+                for url in parser.blocking:
+                    if url not in sizes:
+                        sizes[url] = self.measure(url, options['offline'])
+                    if sizes[url] is None:
+                        unknown += 1
+                        continue
+                    raw += sizes[url][0]
+                    compressed += sizes[url][1]
+
+                self.stdout.write(
+                    f'{url_name:35} {label:9} {len(parser.blocking):8} {raw / 1024:10.1f}Ko '
+                    f'{compressed / 1024:8.1f}Ko {parser.inline_css / 1024:7.1f}Ko'
+                    + (f'  ({unknown} taille(s) inconnue(s))' if unknown else '')
+                )
+                if enabled and (compressed > options['budget'] * 1024 or parser.inline_css > CRITICAL_CSS_BUDGET):
+                    failures.append(url_name)
+
+        if failures:
+            raise CommandError(f'Budget de rendu dépassé : {", ".join(failures)}')
+        self.stdout.write(self.style.SUCCESS('Render budgets respected'))
+
+    def measure(self, url, offline):
+        if offline and not url.startswith('/'):
+            return None
+        try:
+            data = fetch_asset(url)
+        except Exception:
+            return None
+        return len(data), len(gzip.compress(data))
@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.test.utils import override_settings, setup_test_environment
+from django.urls import reverse
+from portfolio.critical_css import (
+    CRITICAL_PAGES, CRITICAL_CSS_BUDGET, collect_fold, extract_critical_css, fetch_asset, save_critical_css
+)
+
+
+class Command(BaseCommand):
+    help = 'Render each public page and store the CSS rules it uses above the fold'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--offline', action='store_true',
+                            help='Ignorer les feuilles externes (CDN) : elles restent bloquantes')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        client = Client()
+        stylesheets = {}
+
+        # Rendu sans CSS critique : on veut les <link> d'origine
+        with override_settings(CRITICAL_CSS_ENABLED=False):
+            for url_name in CRITICAL_PAGES:
+                response = client.get(reverse(url_name))
+                if response.status_code != 200:
+                    self.stdout.write(self.style.WARNING(f'{url_name}: HTTP {response.status_code}, ignorée'))
+                    continue
+
+                html = response.content.decode('utf-8')
+                sheets = []
+                for href in collect_fold(html).stylesheets:
+                    if href not in stylesheets:
+                        stylesheets[href] = self.fetch(href, options['offline'])
+                    if stylesheets[href] is not None:
+                        sheets.append((href, stylesheets[href]))
+
+                css = extract_critical_css(html, sheets)
+                template_name = response.templates[0].name
+                save_critical_css(template_name, css, [href for href, _ in sheets])
+
+                size = len(css.encode('utf-8'))
+                style = self.style.SUCCESS if size <= CRITICAL_CSS_BUDGET else self.style.WARNING
+                self.stdout.write(style(f'{template_name:45} {size / 1024:6.1f} Ko critiques, {len(sheets)} feuille(s) différée(s)'))
+
+    def fetch(self, href, offline):
+        if offline and not href.startswith('/'):
+            return None
+        try:
+            return fetch_asset(href).decode('utf-8')
+        except Exception as exc:
+            self.stdout.write(self.style.WARNING(f'Feuille non récupérée, laissée bloquante : {href} ({exc})'))
+            return None
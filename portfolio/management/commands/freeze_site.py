@@ -0,0 +1,65 @@
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestFilesMixin, staticfiles_storage
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from django.urls import reverse
+from portfolio.freeze import Freezer
+from pathlib import Path
+import os
+import time
+
+
+FREEZE_DIR = Path(getattr(settings, 'FREEZE_DIR', settings.BASE_DIR / 'frozen'))
+
+
+class Command(BaseCommand):
+    help = 'Export every public page (all languages and pages) as static files for CDN hosting'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default=str(FREEZE_DIR), help='Dossier de l\'export (par défaut frozen/)')
+        parser.add_argument('--base-url', default=getattr(settings, 'FREEZE_BASE_URL', 'http://localhost'),
+                            help='Adresse publique du site statique, utilisée dans les liens absolus et les sitemaps')
+        parser.add_argument('--workers', type=int, default=min(8, os.cpu_count() or 1), help='Pages rendues en parallèle')
+        parser.add_argument('--incremental', action='store_true',
+                            help='Ne rendre que les pages dont les tables lues au rendu précédent ont changé')
+        parser.add_argument('--collectstatic', action='store_true', help='Lancer collectstatic avant l\'export')
+
+    def handle(self, *args, **options):
+        if options['workers'] < 1:
+            raise CommandError('--workers doit valoir au moins 1')
+        if options['collectstatic']:
+            call_command('collectstatic', interactive=False, verbosity=0)
+        if isinstance(staticfiles_storage, ManifestFilesMixin):
+            if not Path(settings.STATIC_ROOT).is_dir():
+                raise CommandError(f'{settings.STATIC_ROOT} est absent : lancez collectstatic ou utilisez --collectstatic')
+        else:
+            self.stdout.write(self.style.WARNING(
+                'Stockage statique sans manifeste (DEBUG) : les fichiers statiques sont copiés sans hachage'
+            ))
+
+        start = time.perf_counter()
+        freezer = Freezer(options['output'], options['base_url'], options['workers'], options['incremental'])
+        # Rendu sans cache (toutes les tables lues sont relevées) et sans statistiques de visite
+        with override_settings(
+            VISITOR_TRACKING=False,
+            CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+        ):
+            seeds = [reverse('sitemap_index'), reverse('service_worker'), reverse('portfolio:home')]
+            pages = freezer.run(seeds)
+            copied, static_names = freezer.copy_static()
+            removed = freezer.save(pages, static_names)
+
+        written = [entry for entry in pages.values() if entry.get('file') and not entry.get('skipped')]
+        skipped = [entry for entry in pages.values() if entry.get('skipped')]
+        errors = sorted((url, entry['status']) for url, entry in pages.items() if entry.get('status', 200) >= 400)
+        assets = {asset for entry in pages.values() for asset in entry.get('assets', ())}
+        for url, status in errors:
+            self.stdout.write(self.style.WARNING(f'HTTP {status} : {url}'))
+        for url, status in sorted(freezer.failed.items()):
+            self.stdout.write(self.style.WARNING(f'HTTP {status} : {url} (fichier lié, lien laissé tel quel)'))
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(written)} pages écrites, {len(skipped)} inchangées, {len(assets)} fichiers liés, '
+            f'{copied} fichiers statiques copiés, {len(removed)} supprimés en {time.perf_counter() - start:.1f}s '
+            f'dans {options["output"]}'
+        ))
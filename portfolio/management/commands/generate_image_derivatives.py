@@ -0,0 +1,52 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import connections
+from portfolio.images import IMAGE_FIELDS, DERIVATIVE_FORMATS, generate_derivatives
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import os
+
+
+def _generate(name, force):
+    # Exécuté dans un processus de travail : aucun accès à la base de données
+    generate_derivatives(name, force=force)
+    return name
+
+
+class Command(BaseCommand):
+    help = 'Generate responsive image derivatives for existing media in parallel'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Nombre de processus')
+        parser.add_argument('--force', action='store_true', help='Régénérer même si les déclinaisons existent')
+
+    def handle(self, *args, **options):
+        if not DERIVATIVE_FORMATS:
+            self.stdout.write(self.style.WARNING('Pillow ne supporte ni WebP ni AVIF : rien à générer'))
+            return
+
+        names = set()
+        for model_name, field_name in IMAGE_FIELDS:
+            model = apps.get_model('portfolio', model_name)
+            names.update(
+                model.objects.exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True})
+                .values_list(field_name, flat=True)
+            )
+        self.stdout.write(f'{len(names)} image(s) à traiter avec {options["workers"]} processus '
+                          f'({", ".join(DERIVATIVE_FORMATS)})')
+
+        # Les connexions ne doivent pas être partagées avec les processus forkés
+        connections.close_all()
+        failures = 0
+        with ProcessPoolExecutor(max_workers=options['workers']) as executor:
+            futures = {executor.submit(_generate, name, options['force']): name for name in sorted(names)}
+            for future in as_completed(futures):
+                try:
+                    self.stdout.write(f'OK   {future.result()}')
+                except Exception as exc:
+                    failures += 1
+                    self.stdout.write(self.style.ERROR(f'FAIL {futures[future]}: {exc}'))
+
+        if failures:
+            self.stdout.write(self.style.WARNING(f'{failures} image(s) en échec'))
+        else:
+            self.stdout.write(self.style.SUCCESS('Image derivatives generated'))
@@ -0,0 +1,389 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.text import slugify
+from portfolio.markup import render_markdown
+from portfolio.models import (
+    BlogCategory, BlogPost, Contact, Experience, Newsletter, Profile, Project, RelatedContent, SearchQuery, Skill,
+    Testimonial, VisitorStats,
+)
+from portfolio.related import rebuild_related_content, refresh_related_content
+from portfolio.sitemaps import invalidate_sitemaps
+from portfolio.stats import DASHBOARD_STATS_CACHE_KEY, PUBLIC_STATS_CACHE_KEY
+from contextlib import contextmanager
+from datetime import timedelta
+from decimal import Decimal
+import random
+import time
+
+
+# Lignes créées par unité de --scale (--scale 100 : 100k projets et articles, 2M visites)
+SCALED_VOLUMES = {
+    'Project': 1000,
+    'BlogPost': 1000,
+    'Testimonial': 200,
+    'Contact': 500,
+    'Newsletter': 500,
+    'VisitorStats': 20000,
+    'SearchQuery': 10000,
+}
+
+# Contenus qu'un vrai portfolio garde en petit nombre, quelle que soit l'échelle
+FIXED_VOLUMES = {
+    'BlogCategory': 12,
+    'Skill': 40,
+    'Experience': 12,
+}
+
+# Champ portant la marque load-<graine>-… de chaque ligne générée : --clear ne supprime qu'elles.
+# Ordre de suppression : les lignes qui référencent un modèle passent avant lui
+GENERATED_MARKERS = {
+    Testimonial: 'email',
+    BlogPost: 'slug',
+    BlogCategory: 'slug',
+    Project: 'project_url',
+    Experience: 'references',
+    Skill: 'certification_level',
+    Contact: 'email',
+    Newsletter: 'email',
+    VisitorStats: 'session_id',
+    SearchQuery: 'clicked_result',
+}
+
+# Type RelatedContent des contenus générés dont les voisins sont précalculés
+RELATED_KINDS = {BlogPost: 'blogpost', Project: 'project'}
+
+PROJECT_URL = 'https://example.com/'
+
+LANGUAGES = ['fr', 'en', 'ar']
+LANGUAGE_WEIGHTS = [6, 3, 1]
+
+WORDS = {
+    'fr': (
+        'application développement interface données performance équipe projet client solution architecture '
+        'sécurité déploiement utilisateur réseau qualité écriture conception modèle serveur automatisation '
+        'analyse création stratégie fiabilité expérience réussite évolution stockage mémoire requête'
+    ).split(),
+    'en': (
+        'application development interface data performance team project client solution architecture '
+        'security deployment user network quality design model server automation analysis strategy '
+        'reliability experience growth storage memory query cache latency throughput'
+    ).split(),
+    'ar': (
+        'تطبيق تطوير واجهة بيانات أداء فريق مشروع عميل حل هندسة أمان نشر مستخدم شبكة جودة تصميم نموذج '
+        'خادم أتمتة تحليل استراتيجية موثوقية خبرة نمو تخزين ذاكرة استعلام'
+    ).split(),
+}
+
+TECHNOLOGIES = [
+    'Python', 'Django', 'PostgreSQL', 'React', 'Vue.js', 'Docker', 'Redis', 'Celery', 'TypeScript', 'Node.js',
+    'Kubernetes', 'AWS', 'TensorFlow', 'Pandas', 'FastAPI', 'GraphQL', 'Flutter', 'Swift', 'Go', 'Rust',
+]
+
+USER_AGENTS = [
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 14_5) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.5 Safari/605.1.15',
+    'Mozilla/5.0 (iPhone; CPU iPhone OS 17_5 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148',
+    'Mozilla/5.0 (Linux; Android 14; Pixel 8) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0 Mobile Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64; rv:127.0) Gecko/20100101 Firefox/127.0',
+    'Googlebot/2.1 (+http://www.google.com/bot.html)',
+]
+
+STATIC_PAGES = ['/', '/about/', '/projects/', '/blog/', '/contact/', '/services/', '/skills/', '/experience/', '/faq/']
+
+# Nombre de documents markdown distincts par langue, rendus une seule fois puis réutilisés
+MARKDOWN_VARIANTS = 40
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """Désactive auto_now/auto_now_add le temps d'insérer des dates historiques"""
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Command(BaseCommand):
+    help = 'Generate large deterministic datasets with bulk_create for load testing'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=float, default=1, help='Multiplicateur des volumes (1 = 1000 projets)')
+        parser.add_argument('--seed', type=int, default=42, help='Graine du générateur pseudo-aléatoire')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Lignes insérées par transaction')
+        parser.add_argument('--clear', action='store_true',
+                            help='Supprimer d\'abord les lignes générées avec la même graine (les autres sont conservées)')
+        parser.add_argument('--volume', action='append', default=[], metavar='MODÈLE=N',
+                            help='Nombre de lignes d\'un modèle, quelle que soit l\'échelle (ex. VisitorStats=0)')
+        parser.add_argument('--related', action='store_true',
+                            help='Calculer aussi les contenus liés (long à grande échelle, voir build_related_content)')
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.seed = options['seed']
+        self.batch_size = options['batch_size']
+        self.now = timezone.now().replace(microsecond=0)
+        volumes = {name: int(count * options['scale']) for name, count in SCALED_VOLUMES.items()}
+        volumes.update(FIXED_VOLUMES)
+        for override in options['volume']:
+            name, _, count = override.partition('=')
+            if name not in volumes or not count.isdigit():
+                raise CommandError(f'Volume invalide : {override} (attendu Modèle=nombre, ex. VisitorStats=0)')
+            volumes[name] = int(count)
+
+        if options['clear']:
+            self.clear()
+        elif self.generated(BlogCategory).exists():
+            # Emails et slugs dépendent de la graine : une seconde génération violerait leur unicité
+            raise CommandError(f'Des données ont déjà été générées avec la graine {self.seed} : utilisez --clear')
+
+        self.markdown = {language: self.markdown_variants(language) for language in LANGUAGES}
+        self.author, _ = User.objects.get_or_create(username='load-data', defaults={'is_active': False})
+
+        started = time.perf_counter()
+        with explicit_timestamps(BlogPost, Contact, Newsletter, SearchQuery, Testimonial, VisitorStats):
+            self.insert(BlogCategory, volumes['BlogCategory'], self.build_category)
+            self.category_ids = list(self.generated(BlogCategory).values_list('pk', flat=True))
+            self.insert(Skill, volumes['Skill'], self.build_skill)
+            self.insert(Experience, volumes['Experience'], self.build_experience)
+            self.insert(Project, volumes['Project'], self.build_project)
+            self.project_ids = list(self.generated(Project).values_list('pk', flat=True))
+            self.insert(BlogPost, volumes['BlogPost'], self.build_blog_post)
+            self.insert(Testimonial, volumes['Testimonial'], self.build_testimonial)
+            self.insert(Contact, volumes['Contact'], self.build_contact)
+            self.insert(Newsletter, volumes['Newsletter'], self.build_newsletter)
+
+            self.pages = self.page_pool()
+            self.visitors = [self.ip_address() for _ in range(max(volumes['VisitorStats'] // 10, 1))]
+            self.insert(VisitorStats, volumes['VisitorStats'], self.build_visit)
+            self.queries = self.query_pool()
+            self.insert(SearchQuery, volumes['SearchQuery'], self.build_search)
+
+        # bulk_create n'émet aucun signal : statistiques dérivées et caches sont mis à jour à la main
+        if not Profile.objects.exists():
+            Profile.objects.create(name='Load Test', title='Développeur', bio=self.paragraph('fr'), email='load@example.com')
+        Profile.refresh_derived_stats()
+        cache.delete_many([PUBLIC_STATS_CACHE_KEY, DASHBOARD_STATS_CACHE_KEY])
+        invalidate_sitemaps()
+        if options['related']:
+            started_related = time.perf_counter()
+            self.stdout.write(f'{rebuild_related_content()} contenus liés en {time.perf_counter() - started_related:.1f}s')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{sum(volumes.values())} ligne(s) générée(s) en {time.perf_counter() - started:.1f}s (seed {self.seed})'
+        ))
+
+    def marker(self, index):
+        return f'load-{self.seed}-{index}'
+
+    def generated(self, model):
+        """Lignes de model créées par cette commande avec la graine courante"""
+        field = GENERATED_MARKERS[model]
+        prefix = self.marker('')
+        if field == 'project_url':
+            prefix = PROJECT_URL + prefix
+        return model.objects.filter(**{f'{field}__startswith': prefix})
+
+    def clear(self):
+        # Contenu réel et messages des visiteurs intacts : seules les lignes marquées sont supprimées
+        with transaction.atomic():
+            # Un contenu réel rattaché à une ligne générée la perd, comme avec on_delete=SET_NULL
+            BlogPost.objects.filter(category__in=self.generated(BlogCategory)).update(category=None)
+            Testimonial.objects.filter(project_related__in=self.generated(Project)).update(project_related=None)
+
+            # Contenus réels dont un voisin précalculé va disparaître : recalculés après la suppression
+            neighbours = Q(pk__in=[])
+            for model, kind in RELATED_KINDS.items():
+                pks = self.generated(model).values('pk')
+                neighbours |= Q(target_kind=kind, target_id__in=pks) | Q(source_kind=kind, source_id__in=pks)
+            stale = RelatedContent.objects.filter(neighbours)
+            affected = set(stale.values_list('source_kind', 'source_id')) - {
+                (kind, pk) for model, kind in RELATED_KINDS.items()
+                for pk in self.generated(model).values_list('pk', flat=True)
+            }
+            stale.delete()
+
+            # Sans signaux, comme bulk_create : un post_delete par ligne recalculerait sitemaps et voisins
+            # des centaines de milliers de fois
+            deleted = sum(self.generated(model)._raw_delete(using=model.objects.db) for model in GENERATED_MARKERS)
+
+        for kind, pk in sorted(affected):
+            refresh_related_content(kind, pk)
+        self.stdout.write(f'{deleted} ligne(s) générée(s) avec la graine {self.seed} supprimée(s)')
+
+    def insert(self, model, total, build):
+        started = time.perf_counter()
+        for start in range(0, total, self.batch_size):
+            objects = [build(index) for index in range(start, min(start + self.batch_size, total))]
+            with transaction.atomic():
+                model.objects.bulk_create(objects, batch_size=self.batch_size)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f'{model.__name__:15} {total:>10} ligne(s) en {elapsed:6.1f}s ({total / max(elapsed, 1e-6):,.0f}/s)')
+
+    # Texte
+
+    def language(self):
+        return self.rng.choices(LANGUAGES, LANGUAGE_WEIGHTS)[0]
+
+    def sentence(self, language, minimum=6, maximum=14):
+        words = self.rng.choices(WORDS[language], k=self.rng.randint(minimum, maximum))
+        return ' '.join(words).capitalize() + '.'
+
+    def paragraph(self, language, sentences=4):
+        return ' '.join(self.sentence(language) for _ in range(sentences))
+
+    def title(self, language):
+        return self.sentence(language, 3, 7)[:-1]
+
+    def markdown_variants(self, language):
+        """(source, html, table des matières) de documents markdown réalistes"""
+        variants = []
+        for _ in range(MARKDOWN_VARIANTS):
+            parts = [self.paragraph(language)]
+            for _ in range(self.rng.randint(2, 5)):
+                parts.append(f'## {self.title(language)}')
+                parts.append(self.paragraph(language, self.rng.randint(3, 8)))
+                parts.append('\n'.join(f'- **{word}** {self.sentence(language)}' for word in self.rng.sample(TECHNOLOGIES, 3)))
+            if self.rng.random() < 0.3:
+                parts.append('```python\ndef handler(request):\n    return render(request, "page.html")\n```')
+            source = '\n\n'.join(parts)
+            variants.append((source, *render_markdown(source)))
+        return variants
+
+    def technologies(self):
+        return ', '.join(self.rng.sample(TECHNOLOGIES, self.rng.randint(3, 6)))
+
+    def past(self, days):
+        return self.now - timedelta(seconds=self.rng.randint(0, days * 86400))
+
+    def ip_address(self):
+        if self.rng.random() < 0.1:
+            return '2001:db8::' + ':'.join(f'{self.rng.randint(0, 0xffff):x}' for _ in range(4))
+        return '.'.join(str(self.rng.randint(1, 254)) for _ in range(4))
+
+    # Modèles
+
+    def build_category(self, index):
+        name = f'{self.title(self.language())[:80]} {index}'
+        return BlogCategory(name=name, slug=self.marker(index), order=index)
+
+    def build_skill(self, index):
+        return Skill(
+            name=TECHNOLOGIES[index % len(TECHNOLOGIES)] + ('' if index < len(TECHNOLOGIES) else f' {index}'),
+            category=self.rng.choice(Skill.SKILL_CATEGORIES)[0],
+            proficiency=self.rng.choice(Skill.PROFICIENCY_LEVELS)[0],
+            years_of_experience=self.rng.randint(0, 12),
+            is_featured=index < 8,
+            projects_count=self.rng.randint(0, 40), certification_level=self.marker(index),
+        )
+
+    def build_experience(self, index):
+        language = self.language()
+        start = (self.now - timedelta(days=365 * (index + 1) + self.rng.randint(0, 200))).date()
+        return Experience(
+            title=self.title(language), company=f'{self.title(language)[:150]} SA', job_type=self.rng.choice(Experience.JOB_TYPE_CHOICES)[0],
+            start_date=start, end_date=None if index == 0 else start + timedelta(days=self.rng.randint(120, 700)),
+            is_current=index == 0, description=self.paragraph(language), technologies=self.technologies(),
+            references=self.marker(index),
+        )
+
+    def build_project(self, index):
+        language = self.language()
+        status = self.rng.choices(['completed', 'in_progress', 'planned'], [7, 2, 1])[0]
+        start = self.past(3650).date()
+        project = Project(
+            title=self.title(language)[:200], description=self.paragraph(language, 2), technologies=self.technologies(),
+            status=status, project_type=self.rng.choice(Project.PROJECT_TYPES)[0], start_date=start,
+            end_date=start + timedelta(days=self.rng.randint(30, 400)) if status == 'completed' else None,
+            is_featured=self.rng.random() < 0.01, client=self.title(language)[:200],
+            budget=Decimal(self.rng.randint(1000, 200000)), duration_months=self.rng.randint(1, 24),
+            project_url=f'{PROJECT_URL}{self.marker(index)}/',
+        )
+        if self.rng.random() < 0.5:
+            source, html, toc = self.rng.choice(self.markdown[language])
+            project.detailed_description = source
+            project.detailed_description_html = html
+            project.detailed_description_toc = toc
+        return project
+
+    def build_blog_post(self, index):
+        language = self.language()
+        source, html, toc = self.rng.choice(self.markdown[language])
+        title = self.title(language)[:200]
+        created_at = self.past(1825)
+        is_published = self.rng.random() < 0.9
+        excerpt = self.sentence(language)
+        return BlogPost(
+            title=title, slug=f'{self.marker(index)}-{slugify(title)[:30] or "article"}',
+            content=source, content_html=html, content_toc=toc, excerpt=excerpt, meta_description=excerpt[:160],
+            category_id=self.rng.choice(self.category_ids) if self.category_ids and self.rng.random() < 0.8 else None,
+            tags=', '.join(self.rng.sample(TECHNOLOGIES, 3)), author=self.author,
+            is_published=is_published, is_featured=self.rng.random() < 0.01,
+            views_count=int(self.rng.paretovariate(1.2) * 10), reading_time=max(1, len(source.split()) // 200),
+            created_at=created_at, updated_at=created_at, published_at=created_at if is_published else None,
+        )
+
+    def build_testimonial(self, index):
+        language = self.language()
+        return Testimonial(
+            name=self.title(language)[:100], email=f'{self.marker(index)}@example.com',
+            company=self.title(language)[:100], content=self.paragraph(language, 3),
+            rating=self.rng.choices([3, 4, 5], [1, 3, 6])[0],
+            project_related_id=self.rng.choice(self.project_ids) if self.project_ids and self.rng.random() < 0.5 else None,
+            is_featured=self.rng.random() < 0.05, is_approved=self.rng.random() < 0.8, created_at=self.past(1825),
+        )
+
+    def build_contact(self, index):
+        language = self.language()
+        return Contact(
+            name=self.title(language)[:100], email=f'{self.marker(index)}@example.com',
+            subject=self.title(language)[:200], message=self.paragraph(language), ip_address=self.ip_address(),
+            is_read=self.rng.random() < 0.7, created_at=self.past(730),
+        )
+
+    def build_newsletter(self, index):
+        return Newsletter(
+            email=f'{self.marker(index)}@example.com', name=self.title('fr')[:100],
+            is_active=self.rng.random() < 0.9, subscribed_at=self.past(1095),
+        )
+
+    def page_pool(self):
+        pages = list(STATIC_PAGES)
+        pages += [f'/projects/{pk}/' for pk in self.rng.sample(self.project_ids, min(len(self.project_ids), 2000))]
+        slugs = self.generated(BlogPost).filter(is_published=True).values_list('slug', flat=True)[:2000]
+        pages += [f'/blog/{slug}/' for slug in slugs]
+        return pages
+
+    def build_visit(self, index):
+        # Trafic concentré sur quelques pages, comme en production
+        page = self.pages[min(int(self.rng.paretovariate(1.1)) - 1, len(self.pages) - 1)] \
+            if self.rng.random() < 0.6 else self.rng.choice(self.pages)
+        return VisitorStats(
+            ip_address=self.rng.choice(self.visitors), user_agent=self.rng.choice(USER_AGENTS), page_visited=page,
+            referrer=self.rng.choice(['', '', 'https://www.google.com/', 'https://www.linkedin.com/']),
+            visit_date=self.past(365), session_id=self.marker(f'{self.rng.getrandbits(64):016x}'),
+        )
+
+    def query_pool(self):
+        queries = [technology.lower() for technology in TECHNOLOGIES]
+        queries += [' '.join(self.rng.sample(WORDS[language], 2)) for language in LANGUAGES for _ in range(100)]
+        return queries
+
+    def build_search(self, index):
+        # Distribution de Zipf : quelques requêtes très fréquentes, une longue traîne
+        query = self.queries[min(int(self.rng.paretovariate(1.0)) - 1, len(self.queries) - 1)]
+        return SearchQuery(
+            query=query, results_count=self.rng.randint(0, 50), ip_address=self.rng.choice(self.visitors),
+            user_agent=self.rng.choice(USER_AGENTS), search_date=self.past(365), clicked_result=self.marker(index),
+        )
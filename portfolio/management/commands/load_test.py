@@ -0,0 +1,163 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from portfolio.benchmarks.load import TRAFFIC_MIX, load_sample, loopback_sources, run_level
+from portfolio.models import VisitorStats
+from urllib.parse import urlsplit
+import importlib.util
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+
+# Serveurs démarrés par la commande ; gunicorn et uvicorn ne sont pas des dépendances du projet
+SERVERS = {
+    # Serveur WSGI de développement de Django, un thread par connexion
+    'runserver': (None, ['{python}', 'manage.py', 'runserver', '--noreload', '{host}:{port}']),
+    'gunicorn': ('gunicorn', [
+        '{python}', '-m', 'gunicorn', 'portfolio_project.wsgi:application', '--bind', '{host}:{port}',
+        '--workers', '{workers}', '--threads', '{threads}',
+    ]),
+    'uvicorn': ('uvicorn', [
+        '{python}', '-m', 'uvicorn', 'portfolio_project.asgi:application', '--host', '{host}', '--port', '{port}',
+        '--workers', '{workers}', '--no-access-log',
+    ]),
+}
+
+SQLITE_LOCKED = 'database is locked'
+
+
+def latency(result, key, width=0):
+    """'12.3ms', ou 'n/a' : les centiles ne sont calculés qu'à partir de deux requêtes"""
+    value = result.get(key)
+    text = 'n/a' if value is None else f'{value:.1f}ms'
+    return f'{text:>{width}}'
+
+
+class Command(BaseCommand):
+    help = 'Replay a weighted traffic mix against a local server at increasing concurrency levels'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--server', choices=sorted(SERVERS), default='runserver', help='Serveur démarré pour le test')
+        parser.add_argument('--url', help='Viser un serveur déjà démarré (ex. http://127.0.0.1:8000) au lieu d\'en lancer un')
+        parser.add_argument('--workers', type=int, default=4, help='Processus du serveur (gunicorn, uvicorn)')
+        parser.add_argument('--threads', type=int, default=4, help='Threads par processus (gunicorn)')
+        parser.add_argument('--concurrency', default='1,2,4,8,16,32', help='Paliers de clients simultanés')
+        parser.add_argument('--duration', type=float, default=10, help='Durée de chaque palier (secondes)')
+        parser.add_argument('--timeout', type=float, default=30, help='Délai maximal d\'une requête (secondes)')
+        parser.add_argument('--seed', type=int, default=42, help='Graine du choix des requêtes')
+        parser.add_argument('--json', dest='json_path', help='Écrire les résultats dans ce fichier JSON')
+
+    def handle(self, *args, **options):
+        try:
+            levels = [int(level) for level in options['concurrency'].split(',')]
+        except ValueError:
+            raise CommandError('--concurrency attend des entiers séparés par des virgules')
+
+        sample = load_sample()
+        scenarios = [scenario for scenario in TRAFFIC_MIX if not scenario.requires or sample[scenario.requires]]
+        self.stdout.write('Mélange : ' + ', '.join(f'{scenario.name} {scenario.weight}' for scenario in scenarios))
+
+        server, log = None, None
+        if options['url']:
+            parts = urlsplit(options['url'])
+            host, port = parts.hostname, parts.port or 80
+        else:
+            host, port = '127.0.0.1', self.free_port()
+            log = tempfile.TemporaryFile(mode='w+', encoding='utf-8', errors='replace')
+            server = self.start_server(options, host, port, log)
+
+        distinct_sources = loopback_sources(host)
+        if not distinct_sources:
+            self.stdout.write(self.style.WARNING(
+                'Tous les clients partagent une adresse : les limites par IP (contact) renverront des 429'
+            ))
+
+        results = []
+        try:
+            for concurrency in levels:
+                visits = []
+                log_offset = log.seek(0, os.SEEK_END) if log else 0
+                result = run_level(
+                    host, port, concurrency, options['duration'], sample, options['seed'], options['timeout'],
+                    scenarios, before_start=lambda: visits.append(VisitorStats.objects.count()),
+                    distinct_sources=distinct_sources,
+                )
+                # Les écritures de statistiques ne sont comparées que si la base est celle du serveur lancé
+                if server:
+                    result['visits_lost'] = result['visits_expected'] - (VisitorStats.objects.count() - visits[0])
+                    log.seek(log_offset)
+                    result['sqlite_locked'] = log.read().count(SQLITE_LOCKED)
+                results.append(result)
+                self.print_level(result)
+        finally:
+            if server:
+                server.terminate()
+                try:
+                    server.wait(10)
+                except subprocess.TimeoutExpired:
+                    server.kill()
+                log.close()
+
+        self.print_summary(results)
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as handle:
+                json.dump({'server': options['url'] or options['server'], 'levels': results}, handle, indent=2)
+
+    def free_port(self):
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            return sock.getsockname()[1]
+
+    def start_server(self, options, host, port, log):
+        module, command = SERVERS[options['server']]
+        if module and importlib.util.find_spec(module) is None:
+            raise CommandError(f'{module} n\'est pas installé (pip install {module})')
+        values = {
+            'python': sys.executable, 'host': host, 'port': port,
+            'workers': options['workers'], 'threads': options['threads'],
+        }
+        command = [part.format(**values) for part in command]
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', settings.SETTINGS_MODULE))
+        server = subprocess.Popen(command, cwd=settings.BASE_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                log.seek(0)
+                raise CommandError(f'Le serveur s\'est arrêté au démarrage :\n{log.read()[-2000:]}')
+            try:
+                socket.create_connection((host, port), timeout=0.5).close()
+                self.stdout.write(f"Serveur {options['server']} prêt sur http://{host}:{port}/")
+                return server
+            except OSError:
+                time.sleep(0.2)
+        server.kill()
+        raise CommandError('Le serveur ne répond pas après 30 secondes')
+
+    def print_level(self, result):
+        errors = ', '.join(f'{name} : {count}' for name, count in sorted(result['errors'].items())) or 'aucune'
+        line = (f"\nConcurrence {result['concurrency']} : {result['requests']} requêtes en {result['duration_s']}s, "
+                f"{result['throughput_rps']} req/s, p50 {latency(result, 'p50_ms')}, "
+                f"p95 {latency(result, 'p95_ms')}, p99 {latency(result, 'p99_ms')}, "
+                f"erreurs {result['error_rate']:.1%} ({errors})")
+        self.stdout.write(line)
+        if 'visits_lost' in result:
+            self.stdout.write(f"  statistiques de visite perdues : {result['visits_lost']} / {result['visits_expected']}, "
+                              f"'{SQLITE_LOCKED}' dans le journal du serveur : {result['sqlite_locked']}")
+        for name, scenario in result['scenarios'].items():
+            self.stdout.write(
+                f"  {name:14} {scenario['requests']:6} req  p50 {latency(scenario, 'p50_ms', 10)}  "
+                f"p95 {latency(scenario, 'p95_ms', 10)}  erreurs {scenario['error_rate']:6.1%}"
+            )
+
+    def print_summary(self, results):
+        self.stdout.write(f"\n{'Clients':>8} {'req/s':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'erreurs':>8}")
+        for result in results:
+            self.stdout.write(
+                f"{result['concurrency']:8} {result['throughput_rps']:9.1f} {latency(result, 'p50_ms', 9)} "
+                f"{latency(result, 'p95_ms', 9)} {latency(result, 'p99_ms', 9)} {result['error_rate']:8.1%}"
+            )
@@ -0,0 +1,54 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import connections, transaction
+from portfolio.markup import MARKDOWN_FIELDS, markdown_fields, render_markdown
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+
+def _render(rows):
+    # Exécuté dans un processus de travail : aucun accès à la base de données
+    return [(pk, render_markdown(source)) for pk, source in rows]
+
+
+class Command(BaseCommand):
+    help = 'Render stored HTML and tables of contents for existing markdown fields in parallel'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Nombre de processus')
+        parser.add_argument('--batch-size', type=int, default=200, help='Lignes envoyées à chaque processus')
+        parser.add_argument('--force', action='store_true', help='Recalculer même les lignes déjà rendues')
+
+    def handle(self, *args, **options):
+        models = sorted({model_name for model_name, _ in MARKDOWN_FIELDS})
+        jobs = []
+        for model_name in models:
+            model = apps.get_model('portfolio', model_name)
+            for field_name, with_toc in markdown_fields(model).items():
+                queryset = model.objects.exclude(**{field_name: ''})
+                if not options['force']:
+                    queryset = queryset.filter(**{f'{field_name}_html': ''})
+                rows = list(queryset.values_list('pk', field_name).order_by('pk'))
+                for start in range(0, len(rows), options['batch_size']):
+                    jobs.append((model, field_name, with_toc, rows[start:start + options['batch_size']]))
+                self.stdout.write(f'{model_name}.{field_name} : {len(rows)} ligne(s)')
+
+        # Les connexions ne doivent pas être partagées avec les processus forkés
+        connections.close_all()
+        total = 0
+        with ProcessPoolExecutor(max_workers=options['workers']) as executor:
+            results = executor.map(_render, [rows for _, _, _, rows in jobs])
+            for (model, field_name, with_toc, _), rendered in zip(jobs, results):
+                objects = []
+                for pk, (html, toc) in rendered:
+                    obj = model(pk=pk, **{f'{field_name}_html': html})
+                    if with_toc:
+                        setattr(obj, f'{field_name}_toc', toc)
+                    objects.append(obj)
+                update_fields = [f'{field_name}_html'] + ([f'{field_name}_toc'] if with_toc else [])
+                # bulk_update ne passe pas par save() : les autres colonnes restent intactes
+                with transaction.atomic():
+                    model.objects.bulk_update(objects, update_fields)
+                total += len(objects)
+
+        self.stdout.write(self.style.SUCCESS(f'{total} rendering(s) stored'))
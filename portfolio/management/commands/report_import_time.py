@@ -0,0 +1,128 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from collections import defaultdict
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+
+# Démarrage d'un processus WSGI tel qu'au premier appel : application (précompilation des templates
+# comprise), URLconf et donc les vues, puis le gabarit de base et ses bibliothèques de balises
+BOOT_CODE = (
+    'import portfolio_project.wsgi\n'
+    'from django.urls import get_resolver\n'
+    'get_resolver().url_patterns\n'
+    'from django.template.loader import get_template\n'
+    'get_template("base.html")\n'
+)
+
+# Modules lourds qui ne doivent pas être importés au démarrage
+LAZY_MODULES = ('reportlab', 'fontTools', 'PIL.AvifImagePlugin')
+
+_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$')
+
+
+def parse_importtime(output):
+    """Liste de (module, self µs, cumulé µs, profondeur) à partir de la sortie de -X importtime"""
+    entries = []
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return entries
+
+
+class Command(BaseCommand):
+    help = 'Measure the import cost of booting the WSGI application with python -X importtime'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=3, help='Démarrages mesurés (le plus rapide est retenu)')
+        parser.add_argument('--top', type=int, default=15, help='Nombre de modules et de paquets listés')
+        parser.add_argument('--json', dest='json_path', help='Écrire le rapport dans ce fichier JSON')
+        parser.add_argument('--baseline', help='Rapport JSON précédent auquel comparer le total')
+        parser.add_argument('--budget', type=float, help='Échec si le total dépasse ce nombre de millisecondes')
+        parser.add_argument('--no-warmup', action='store_true',
+                            help='Ne pas précompiler les templates (par défaut : démarrage de production, DEBUG=False)')
+
+    def handle(self, *args, **options):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'portfolio_project.settings'))
+        # Démarrage de production par défaut : un module lourd importé par un template y apparaît
+        env.setdefault('DEBUG', 'False')
+        if options['no_warmup']:
+            env['TEMPLATE_WARMUP'] = 'False'
+
+        best = None
+        for _ in range(max(options['repeat'], 1)):
+            start = time.perf_counter()
+            result = subprocess.run(
+                [sys.executable, '-X', 'importtime', '-c', BOOT_CODE],
+                cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+            )
+            wall_ms = (time.perf_counter() - start) * 1000
+            if result.returncode != 0:
+                raise CommandError(f'Démarrage impossible :\n{result.stderr[-2000:]}')
+            entries = parse_importtime(result.stderr)
+            if best is None or wall_ms < best[0]:
+                best = (wall_ms, entries)
+
+        wall_ms, entries = best
+        report = self.build_report(wall_ms, entries, options['top'])
+        self.print_report(report)
+
+        if options['baseline']:
+            with open(options['baseline'], encoding='utf-8') as handle:
+                baseline = json.load(handle)
+            delta = report['imports_ms'] - baseline['imports_ms']
+            self.stdout.write(f"Par rapport à {options['baseline']} : {delta:+.1f}ms d'imports "
+                              f"({baseline['imports_ms']:.1f}ms -> {report['imports_ms']:.1f}ms)")
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as handle:
+                json.dump(report, handle, indent=2)
+        if options['budget'] and report['imports_ms'] > options['budget']:
+            raise CommandError(f"Imports : {report['imports_ms']:.1f}ms > budget de {options['budget']:.0f}ms")
+
+    def build_report(self, wall_ms, entries, top):
+        packages = defaultdict(int)
+        for module, self_us, _, _ in entries:
+            packages[module.split('.')[0]] += self_us
+        roots = [entry for entry in entries if entry[3] == 0]
+        loaded = {module for module, _, _, _ in entries}
+        return {
+            'python': sys.version.split()[0],
+            'wall_ms': round(wall_ms, 1),
+            'imports_ms': round(sum(cumulative for _, _, cumulative, _ in roots) / 1000, 1),
+            'modules': len(entries),
+            'top_modules': [
+                {'module': module, 'cumulative_ms': round(cumulative / 1000, 1), 'self_ms': round(self_us / 1000, 1)}
+                for module, self_us, cumulative, _ in sorted(entries, key=lambda entry: -entry[2])[:top]
+            ],
+            'top_packages': [
+                {'package': package, 'self_ms': round(self_us / 1000, 1)}
+                for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]
+            ],
+            'lazy_modules_loaded': sorted(
+                name for name in LAZY_MODULES
+                if any(module == name or module.startswith(name + '.') for module in loaded)
+            ),
+        }
+
+    def print_report(self, report):
+        self.stdout.write(f"Démarrage WSGI : {report['wall_ms']:.0f}ms, dont {report['imports_ms']:.0f}ms "
+                          f"d'imports ({report['modules']} modules)")
+        self.stdout.write('\nModules les plus coûteux (cumulé) :')
+        for item in report['top_modules']:
+            self.stdout.write(f"  {item['cumulative_ms']:8.1f}ms  {item['module']}")
+        self.stdout.write('\nPaquets (temps propre) :')
+        for item in report['top_packages']:
+            self.stdout.write(f"  {item['self_ms']:8.1f}ms  {item['package']}")
+        if report['lazy_modules_loaded']:
+            self.stdout.write(self.style.WARNING(
+                f"\nChargés au démarrage alors qu'ils devraient l'être à la demande : "
+                f"{', '.join(report['lazy_modules_loaded'])}"
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS('\nAucun module lourd chargé au démarrage'))
@@ -0,0 +1,147 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import setup_test_environment
+from django.utils import timezone
+from portfolio import urls as portfolio_urls
+from portfolio.benchmarks.dataset import rolled_back
+from portfolio.benchmarks.endpoints import discover_endpoints
+from portfolio.benchmarks.runner import RequestCounter, compare, measure
+from portfolio.ratelimit import LIMITS_CACHE_KEY
+from portfolio.sitemaps import invalidate_sitemaps
+from portfolio.stats import DASHBOARD_STATS_CACHE_KEY, PUBLIC_STATS_CACHE_KEY
+from portfolio.theme import THEME_CACHE_KEY
+from pathlib import Path
+import django
+import json
+import os
+import platform
+import tempfile
+
+
+BENCHMARK_DIR = Path(getattr(settings, 'BENCHMARK_DIR', settings.BASE_DIR / 'benchmarks'))
+
+
+class Command(BaseCommand):
+    help = 'Benchmark every portfolio URL (latency percentiles, SQL queries, memory) and compare with a baseline'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=float, default=1, help='Échelle du jeu de données (voir generate_load_data)')
+        parser.add_argument('--seed', type=int, default=42, help='Graine du jeu de données')
+        parser.add_argument('--use-existing', action='store_true',
+                            help='Mesurer la base telle quelle (écritures annulées) au lieu d\'une base temporaire générée')
+        parser.add_argument('--repeat', type=int, default=30, help='Requêtes mesurées par route')
+        parser.add_argument('--warmup', type=int, default=3, help='Requêtes non mesurées avant la mesure')
+        parser.add_argument('--memory-samples', type=int, default=3, help='Requêtes tracées par tracemalloc')
+        parser.add_argument('--only', action='append', default=[], help='Ne mesurer que les routes contenant ce texte')
+        parser.add_argument('--output', help='Fichier JSON des résultats (par défaut benchmarks/results/<date>.json)')
+        parser.add_argument('--baseline', help='Référence à comparer (par défaut benchmarks/baseline.json)')
+        parser.add_argument('--save-baseline', action='store_true', help='Enregistrer ces résultats comme référence')
+        parser.add_argument('--threshold', type=float, default=0.2, help='Régression tolérée (0.2 = +20 %%)')
+
+    def handle(self, *args, **options):
+        if options['repeat'] < 2:
+            raise CommandError('--repeat doit valoir au moins 2')
+        setup_test_environment()
+
+        try:
+            if options['use_existing']:
+                results = self.run_on_existing(options)
+            else:
+                results = self.run_on_temporary_database(options)
+        finally:
+            # Les caches calculés sur le jeu mesuré ne doivent pas survivre à la mesure
+            cache.delete_many([PUBLIC_STATS_CACHE_KEY, DASHBOARD_STATS_CACHE_KEY, THEME_CACHE_KEY, LIMITS_CACHE_KEY])
+            invalidate_sitemaps()
+
+        output = Path(options['output'] or BENCHMARK_DIR / 'results' / f"{timezone.now():%Y%m%d-%H%M%S}.json")
+        self.write_json(output, results)
+        self.stdout.write(f'Résultats : {output}')
+
+        baseline_path = Path(options['baseline'] or BENCHMARK_DIR / 'baseline.json')
+        if options['save_baseline']:
+            self.write_json(baseline_path, results)
+            self.stdout.write(self.style.SUCCESS(f'Référence enregistrée : {baseline_path}'))
+        elif baseline_path.exists():
+            self.compare(results, baseline_path, options['threshold'])
+
+    def run_on_temporary_database(self, options):
+        """
+        Jeu de données généré dans une base créée pour la mesure puis supprimée. Les
+        écritures y sont validées : les hooks on_commit (thème, déclinaisons d'images,
+        contenus liés, statistiques) s'exécutent comme en production.
+        """
+        test_settings = connection.settings_dict['TEST']
+        if connection.vendor == 'sqlite' and not test_settings.get('NAME'):
+            # Fichier plutôt que la base en mémoire de Django : mêmes conditions d'E/S que la base réelle
+            test_settings['NAME'] = os.path.join(tempfile.gettempdir(), 'portfolio-benchmark.sqlite3')
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            call_command('generate_load_data', scale=options['scale'], seed=options['seed'], stdout=self.stdout)
+            return self.run(options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    def run_on_existing(self, options):
+        # La base réelle n'est jamais modifiée : les écritures des API sont annulées,
+        # et les hooks on_commit ne s'exécutent donc pas pendant cette mesure
+        self.stdout.write(self.style.WARNING('Base existante : écritures annulées, hooks on_commit non exécutés'))
+        with rolled_back():
+            return self.run(options)
+
+    def run(self, options):
+        admin = User.objects.create_superuser('benchmark-admin', 'benchmark@example.com', 'benchmark-admin')
+        # Une route en erreur est signalée par son code HTTP sans interrompre la campagne
+        anonymous, superuser = Client(raise_request_exception=False), Client(raise_request_exception=False)
+        superuser.force_login(admin)
+        counter = RequestCounter()
+
+        results = {
+            'created_at': timezone.now().isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'dataset': 'existing' if options['use_existing'] else {'scale': options['scale'], 'seed': options['seed']},
+            'repeat': options['repeat'],
+            'endpoints': {},
+            'skipped': [],
+        }
+        self.stdout.write(f"{'Route':42} {'p50':>9} {'p95':>9} {'p99':>9} {'SQL':>4} {'mémoire':>10}  HTTP")
+        for endpoint in discover_endpoints(portfolio_urls, portfolio_urls.app_name):
+            if options['only'] and not any(part in endpoint.name for part in options['only']):
+                continue
+            if not endpoint.prepare():
+                results['skipped'].append(endpoint.name)
+                self.stdout.write(f'{endpoint.name:42} ignorée : aucune donnée pour construire l\'URL')
+                continue
+            client = superuser if endpoint.login else anonymous
+            stats = measure(endpoint, client, counter, options['repeat'], options['warmup'], options['memory_samples'])
+            results['endpoints'][endpoint.name] = stats
+            line = (f"{endpoint.name:42} {stats['p50_ms']:7.2f}ms {stats['p95_ms']:7.2f}ms {stats['p99_ms']:7.2f}ms "
+                    f"{stats['queries']:4} {stats['memory_kb']:8.0f}Ko  {','.join(map(str, stats['status']))}")
+            failed = any(status >= 400 for status in stats['status'])
+            self.stdout.write(self.style.WARNING(line) if failed else line)
+        return results
+
+    def compare(self, results, baseline_path, threshold):
+        with open(baseline_path, encoding='utf-8') as handle:
+            baseline = json.load(handle)
+        for key in ('dataset', 'database', 'python', 'django'):
+            if baseline.get(key) != results[key]:
+                self.stdout.write(self.style.WARNING(
+                    f"Référence mesurée dans d'autres conditions ({key} : {baseline.get(key)} / {results[key]})"
+                ))
+
+        regressions = compare(results, baseline, threshold)
+        if regressions:
+            raise CommandError('Régressions par rapport à la référence :\n  ' + '\n  '.join(regressions))
+        self.stdout.write(self.style.SUCCESS(f'Aucune régression au-delà de {threshold:.0%} par rapport à {baseline_path}'))
+
+    def write_json(self, path, data):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as handle:
+            json.dump(data, handle, indent=2, ensure_ascii=False)
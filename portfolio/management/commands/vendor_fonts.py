@@ -0,0 +1,100 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from portfolio.critical_css import fetch_asset
+from portfolio.fonts import (
+    FONTS_CSS, ICONS_CSS, FONT_AWESOME_URL, GOOGLE_FONTS_URL, GOOGLE_FONT_WEIGHTS,
+    icon_codepoints, parse_font_faces, parse_unicode_range, subset_font, trim_icon_css,
+    used_characters, used_icons, webfont_urls,
+)
+from portfolio.models import SiteCustomization
+from urllib.parse import quote
+import os
+import re
+
+# Familles utilisées par static/css/style.css, en plus de celle de la personnalisation active
+STYLESHEET_FAMILIES = ['Montserrat', 'Open Sans']
+
+
+class Command(BaseCommand):
+    help = 'Download the site fonts and Font Awesome, subset them to the glyphs actually used and store them under static/vendor/'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--family', action='append', help='Famille Google Fonts (répétable)')
+        parser.add_argument('--skip-icons', action='store_true', help='Ne pas traiter Font Awesome')
+        parser.add_argument('--output', default=str(settings.STATICFILES_DIRS[0]), help='Répertoire static/ cible')
+
+    def handle(self, *args, **options):
+        families = options['family'] or self.default_families()
+        codepoints = used_characters()
+        self.stdout.write(f'{len(codepoints)} caractères utilisés, familles : {", ".join(families)}')
+
+        try:
+            self.vendor_fonts(families, codepoints, options['output'])
+            if not options['skip_icons']:
+                self.vendor_icons(options['output'])
+        except OSError as exc:
+            raise CommandError(f'Téléchargement impossible : {exc}')
+        self.stdout.write(self.style.SUCCESS('Fonts vendored; run collectstatic to publish them'))
+
+    def default_families(self):
+        families = list(STYLESHEET_FAMILIES)
+        customization = SiteCustomization.objects.filter(is_active=True).first()
+        if customization:
+            family = customization.get_font_family_display()
+            if family not in families:
+                families.append(family)
+        return families
+
+    def write(self, root, name, data):
+        path = os.path.join(root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as handle:
+            handle.write(data if isinstance(data, bytes) else data.encode('utf-8'))
+        return len(data)
+
+    def vendor_fonts(self, families, codepoints, output):
+        weights = ';'.join(str(weight) for weight in GOOGLE_FONT_WEIGHTS)
+        query = '&family='.join(f'{quote(family)}:wght@{weights}' for family in families)
+        css = fetch_asset(GOOGLE_FONTS_URL.format(families=query)).decode('utf-8')
+
+        rules, before, after = [], 0, 0
+        for face in parse_font_faces(css):
+            # Sous-ensemble Google (latin, latin-ext...) sans aucun caractère utilisé : ignoré
+            if 'unicode-range' in face and not parse_unicode_range(face['unicode-range']) & codepoints:
+                continue
+            original = fetch_asset(face['url'])
+            data = subset_font(original, codepoints)
+            if data is None:
+                continue
+
+            family = face['font-family'].strip('\'"')
+            slug = re.sub(r'[^a-z0-9]+', '-', family.lower())
+            filename = f"{slug}-{face['font-weight']}-{face.get('font-style', 'normal')}-{face['subset']}.woff2"
+            before += len(original)
+            after += self.write(output, f'{os.path.dirname(FONTS_CSS)}/{filename}', data)
+            rules.append(
+                f"@font-face{{font-family:'{family}';font-style:{face.get('font-style', 'normal')};"
+                f"font-weight:{face['font-weight']};font-display:swap;src:url({filename}) format('woff2');"
+                + (f"unicode-range:{face['unicode-range']}" if 'unicode-range' in face else '') + '}'
+            )
+
+        self.write(output, FONTS_CSS, '\n'.join(rules))
+        self.stdout.write(f'Polices : {len(rules)} fichier(s), {before / 1024:.1f} Ko -> {after / 1024:.1f} Ko')
+
+    def vendor_icons(self, output):
+        css = fetch_asset(FONT_AWESOME_URL).decode('utf-8')
+        icons = icon_codepoints(css)
+        used = used_icons() & set(icons)
+        codepoints = {icons[name] for name in used}
+
+        before, after = 0, 0
+        base_url = FONT_AWESOME_URL.rsplit('/', 2)[0] + '/'
+        for relative in webfont_urls(css):
+            original = fetch_asset(base_url + relative[len('../'):])
+            data = subset_font(original, codepoints)
+            before += len(original)
+            if data is not None:
+                after += self.write(output, os.path.normpath(os.path.join(os.path.dirname(ICONS_CSS), relative)), data)
+
+        self.write(output, ICONS_CSS, trim_icon_css(css, used))
+        self.stdout.write(f'Icônes : {len(used)} / {len(icons)} conservées, {before / 1024:.1f} Ko -> {after / 1024:.1f} Ko')
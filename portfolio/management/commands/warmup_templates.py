@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand, CommandError
+from portfolio.warmup import template_names, warm_templates
+
+
+class Command(BaseCommand):
+    help = 'Compile every template under templates/portfolio and report syntax errors'
+
+    def handle(self, *args, **options):
+        names = template_names()
+        compiled, errors, elapsed = warm_templates(names)
+        for name, exc in errors:
+            self.stdout.write(self.style.ERROR(f'FAIL {name}: {exc}'))
+        if errors:
+            raise CommandError(f'{len(errors)} template(s) en erreur')
+        self.stdout.write(self.style.SUCCESS(f'{compiled} templates compiled in {elapsed * 1000:.0f}ms'))
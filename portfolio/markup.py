@@ -0,0 +1,203 @@
+"""Rendu Markdown sûr, calculé à l'enregistrement et stocké à côté du texte source"""
+import re
+from html import escape, unescape
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.utils.text import slugify
+
+# (modèle, champ) -> avec ou sans table des matières ; le HTML est stocké dans <champ>_html, la table dans <champ>_toc
+MARKDOWN_FIELDS = getattr(settings, 'MARKDOWN_FIELDS', {
+    ('BlogPost', 'content'): True,
+    ('Project', 'detailed_description'): True,
+    ('FAQ', 'answer'): False,
+    ('Service', 'description'): False,
+    ('Timeline', 'description'): False,
+    ('Experience', 'description'): False,
+})
+# En dessous, la table des matières n'apporte rien
+MARKDOWN_TOC_MIN_HEADINGS = getattr(settings, 'MARKDOWN_TOC_MIN_HEADINGS', 2)
+SAFE_URL_SCHEMES = ('', 'http', 'https', 'mailto')
+
+_FENCE = re.compile(r'^```[^\n]*\n(.*?)^```[ \t]*$', re.S | re.M)
+_BLANK_LINES = re.compile(r'\n[ \t]*\n+')
+_HEADING = re.compile(r'^(#{1,6})[ \t]+(.+?)[ \t]*#*$')
+_UNORDERED_ITEM = re.compile(r'^[ \t]*[-*+][ \t]+')
+_ORDERED_ITEM = re.compile(r'^[ \t]*\d+[.)][ \t]+')
+_QUOTE = re.compile(r'^[ \t]*>[ \t]?')
+_CODE_SPAN = re.compile(r'`([^`\n]+)`')
+# Adresse : parenthèses équilibrées admises sur un niveau, ex. [x](http://a/b(1))
+_LINK = re.compile(r'\[([^\]\n]+)\]\(((?:[^()\s]|\([^()\s]*\))+)\)')
+_BOLD = re.compile(r'\*\*(?=\S)(.+?)(?<=\S)\*\*')
+_ITALIC = re.compile(r'(?<![*\w])\*(?=\S)(.+?)(?<=\S)\*(?![*\w])')
+_PLACEHOLDER = re.compile('\x00(\\d+)\x00')
+_TAGS = re.compile(r'<[^>]+>')
+# Retirés par les navigateurs avant de lire le schéma : "\x01javascript:" resterait exécutable
+_CONTROL_CHARACTERS = re.compile(r'[\x00-\x1f\x7f]')
+
+
+def _safe_url(url):
+    url = unescape(url)
+    if _CONTROL_CHARACTERS.search(url):
+        return None
+    try:
+        scheme = urlsplit(url).scheme.lower()
+    except ValueError:
+        return None
+    return url if scheme in SAFE_URL_SCHEMES else None
+
+
+def render_inline(text):
+    """Texte d'une ligne : échappé d'abord, puis seuls gras, italique, code et liens sûrs sont produits"""
+    protected = []
+    text = text.replace('\x00', '')
+
+    def protect(html):
+        protected.append(html)
+        return f'\x00{len(protected) - 1}\x00'
+
+    text = _CODE_SPAN.sub(lambda match: protect(f'<code>{escape(match.group(1))}</code>'), text)
+    text = escape(text)
+
+    def link(match):
+        label, url = match.group(1), _safe_url(match.group(2))
+        if url is None:
+            return label
+        external = urlsplit(url).scheme in ('http', 'https')
+        extra = ' target="_blank" rel="noopener noreferrer"' if external else ''
+        return protect(f'<a href="{escape(url)}"{extra}>{label}</a>')
+
+    text = _LINK.sub(link, text)
+    text = _BOLD.sub(r'<strong>\1</strong>', text)
+    text = _ITALIC.sub(r'<em>\1</em>', text)
+    # Les liens peuvent contenir du code protégé : remplacer jusqu'à épuisement
+    while _PLACEHOLDER.search(text):
+        text = _PLACEHOLDER.sub(lambda match: protected[int(match.group(1))], text)
+    return text
+
+
+class _Headings:
+    def __init__(self):
+        self.entries = []
+        self.used = set()
+
+    def anchor(self, level, html):
+        title = unescape(_TAGS.sub('', html))
+        base = slugify(title, allow_unicode=True) or 'section'
+        anchor, index = base, 2
+        while anchor in self.used:
+            anchor, index = f'{base}-{index}', index + 1
+        self.used.add(anchor)
+        self.entries.append((level, anchor, title))
+        return anchor
+
+
+def _render_list(lines, pattern, tag):
+    items = []
+    for line in lines:
+        if pattern.match(line):
+            items.append(pattern.sub('', line, count=1))
+        elif items:
+            # Ligne de continuation de l'élément précédent
+            items[-1] += ' ' + line.strip()
+    return f'<{tag}>' + ''.join(f'<li>{render_inline(item)}</li>' for item in items) + f'</{tag}>'
+
+
+def _render_block(block, headings):
+    lines = block.split('\n')
+    # Un titre isole toujours les lignes qui l'entourent
+    for index, line in enumerate(lines):
+        heading = _HEADING.match(line)
+        if heading:
+            level, html = len(heading.group(1)), render_inline(heading.group(2))
+            anchor = headings.anchor(level, html)
+            return ''.join([
+                _render_block('\n'.join(lines[:index]), headings) if index else '',
+                f'<h{level} id="{anchor}">{html}'
+                f'<a class="heading-anchor" href="#{anchor}" aria-hidden="true">#</a></h{level}>',
+                _render_block('\n'.join(lines[index + 1:]), headings) if lines[index + 1:] else '',
+            ])
+    if _UNORDERED_ITEM.match(lines[0]):
+        return _render_list(lines, _UNORDERED_ITEM, 'ul')
+    if _ORDERED_ITEM.match(lines[0]):
+        return _render_list(lines, _ORDERED_ITEM, 'ol')
+    if all(_QUOTE.match(line) for line in lines):
+        quoted = '\n'.join(_QUOTE.sub('', line) for line in lines)
+        return f'<blockquote>{_render_block(quoted, headings)}</blockquote>'
+    return '<p>' + '<br>'.join(render_inline(line.strip()) for line in lines) + '</p>'
+
+
+def render_toc(entries):
+    """Listes imbriquées de liens vers les titres, relatives au niveau de titre le plus haut"""
+    if len(entries) < MARKDOWN_TOC_MIN_HEADINGS:
+        return ''
+    top = min(level for level, _, _ in entries)
+    html, depth = [], 0
+    for level, anchor, title in entries:
+        level = level - top + 1
+        if level > depth:
+            html.append('<ul><li>' * (level - depth))
+        else:
+            html.append('</li></ul>' * (depth - level) + '</li><li>')
+        html.append(f'<a href="#{anchor}">{escape(title)}</a>')
+        depth = level
+    html.append('</li></ul>' * depth)
+    return ''.join(html)
+
+
+def render_markdown(text):
+    """
+    (HTML, table des matières HTML) d'un texte Markdown. Tout le HTML présent
+    dans la source est échappé : seuls les éléments produits ici sont émis.
+    Sous-ensemble pris en charge : titres, paragraphes (un retour à la ligne
+    donne un <br> comme |linebreaks), listes, citations, blocs et extraits de
+    code, gras, italique et liens http(s)/mailto/relatifs.
+    """
+    if not text:
+        return '', ''
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    headings = _Headings()
+    html, position = [], 0
+    for fence in list(_FENCE.finditer(text)) + [None]:
+        end = fence.start() if fence else len(text)
+        for block in _BLANK_LINES.split(text[position:end]):
+            if block.strip():
+                html.append(_render_block(block.strip('\n'), headings))
+        if fence:
+            html.append(f'<pre><code>{escape(fence.group(1).rstrip())}</code></pre>')
+            position = fence.end()
+    return '\n'.join(html), render_toc(headings.entries)
+
+
+def markdown_fields(model):
+    """{champ source: avec table des matières} pour un modèle"""
+    return {
+        field_name: with_toc for (model_name, field_name), with_toc in MARKDOWN_FIELDS.items()
+        if model_name == model._meta.object_name
+    }
+
+
+def render_fields(instance, field_names=None):
+    """Renseigne les colonnes <champ>_html / <champ>_toc ; retourne les noms des colonnes modifiées"""
+    changed = []
+    for field_name, with_toc in markdown_fields(type(instance)).items():
+        if field_names is not None and field_name not in field_names:
+            continue
+        html, toc = render_markdown(getattr(instance, field_name))
+        setattr(instance, f'{field_name}_html', html)
+        changed.append(f'{field_name}_html')
+        if with_toc:
+            setattr(instance, f'{field_name}_toc', toc)
+            changed.append(f'{field_name}_toc')
+    return changed
+
+
+class RenderedMarkdownMixin:
+    """Recalcule le HTML des champs de MARKDOWN_FIELDS à chaque enregistrement qui les touche"""
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        changed = render_fields(self, update_fields)
+        if update_fields is not None and changed:
+            kwargs['update_fields'] = set(update_fields) | set(changed)
+        super().save(*args, **kwargs)
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0003_alter_collaboration_options_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CVDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200, verbose_name='Titre')),
+                ('description', models.TextField(blank=True, verbose_name='Description')),
+                ('cv_type', models.CharField(choices=[('main', 'CV Principal'), ('technical', 'CV Technique'), ('academic', 'CV Académique'), ('creative', 'CV Créatif'), ('short', 'CV Court'), ('detailed', 'CV Détaillé'), ('english', 'CV Anglais'), ('french', 'CV Français'), ('arabic', 'CV Arabe')], default='main', max_length=20, verbose_name='Type de CV')),
+                ('file', models.FileField(upload_to='cv/', verbose_name='Fichier CV')),
+                ('language', models.CharField(choices=[('fr', 'Français'), ('en', 'English'), ('ar', 'العربية')], default='fr', max_length=10, verbose_name='Langue')),
+                ('is_primary', models.BooleanField(default=False, verbose_name='CV Principal')),
+                ('is_public', models.BooleanField(default=True, help_text='Visible pour téléchargement', verbose_name='Public')),
+                ('download_count', models.PositiveIntegerField(default=0, verbose_name='Téléchargements')),
+                ('file_size', models.PositiveIntegerField(blank=True, null=True, verbose_name='Taille (bytes)')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Créé le')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Modifié le')),
+            ],
+            options={
+                'verbose_name': 'CV',
+                'verbose_name_plural': 'CVs',
+                'ordering': ['-is_primary', '-created_at'],
+            },
+        ),
+        migrations.RemoveField(
+            model_name='blogpost',
+            name='tags_new',
+        ),
+        migrations.RemoveField(
+            model_name='experience',
+            name='tags',
+        ),
+        migrations.RemoveField(
+            model_name='profile',
+            name='cv_file',
+        ),
+        migrations.RemoveField(
+            model_name='profile',
+            name='work_preference',
+        ),
+        migrations.RemoveField(
+            model_name='project',
+            name='tags',
+        ),
+        migrations.RemoveField(
+            model_name='skill',
+            name='tags',
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:26
+
+from django.db import migrations, models
+
+
+def backfill_profile_stats(apps, schema_editor):
+    Profile = apps.get_model('portfolio', 'Profile')
+    Experience = apps.get_model('portfolio', 'Experience')
+    Project = apps.get_model('portfolio', 'Project')
+    Certification = apps.get_model('portfolio', 'Certification')
+    Skill = apps.get_model('portfolio', 'Skill')
+    Profile.objects.update(
+        career_start_date=Experience.objects.aggregate(first=models.Min('start_date'))['first'],
+        projects_total=Project.objects.count(),
+        certifications_total=Certification.objects.count(),
+        skills_total=Skill.objects.count(),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0004_cvdocument_and_model_sync'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='career_start_date',
+            field=models.DateField(blank=True, editable=False, null=True, verbose_name='Début de carrière'),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='certifications_total',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Nombre de certifications'),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='projects_total',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Nombre de projets'),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='skills_total',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Nombre de compétences'),
+        ),
+        migrations.RunPython(backfill_profile_stats, migrations.RunPython.noop),
+    ]
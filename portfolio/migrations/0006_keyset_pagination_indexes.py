@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0005_profile_derived_stats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['-published_at', '-created_at', '-id'], name='blogpost_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-start_date', '-id'], name='project_keyset_idx'),
+        ),
+    ]
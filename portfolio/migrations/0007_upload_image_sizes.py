@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0006_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sitecustomization',
+            name='logo_image_original_bytes',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Taille du logo téléversé (bytes)'),
+        ),
+        migrations.AddField(
+            model_name='sitecustomization',
+            name='logo_image_stored_bytes',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Taille du logo stocké (bytes)'),
+        ),
+        migrations.AddField(
+            model_name='testimonial',
+            name='photo_original_bytes',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Taille de la photo téléversée (bytes)'),
+        ),
+        migrations.AddField(
+            model_name='testimonial',
+            name='photo_stored_bytes',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Taille de la photo stockée (bytes)'),
+        ),
+    ]
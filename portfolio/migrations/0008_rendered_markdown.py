@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0007_upload_image_sizes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False, verbose_name='Contenu (HTML)'),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='content_toc',
+            field=models.TextField(blank=True, editable=False, verbose_name='Table des matières'),
+        ),
+        migrations.AddField(
+            model_name='experience',
+            name='description_html',
+            field=models.TextField(blank=True, editable=False, verbose_name='Description (HTML)'),
+        ),
+        migrations.AddField(
+            model_name='faq',
+            name='answer_html',
+            field=models.TextField(blank=True, editable=False, verbose_name='Réponse (HTML)'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='detailed_description_html',
+            field=models.TextField(blank=True, editable=False, verbose_name='Description détaillée (HTML)'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='detailed_description_toc',
+            field=models.TextField(blank=True, editable=False, verbose_name='Table des matières'),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='description_html',
+            field=models.TextField(blank=True, editable=False, verbose_name='Description détaillée (HTML)'),
+        ),
+        migrations.AddField(
+            model_name='timeline',
+            name='description_html',
+            field=models.TextField(blank=True, editable=False, verbose_name='Description (HTML)'),
+        ),
+    ]
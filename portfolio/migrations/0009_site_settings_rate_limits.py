@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:11
+
+import portfolio.ratelimit
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0008_rendered_markdown'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sitesettings',
+            name='rate_limit_contact',
+            field=models.CharField(blank=True, default='5/h', help_text='Formulaire et API de contact, ex. 5/h', max_length=20, validators=[portfolio.ratelimit.validate_rate], verbose_name='Limite des messages de contact'),
+        ),
+        migrations.AddField(
+            model_name='sitesettings',
+            name='rate_limit_faq_vote',
+            field=models.CharField(blank=True, default='30/h', max_length=20, validators=[portfolio.ratelimit.validate_rate], verbose_name='Limite des votes FAQ'),
+        ),
+        migrations.AddField(
+            model_name='sitesettings',
+            name='rate_limit_newsletter',
+            field=models.CharField(blank=True, default='5/h', max_length=20, validators=[portfolio.ratelimit.validate_rate], verbose_name='Limite des inscriptions newsletter'),
+        ),
+        migrations.AddField(
+            model_name='sitesettings',
+            name='rate_limit_search',
+            field=models.CharField(blank=True, default='30/m', max_length=20, validators=[portfolio.ratelimit.validate_rate], verbose_name='Limite des recherches'),
+        ),
+        migrations.AddField(
+            model_name='sitesettings',
+            name='rate_limit_testimonial',
+            field=models.CharField(blank=True, default='3/h', max_length=20, validators=[portfolio.ratelimit.validate_rate], verbose_name='Limite des témoignages'),
+        ),
+    ]
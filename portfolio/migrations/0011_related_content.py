@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0010_project_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedContent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_kind', models.CharField(choices=[('blogpost', 'Article'), ('project', 'Projet'), ('collaboration', 'Collaboration')], max_length=20, verbose_name='Type du contenu')),
+                ('source_id', models.PositiveIntegerField(verbose_name='ID du contenu')),
+                ('target_kind', models.CharField(choices=[('blogpost', 'Article'), ('project', 'Projet'), ('collaboration', 'Collaboration')], max_length=20, verbose_name='Type du voisin')),
+                ('target_id', models.PositiveIntegerField(verbose_name='ID du voisin')),
+                ('score', models.FloatField(verbose_name='Similarité')),
+                ('rank', models.PositiveSmallIntegerField(verbose_name='Rang')),
+            ],
+            options={
+                'verbose_name': 'Contenu lié',
+                'verbose_name_plural': 'Contenus liés',
+                'ordering': ['source_kind', 'source_id', 'target_kind', 'rank'],
+                'indexes': [models.Index(fields=['source_kind', 'source_id', 'target_kind', 'rank'], name='related_source_idx'), models.Index(fields=['target_kind', 'target_id'], name='related_target_idx')],
+                'constraints': [models.UniqueConstraint(fields=('source_kind', 'source_id', 'target_kind', 'target_id'), name='related_unique_pair')],
+            },
+        ),
+    ]
@@ -7,6 +7,9 @@ from django.contrib.auth.models import User
 from django.utils.text import slugify
 from django.utils import timezone
 
+from .markup import RenderedMarkdownMixin
+from .ratelimit import validate_rate
+
 class Profile(models.Model):
     name = models.CharField(_("Nom"), max_length=100)
     title = models.CharField(_("Titre"), max_length=200)
@@ -45,6 +48,12 @@ class Profile(models.Model):
                                               choices=[('email', 'Email'), ('phone', 'Téléphone'), ('linkedin', 'LinkedIn')],
                                               default='email')
 
+    # Statistiques dérivées, recalculées par les signaux (voir portfolio/signals.py)
+    career_start_date = models.DateField(_("Début de carrière"), null=True, blank=True, editable=False)
+    projects_total = models.PositiveIntegerField(_("Nombre de projets"), default=0, editable=False)
+    certifications_total = models.PositiveIntegerField(_("Nombre de certifications"), default=0, editable=False)
+    skills_total = models.PositiveIntegerField(_("Nombre de compétences"), default=0, editable=False)
+
     class Meta:
         verbose_name = _("Profil")
         verbose_name_plural = _("Profils")
@@ -63,12 +72,24 @@ class Profile(models.Model):
     @property
     def years_of_experience(self):
         from datetime import date
-        experiences = Experience.objects.filter(start_date__isnull=False)
-        if experiences.exists():
-            first_job = experiences.order_by('start_date').first()
-            return date.today().year - first_job.start_date.year
+        if self.career_start_date:
+            return date.today().year - self.career_start_date.year
         return 0
 
+    # Statistique dérivée -> fonction de calcul
+    DERIVED_STATS = {
+        'career_start_date': lambda: Experience.objects.aggregate(first=models.Min('start_date'))['first'],
+        'projects_total': lambda: Project.objects.count(),
+        'certifications_total': lambda: Certification.objects.count(),
+        'skills_total': lambda: Skill.objects.count(),
+    }
+
+    @classmethod
+    def refresh_derived_stats(cls, *fields):
+        """Recalcule les statistiques dérivées (toutes si aucun champ n'est précisé)"""
+        fields = fields or tuple(cls.DERIVED_STATS)
+        cls.objects.update(**{field: cls.DERIVED_STATS[field]() for field in fields})
+
 class CVDocument(models.Model):
     CV_TYPES = [
         ('main', _('CV Principal')),
@@ -159,7 +180,7 @@ class Education(models.Model):
     def __str__(self):
         return f"{self.get_degree_display()} - {self.field_of_study}"
 
-class Experience(models.Model):
+class Experience(RenderedMarkdownMixin, models.Model):
     JOB_TYPE_CHOICES = [
         ('full_time', _('Temps plein')),
         ('part_time', _('Temps partiel')),
@@ -189,6 +210,7 @@ class Experience(models.Model):
     end_date = models.DateField(_("Date de fin"), null=True, blank=True)
     is_current = models.BooleanField(_("En cours"), default=False)
     description = models.TextField(_("Description"))
+    description_html = models.TextField(_("Description (HTML)"), blank=True, editable=False)
     achievements = models.TextField(_("Réalisations"), blank=True)
     technologies = models.CharField(_("Technologies/Compétences utilisées"), max_length=500, blank=True)
     team_size = models.PositiveIntegerField(_("Taille de l'équipe"), null=True, blank=True)
@@ -259,7 +281,7 @@ class Certification(models.Model):
     def __str__(self):
         return self.name
 
-class Project(models.Model):
+class Project(RenderedMarkdownMixin, models.Model):
     PROJECT_STATUS = [
         ('completed', _('Terminé')),
         ('in_progress', _('En cours')),
@@ -280,6 +302,8 @@ class Project(models.Model):
     title = models.CharField(_("Titre"), max_length=200)
     description = models.TextField(_("Description"))
     detailed_description = models.TextField(_("Description détaillée"), blank=True)
+    detailed_description_html = models.TextField(_("Description détaillée (HTML)"), blank=True, editable=False)
+    detailed_description_toc = models.TextField(_("Table des matières"), blank=True, editable=False)
     technologies = models.CharField(_("Technologies"), max_length=500)
     status = models.CharField(_("Statut"), max_length=20, choices=PROJECT_STATUS, default='completed')
     project_type = models.CharField(_("Type de projet"), max_length=20, choices=PROJECT_TYPES, default='other')
@@ -297,11 +321,17 @@ class Project(models.Model):
     lessons_learned = models.TextField(_("Leçons apprises"), blank=True)
     metrics = models.TextField(_("Métriques de succès"), blank=True)
     awards = models.TextField(_("Prix/Reconnaissances"), blank=True)
+    # Date de dernière modification publiée dans le sitemap
+    updated_at = models.DateTimeField(_("Modifié le"), auto_now=True)
     
     class Meta:
         verbose_name = _("Projet")
         verbose_name_plural = _("Projets")
         ordering = ['-start_date']
+        indexes = [
+            # Pagination par curseur (-start_date, -pk)
+            models.Index(fields=['-start_date', '-id'], name='project_keyset_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -331,10 +361,12 @@ class BlogCategory(models.Model):
             self.slug = slugify(self.name)
         super().save(*args, **kwargs)
 
-class BlogPost(models.Model):
+class BlogPost(RenderedMarkdownMixin, models.Model):
     title = models.CharField(_("Titre"), max_length=200)
     slug = models.SlugField(_("Slug"), unique=True, blank=True)
     content = models.TextField(_("Contenu"))
+    content_html = models.TextField(_("Contenu (HTML)"), blank=True, editable=False)
+    content_toc = models.TextField(_("Table des matières"), blank=True, editable=False)
     excerpt = models.TextField(_("Extrait"), blank=True, help_text="Résumé de l'article")
     featured_image = models.ImageField(_("Image vedette"), upload_to='blog/', blank=True)
     category = models.ForeignKey(BlogCategory, on_delete=models.SET_NULL, null=True, blank=True, verbose_name=_("Catégorie"))
@@ -354,6 +386,10 @@ class BlogPost(models.Model):
         verbose_name = _("Article de blog")
         verbose_name_plural = _("Articles de blog")
         ordering = ['-published_at', '-created_at']
+        indexes = [
+            # Pagination par curseur (-published_at, -created_at, -pk)
+            models.Index(fields=['-published_at', '-created_at', '-id'], name='blogpost_keyset_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -387,6 +423,8 @@ class Testimonial(models.Model):
     content = models.TextField(_("Témoignage"))
     rating = models.PositiveIntegerField(_("Note"), choices=RATING_CHOICES, default=5)
     photo = models.ImageField(_("Photo"), upload_to='testimonials/', blank=True)
+    photo_original_bytes = models.PositiveIntegerField(_("Taille de la photo téléversée (bytes)"), null=True, blank=True, editable=False)
+    photo_stored_bytes = models.PositiveIntegerField(_("Taille de la photo stockée (bytes)"), null=True, blank=True, editable=False)
     project_related = models.ForeignKey(Project, on_delete=models.SET_NULL, null=True, blank=True, verbose_name=_("Projet associé"))
     is_featured = models.BooleanField(_("Témoignage vedette"), default=False)
     is_anonymous = models.BooleanField(_("Anonyme"), default=False)
@@ -406,10 +444,11 @@ class Testimonial(models.Model):
             return f"Témoignage anonyme - {self.created_at.strftime('%d/%m/%Y')}"
         return f"{self.name} - {self.company or 'Particulier'}"
 
-class Service(models.Model):
+class Service(RenderedMarkdownMixin, models.Model):
     name = models.CharField(_("Nom du service"), max_length=200)
     short_description = models.CharField(_("Description courte"), max_length=300)
     description = models.TextField(_("Description détaillée"))
+    description_html = models.TextField(_("Description détaillée (HTML)"), blank=True, editable=False)
     icon = models.CharField(_("Icône"), max_length=50, help_text="Classe Font Awesome")
     price_starting = models.DecimalField(_("Prix à partir de"), max_digits=10, decimal_places=2, null=True, blank=True)
     duration = models.CharField(_("Durée"), max_length=100, blank=True)
@@ -558,6 +597,8 @@ class SiteCustomization(models.Model):
                                    ], default='fixed')
     show_logo = models.BooleanField(_("Afficher le logo"), default=True)
     logo_image = models.ImageField(_("Logo"), upload_to='customization/', blank=True)
+    logo_image_original_bytes = models.PositiveIntegerField(_("Taille du logo téléversé (bytes)"), null=True, blank=True, editable=False)
+    logo_image_stored_bytes = models.PositiveIntegerField(_("Taille du logo stocké (bytes)"), null=True, blank=True, editable=False)
     
     # Footer
     footer_text = models.CharField(_("Texte du footer"), max_length=200, blank=True)
@@ -592,6 +633,19 @@ class SiteSettings(models.Model):
     allow_anonymous_testimonials = models.BooleanField(_("Autoriser les témoignages anonymes"), default=True)
     contact_email = models.EmailField(_("Email de contact"), blank=True)
     
+    # Limites par adresse IP des écritures publiques : "nombre/période" (s, m, h, d), vide pour désactiver
+    rate_limit_contact = models.CharField(_("Limite des messages de contact"), max_length=20, blank=True,
+                                          default="5/h", validators=[validate_rate],
+                                          help_text="Formulaire et API de contact, ex. 5/h")
+    rate_limit_testimonial = models.CharField(_("Limite des témoignages"), max_length=20, blank=True,
+                                              default="3/h", validators=[validate_rate])
+    rate_limit_newsletter = models.CharField(_("Limite des inscriptions newsletter"), max_length=20, blank=True,
+                                             default="5/h", validators=[validate_rate])
+    rate_limit_faq_vote = models.CharField(_("Limite des votes FAQ"), max_length=20, blank=True,
+                                           default="30/h", validators=[validate_rate])
+    rate_limit_search = models.CharField(_("Limite des recherches"), max_length=20, blank=True,
+                                         default="30/m", validators=[validate_rate])
+    
     class Meta:
         verbose_name = _("Paramètres du site")
         verbose_name_plural = _("Paramètres du site")
@@ -636,10 +690,11 @@ class SearchQuery(models.Model):
         verbose_name_plural = _("Requêtes de recherche")
         ordering = ['-search_date']
 
-class FAQ(models.Model):
+class FAQ(RenderedMarkdownMixin, models.Model):
     """Questions fréquemment posées"""
     question = models.CharField(_("Question"), max_length=300)
     answer = models.TextField(_("Réponse"))
+    answer_html = models.TextField(_("Réponse (HTML)"), blank=True, editable=False)
     category = models.CharField(_("Catégorie"), max_length=50, choices=[
         ('general', _('Général')),
         ('services', _('Services')),
@@ -662,10 +717,11 @@ class FAQ(models.Model):
     def __str__(self):
         return self.question[:100]
 
-class Timeline(models.Model):
+class Timeline(RenderedMarkdownMixin, models.Model):
     """Timeline des événements importants"""
     title = models.CharField(_("Titre"), max_length=200)
     description = models.TextField(_("Description"))
+    description_html = models.TextField(_("Description (HTML)"), blank=True, editable=False)
     date = models.DateField(_("Date"))
     category = models.CharField(_("Catégorie"), max_length=50, choices=[
         ('education', _('Formation')),
@@ -808,4 +864,39 @@ class Analytics(models.Model):
         unique_together = ['date']
     
     def __str__(self):
-        return f"Analytics - {self.date}"
\ No newline at end of file
+        return f"Analytics - {self.date}"
+
+
+class RelatedContent(models.Model):
+    """Voisins les plus proches d'un article, projet ou collaboration, calculés par portfolio.related"""
+    KIND_CHOICES = (
+        ('blogpost', _("Article")),
+        ('project', _("Projet")),
+        ('collaboration', _("Collaboration")),
+    )
+    
+    source_kind = models.CharField(_("Type du contenu"), max_length=20, choices=KIND_CHOICES)
+    source_id = models.PositiveIntegerField(_("ID du contenu"))
+    target_kind = models.CharField(_("Type du voisin"), max_length=20, choices=KIND_CHOICES)
+    target_id = models.PositiveIntegerField(_("ID du voisin"))
+    score = models.FloatField(_("Similarité"))
+    rank = models.PositiveSmallIntegerField(_("Rang"))
+    
+    class Meta:
+        verbose_name = _("Contenu lié")
+        verbose_name_plural = _("Contenus liés")
+        ordering = ['source_kind', 'source_id', 'target_kind', 'rank']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['source_kind', 'source_id', 'target_kind', 'target_id'], name='related_unique_pair'
+            ),
+        ]
+        indexes = [
+            # Voisins d'une page de détail, déjà triés
+            models.Index(fields=['source_kind', 'source_id', 'target_kind', 'rank'], name='related_source_idx'),
+            # Contenus qui citent un voisin modifié ou supprimé (mise à jour incrémentale)
+            models.Index(fields=['target_kind', 'target_id'], name='related_target_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.source_kind} {self.source_id} -> {self.target_kind} {self.target_id} ({self.score:.2f})"
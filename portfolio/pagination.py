@@ -0,0 +1,156 @@
+"""Pagination par curseur (keyset) : coût constant quelle que soit la profondeur de page"""
+from django.core import signing
+from django.db.models import F, Q
+
+CURSOR_SALT = 'portfolio.pagination.cursor'
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class KeysetPage:
+    """Page obtenue par curseur : pas de COUNT(*) ni d'OFFSET"""
+
+    def __init__(self, object_list, next_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+class KeysetPaginator:
+    """
+    Pagine un queryset selon `ordering`, ex. ('-published_at', '-created_at', '-pk').
+    Le dernier champ doit être unique pour départager les égalités. Les valeurs
+    NULL sont placées en fin de liste, quel que soit le moteur de base de données.
+    """
+
+    def __init__(self, queryset, ordering, per_page):
+        self.queryset = queryset
+        self.keys = [(field.lstrip('-'), field.startswith('-')) for field in ordering]
+        self.per_page = per_page
+
+    def ordered_queryset(self):
+        return self.queryset.order_by(*[
+            self._order_expression(name, descending) for name, descending in self.keys
+        ])
+
+    def _order_expression(self, name, descending):
+        if not self._is_nullable(name):
+            return f'-{name}' if descending else name
+        return F(name).desc(nulls_last=True) if descending else F(name).asc(nulls_last=True)
+
+    def encode_cursor(self, obj):
+        values = [getattr(obj, name) for name, _ in self.keys]
+        return signing.dumps(
+            [value.isoformat() if hasattr(value, 'isoformat') else value for value in values],
+            salt=CURSOR_SALT, compress=True,
+        )
+
+    def decode_cursor(self, cursor):
+        try:
+            raw_values = signing.loads(cursor, salt=CURSOR_SALT)
+        except signing.BadSignature as exc:
+            raise InvalidCursor(str(exc))
+        if not isinstance(raw_values, list) or len(raw_values) != len(self.keys):
+            raise InvalidCursor('Curseur incompatible avec cet ordre de tri')
+
+        opts = self.queryset.model._meta
+        values = []
+        for (name, _), raw in zip(self.keys, raw_values):
+            field = opts.pk if name == 'pk' else opts.get_field(name)
+            values.append(None if raw is None else field.to_python(raw))
+        return values
+
+    def _is_nullable(self, name):
+        return name != 'pk' and self.queryset.model._meta.get_field(name).null
+
+    def after(self, values):
+        """Condition « strictement après le curseur » pour l'ordre (clé1, clé2, ...)"""
+        (lead, lead_descending), lead_value = self.keys[0], values[0]
+        if lead_value is None:
+            # Les NULL sont en fin de liste : seule la suite du segment NULL reste
+            condition, equal = Q(pk__in=[]), Q(**{f'{lead}__isnull': True})
+        else:
+            # Borne redondante sur la première clé : permet un parcours d'index par intervalle
+            bound = Q(**{f'{lead}__lte' if lead_descending else f'{lead}__gte': lead_value})
+            condition = Q(**{f'{lead}__lt' if lead_descending else f'{lead}__gt': lead_value})
+            equal = Q(**{lead: lead_value})
+
+        for (name, descending), value in zip(self.keys[1:], values[1:]):
+            if value is None:
+                equal &= Q(**{f'{name}__isnull': True})
+                continue
+            beyond = Q(**{f'{name}__lt' if descending else f'{name}__gt': value})
+            if self._is_nullable(name):
+                beyond |= Q(**{f'{name}__isnull': True})
+            condition |= equal & beyond
+            equal &= Q(**{name: value})
+
+        return condition if lead_value is None else bound & condition
+
+    def page(self, cursor=None):
+        queryset = self.ordered_queryset()
+        limit = self.per_page + 1  # un élément de plus pour savoir s'il existe une page suivante
+        if not cursor:
+            items = list(queryset[:limit])
+        else:
+            values = self.decode_cursor(cursor)
+            items = list(queryset.filter(self.after(values))[:limit])
+            lead = self.keys[0][0]
+            if len(items) < limit and values[0] is not None and self._is_nullable(lead):
+                # Fin des valeurs non NULL : on enchaîne sur le segment NULL
+                items += list(queryset.filter(**{f'{lead}__isnull': True})[:limit - len(items)])
+
+        has_next = len(items) > self.per_page
+        items = items[:self.per_page]
+        next_cursor = self.encode_cursor(items[-1]) if has_next else None
+        return KeysetPage(items, next_cursor)
+
+
+class KeysetPaginationMixin:
+    """
+    Mode curseur pour ListView, par défaut : la liste s'ouvre sans COUNT(*) et
+    chaque « voir plus » porte `?cursor=`. Les liens `?page=N` existants (moteurs
+    de recherche, favoris) restent servis en pagination numérotée.
+    """
+    keyset_ordering = None
+    cursor_param = 'cursor'
+
+    def get_cursor(self):
+        return self.request.GET.get(self.cursor_param)
+
+    def is_numbered(self):
+        return bool(self.kwargs.get(self.page_kwarg) or self.request.GET.get(self.page_kwarg))
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.keyset_ordering:
+            return super().paginate_queryset(queryset, page_size)
+
+        # Même ordre total dans les deux modes pour que les curseurs s'enchaînent
+        paginator = KeysetPaginator(queryset, self.keyset_ordering, page_size)
+        if self.is_numbered():
+            return super().paginate_queryset(paginator.ordered_queryset(), page_size)
+
+        try:
+            page = paginator.page(self.get_cursor())
+        except InvalidCursor:
+            page = paginator.page()
+        return (None, page, page.object_list, False)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        page = context.get('page_obj')
+        # Les pages numérotées gardent leur pagination : seul le mode curseur a un lien « voir plus »
+        if isinstance(page, KeysetPage):
+            context['next_cursor'] = page.next_cursor
+        return context
@@ -0,0 +1,306 @@
+"""Limitation de débit par adresse IP, stockée dans le cache Django"""
+import asyncio
+import math
+import time
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core import checks
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.http import JsonResponse
+from django.shortcuts import render
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+# Portée -> champ de SiteSettings qui fixe sa limite ; le défaut du champ s'applique sans paramètres
+CONFIGURABLE_LIMITS = {
+    'contact': 'rate_limit_contact',
+    'testimonial': 'rate_limit_testimonial',
+    'newsletter': 'rate_limit_newsletter',
+    'faq_vote': 'rate_limit_faq_vote',
+    'search': 'rate_limit_search',
+}
+RATE_PERIODS = {'s': 1, 'm': 60, 'h': 60 * 60, 'd': 24 * 60 * 60}
+
+LIMITS_CACHE_KEY = 'ratelimit:limits'
+# Invalidé à l'enregistrement des paramètres ; le délai couvre les caches propres à chaque processus
+LIMITS_CACHE_TTL = getattr(settings, 'RATE_LIMIT_SETTINGS_TTL', 60)
+# Compteurs quotidiens de requêtes acceptées et bloquées, affichés dans l'admin
+COUNTER_DAYS = 7
+COUNTER_TTL = (COUNTER_DAYS + 1) * 24 * 60 * 60
+# Proxys de confiance devant l'application (répartiteur, CDN) ; 0 : X-Forwarded-For est ignoré,
+# le client pouvant y écrire n'importe quelle adresse
+TRUSTED_PROXY_COUNT = getattr(settings, 'RATE_LIMIT_TRUSTED_PROXIES', 0)
+# Verrou d'un seau : lecture et écriture de son état sans requête concurrente de la même IP
+BUCKET_LOCK_TIMEOUT = 2
+BUCKET_LOCK_ATTEMPTS = 20
+BUCKET_LOCK_WAIT = 0.005
+# Backends dont les données ne sont pas partagées entre processus : limites par worker, ou aucune
+PER_PROCESS_CACHE_BACKENDS = {
+    'django.core.cache.backends.locmem.LocMemCache': _("chaque worker applique sa propre limite"),
+    'django.core.cache.backends.dummy.DummyCache': _("aucune limite n'est appliquée"),
+}
+
+
+def get_client_ip(request):
+    """
+    Adresse du client : REMOTE_ADDR, ou derrière TRUSTED_PROXY_COUNT proxys l'entrée de
+    X-Forwarded-For ajoutée par le plus éloigné d'entre eux. Les entrées plus à gauche
+    viennent du client et ne sont jamais lues.
+    """
+    ip = request.META.get('REMOTE_ADDR')
+    if TRUSTED_PROXY_COUNT:
+        hops = [hop.strip() for hop in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if hop.strip()]
+        if len(hops) >= TRUSTED_PROXY_COUNT:
+            ip = hops[-TRUSTED_PROXY_COUNT]
+    return ip
+
+
+@checks.register(checks.Tags.caches, deploy=True)
+def check_shared_cache(app_configs=None, **kwargs):
+    """Les seaux vivent dans le cache par défaut : il doit être partagé par tous les workers"""
+    backend = settings.CACHES.get('default', {}).get('BACKEND')
+    if backend not in PER_PROCESS_CACHE_BACKENDS:
+        return []
+    return [checks.Warning(
+        _("Le cache par défaut (%(backend)s) n'est pas partagé entre processus : %(effect)s.") % {
+            'backend': backend, 'effect': PER_PROCESS_CACHE_BACKENDS[backend],
+        },
+        hint=_("Définir CACHE_BACKEND sur Redis, Memcached ou la base de données."),
+        id='portfolio.W001',
+    )]
+
+
+def parse_rate(value):
+    """'5/h' -> (5, 5 / 3600) : 5 requêtes en rafale puis une toutes les 12 minutes ; '' -> None"""
+    value = (value or '').strip()
+    if not value:
+        return None
+    count, _, period = value.partition('/')
+    try:
+        count = int(count)
+        seconds = RATE_PERIODS[period.strip().lower()]
+    except (ValueError, KeyError):
+        raise ValueError(f'Limite invalide : {value!r}')
+    if count < 1:
+        raise ValueError(f'Limite invalide : {value!r}')
+    return count, count / seconds
+
+
+def validate_rate(value):
+    try:
+        parse_rate(value)
+    except ValueError:
+        raise ValidationError(_("Format attendu : nombre/période, par exemple 5/h (périodes : s, m, h, d)"))
+
+
+def load_configured_limits():
+    from .models import SiteSettings
+
+    site_settings = SiteSettings.objects.first()
+    limits = {}
+    for scope, field_name in CONFIGURABLE_LIMITS.items():
+        if site_settings:
+            value = getattr(site_settings, field_name)
+        else:
+            value = SiteSettings._meta.get_field(field_name).default
+        limits[scope] = parse_rate(value)
+    cache.set(LIMITS_CACHE_KEY, limits, LIMITS_CACHE_TTL)
+    return limits
+
+
+def get_limit(rate_limit):
+    """(capacité, jetons par seconde) d'une limite fixe ou d'une portée réglable, None si désactivée"""
+    if not isinstance(rate_limit, str):
+        return rate_limit
+    limits = cache.get(LIMITS_CACHE_KEY)
+    if limits is None:
+        limits = load_configured_limits()
+    return limits.get(rate_limit)
+
+
+async def aget_limit(rate_limit):
+    if not isinstance(rate_limit, str):
+        return rate_limit
+    limits = await cache.aget(LIMITS_CACHE_KEY)
+    if limits is None:
+        limits = await sync_to_async(load_configured_limits)()
+    return limits.get(rate_limit)
+
+
+def invalidate_configured_limits():
+    cache.delete(LIMITS_CACHE_KEY)
+
+
+def _counter_key(scope, day, outcome):
+    return f'ratelimit:count:{scope}:{day:%Y%m%d}:{outcome}'
+
+
+def record_outcome(scope, allowed):
+    key = _counter_key(scope, timezone.localdate(), 'allowed' if allowed else 'blocked')
+    # add() crée le compteur du jour ; incr() reste atomique sur un cache partagé
+    if not cache.add(key, 1, COUNTER_TTL):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, COUNTER_TTL)
+
+
+async def arecord_outcome(scope, allowed):
+    key = _counter_key(scope, timezone.localdate(), 'allowed' if allowed else 'blocked')
+    if not await cache.aadd(key, 1, COUNTER_TTL):
+        try:
+            await cache.aincr(key)
+        except ValueError:
+            await cache.aset(key, 1, COUNTER_TTL)
+
+
+def get_counters(scopes=None, days=COUNTER_DAYS):
+    """[(jour, {portée: (acceptées, bloquées)})] du plus récent au plus ancien"""
+    scopes = list(scopes or CONFIGURABLE_LIMITS)
+    today = timezone.localdate()
+    dates = [today - timedelta(days=offset) for offset in range(days)]
+    values = cache.get_many([
+        _counter_key(scope, day, outcome)
+        for day in dates for scope in scopes for outcome in ('allowed', 'blocked')
+    ])
+    return [
+        (day, {
+            scope: (
+                values.get(_counter_key(scope, day, 'allowed'), 0),
+                values.get(_counter_key(scope, day, 'blocked'), 0),
+            )
+            for scope in scopes
+        })
+        for day in dates
+    ]
+
+
+class TokenBucket:
+    """Seau à jetons : `capacity` requêtes en rafale, `rate` jetons regagnés par seconde"""
+
+    def __init__(self, scope, capacity, rate):
+        self.scope = scope
+        self.capacity = capacity
+        self.rate = rate
+
+    def cache_key(self, identifier):
+        return f'ratelimit:{self.scope}:{identifier}'
+
+    def consume(self, identifier, tokens=1):
+        """Retourne (autorisé, secondes avant le prochain jeton disponible)"""
+        key = self.cache_key(identifier)
+        # add() est atomique : une seule requête de cette IP lit et réécrit le seau à la fois
+        for attempt in range(BUCKET_LOCK_ATTEMPTS):
+            if cache.add(f'{key}:lock', 1, BUCKET_LOCK_TIMEOUT):
+                break
+            time.sleep(BUCKET_LOCK_WAIT)
+        else:
+            # Seau verrouillé en continu : rafale de requêtes simultanées, refusée
+            return False, 1
+        try:
+            now = time.time()
+            allowed, retry_after, state = self._take(cache.get(key, (self.capacity, now)), now, tokens)
+            cache.set(key, state, self.timeout)
+        finally:
+            cache.delete(f'{key}:lock')
+        return allowed, retry_after
+
+    async def aconsume(self, identifier, tokens=1):
+        """Variante de consume() pour les vues asynchrones"""
+        key = self.cache_key(identifier)
+        for attempt in range(BUCKET_LOCK_ATTEMPTS):
+            if await cache.aadd(f'{key}:lock', 1, BUCKET_LOCK_TIMEOUT):
+                break
+            await asyncio.sleep(BUCKET_LOCK_WAIT)
+        else:
+            return False, 1
+        try:
+            now = time.time()
+            allowed, retry_after, state = self._take(await cache.aget(key, (self.capacity, now)), now, tokens)
+            await cache.aset(key, state, self.timeout)
+        finally:
+            await cache.adelete(f'{key}:lock')
+        return allowed, retry_after
+
+    @property
+    def timeout(self):
+        # Le seau est plein au bout de capacity / rate secondes : inutile de le garder plus longtemps
+        return math.ceil(self.capacity / self.rate) + 1
+
+    def _take(self, state, now, tokens):
+        available, updated_at = state
+        available = min(self.capacity, available + (now - updated_at) * self.rate)
+
+        allowed = available >= tokens
+        if allowed:
+            available -= tokens
+        retry_after = 0 if allowed else math.ceil((tokens - available) / self.rate)
+        return allowed, retry_after, (available, now)
+
+
+class RateLimitMixin:
+    """Renvoie 429 quand une IP dépasse la limite de la vue
+
+    rate_limit vaut (capacité, jetons par seconde) ou le nom d'une portée de
+    CONFIGURABLE_LIMITS, réglée dans les paramètres du site. Les vues qui
+    partagent une portée partagent le seau de chaque IP.
+    """
+    rate_limit = None
+    rate_limit_scope = None
+    # Méthodes limitées, None pour toutes : un formulaire reste affiché quand seul son envoi est bloqué
+    rate_limit_methods = None
+    # Page HTML de la réponse 429 ; sans gabarit la réponse est en JSON
+    rate_limit_template = None
+
+    def get_rate_limit_scope(self):
+        if isinstance(self.rate_limit, str):
+            return self.rate_limit
+        return self.rate_limit_scope or self.__class__.__name__
+
+    def get_bucket(self, limit):
+        capacity, rate = limit
+        return TokenBucket(self.get_rate_limit_scope(), capacity, rate)
+
+    def is_rate_limited_method(self, request):
+        return bool(self.rate_limit) and (
+            self.rate_limit_methods is None or request.method in self.rate_limit_methods
+        )
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.view_is_async:
+            return self.adispatch(request, *args, **kwargs)
+        if self.is_rate_limited_method(request):
+            limit = get_limit(self.rate_limit)
+            if limit:
+                bucket = self.get_bucket(limit)
+                allowed, retry_after = bucket.consume(get_client_ip(request))
+                record_outcome(bucket.scope, allowed)
+                if not allowed:
+                    return self.rate_limited(request, retry_after)
+        return super().dispatch(request, *args, **kwargs)
+
+    async def adispatch(self, request, *args, **kwargs):
+        # Une vue asynchrone doit toujours renvoyer une coroutine, y compris la réponse 429
+        if self.is_rate_limited_method(request):
+            limit = await aget_limit(self.rate_limit)
+            if limit:
+                bucket = self.get_bucket(limit)
+                allowed, retry_after = await bucket.aconsume(get_client_ip(request))
+                await arecord_outcome(bucket.scope, allowed)
+                if not allowed:
+                    return self.rate_limited(request, retry_after)
+        return await super().dispatch(request, *args, **kwargs)
+
+    def rate_limited(self, request, retry_after):
+        if self.rate_limit_template:
+            response = render(request, self.rate_limit_template, {'retry_after': retry_after}, status=429)
+        else:
+            response = JsonResponse({
+                'success': False,
+                'message': 'Trop de requêtes, réessayez plus tard'
+            }, status=429)
+        response['Retry-After'] = str(retry_after)
+        return response
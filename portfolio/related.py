@@ -0,0 +1,288 @@
+"""Contenus liés : similarité TF-IDF entre articles, projets et collaborations, stockée dans RelatedContent"""
+import bisect
+import heapq
+import logging
+import math
+import re
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, F, Min, OuterRef, Q, Subquery
+from django.utils.text import slugify
+
+from .models import BlogPost, Collaboration, Project, RelatedContent
+
+logger = logging.getLogger(__name__)
+
+# Voisins conservés par contenu et par type de voisin
+RELATED_PER_KIND = getattr(settings, 'RELATED_CONTENT_PER_KIND', 3)
+# En dessous, deux contenus n'ont en commun que des mots courants
+MIN_SCORE = getattr(settings, 'RELATED_CONTENT_MIN_SCORE', 0.05)
+# Un tag ou une technologie partagés comptent plus qu'un mot du texte, un mot du titre plus qu'un mot du corps
+TAG_WEIGHT = 3
+TITLE_WEIGHT = 2
+# Un terme présent dans plus de la moitié des contenus ne distingue rien et allonge le calcul
+MAX_DOCUMENT_FREQUENCY = 0.5
+# Termes gardés par contenu (les plus pondérés) et contenus parcourus par terme (ceux où il pèse le plus) :
+# le calcul des voisins d'un contenu coûte au plus MAX_TERMS * MAX_POSTINGS, quelle que soit la taille du corpus
+MAX_TERMS = getattr(settings, 'RELATED_CONTENT_MAX_TERMS', 24)
+MAX_POSTINGS = getattr(settings, 'RELATED_CONTENT_MAX_POSTINGS', 100)
+# Index gardé en mémoire entre deux mises à jour incrémentales, reconstruit (IDF compris) après ce délai
+INDEX_TTL = getattr(settings, 'RELATED_CONTENT_INDEX_TTL', 60 * 60)
+
+WORD_RE = re.compile(r'\w{3,}')
+STOP_WORDS = frozenset("""
+    les des une aux par pour dans sur avec sans sous entre vers chez est sont été être avoir fait faire
+    plus moins très tout tous toute toutes cette ces son ses leur leurs nous vous ils elles qui que quoi
+    dont où mais donc car comme aussi ainsi alors même bien peu encore après avant pendant depuis
+    the and for with from that this these those are was were been have has had not but into over
+    under about than then them they their there which what when where who will would can could
+    should your our its also more most such only just very
+""".split())
+
+# Mise à jour incrémentale en série : deux recalculs simultanés écriraient les mêmes lignes
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='related-content')
+
+
+def _words(*texts):
+    return [word for text in texts if text for word in WORD_RE.findall(text.lower()) if word not in STOP_WORDS]
+
+
+def _terms(title, texts, tags):
+    terms = Counter(_words(*texts))
+    for word in _words(title):
+        terms[word] += TITLE_WEIGHT
+    for tag in tags:
+        slug = slugify(tag)
+        if slug:
+            terms[f'tag:{slug}'] += TAG_WEIGHT
+    return terms
+
+
+def _split(value):
+    return [part.strip() for part in (value or '').split(',') if part.strip()]
+
+
+def _blog_documents(pks=None):
+    posts = BlogPost.objects.filter(is_published=True).select_related('category').only(
+        'title', 'excerpt', 'content', 'tags', 'category__name'
+    )
+    if pks is not None:
+        posts = posts.filter(pk__in=pks)
+    for post in posts.iterator(chunk_size=500):
+        tags = _split(post.tags) + ([post.category.name] if post.category else [])
+        yield post.pk, _terms(post.title, [post.excerpt, post.content], tags)
+
+
+def _project_documents(pks=None):
+    projects = Project.objects.only('title', 'description', 'detailed_description', 'technologies', 'project_type')
+    if pks is not None:
+        projects = projects.filter(pk__in=pks)
+    for project in projects.iterator(chunk_size=500):
+        tags = _split(project.technologies) + [project.project_type]
+        yield project.pk, _terms(project.title, [project.description, project.detailed_description], tags)
+
+
+def _collaboration_documents(pks=None):
+    collaborations = Collaboration.objects.filter(is_active=True).only(
+        'title', 'description', 'detailed_description', 'technologies', 'category'
+    )
+    if pks is not None:
+        collaborations = collaborations.filter(pk__in=pks)
+    for collaboration in collaborations.iterator(chunk_size=500):
+        tags = _split(collaboration.technologies) + [collaboration.category]
+        yield collaboration.pk, _terms(
+            collaboration.title, [collaboration.description, collaboration.detailed_description], tags
+        )
+
+
+# Type -> (documents indexés, champs dont la modification change les voisins)
+SOURCES = {
+    'blogpost': (_blog_documents, {'title', 'excerpt', 'content', 'tags', 'category', 'is_published'}),
+    'project': (_project_documents, {'title', 'description', 'detailed_description', 'technologies', 'project_type'}),
+    'collaboration': (
+        _collaboration_documents, {'title', 'description', 'detailed_description', 'technologies', 'category', 'is_active'},
+    ),
+}
+
+
+class SimilarityIndex:
+    """
+    Vecteurs TF-IDF normalisés et index inversé de tous les contenus publiés.
+    Chaque liste de l'index est triée par poids décroissant (stocké négatif) :
+    seuls ses MAX_POSTINGS premiers contenus sont parcourus.
+    """
+
+    def __init__(self):
+        documents = {
+            (kind, pk): terms for kind, (documents, _) in SOURCES.items() for pk, terms in documents()
+        }
+        frequencies = Counter(term for terms in documents.values() for term in terms)
+        self.count = len(documents)
+        self.idf, self.common = {}, set()
+        for term, frequency in frequencies.items():
+            # Un petit corpus garde tous ses termes
+            if self.count < 10 or frequency <= MAX_DOCUMENT_FREQUENCY * self.count:
+                self.idf[term] = math.log((1 + self.count) / (1 + frequency)) + 1
+            else:
+                self.common.add(term)
+        self.built_at = time.monotonic()
+
+        self.vectors = {key: self.vector(terms) for key, terms in documents.items()}
+        self.postings = defaultdict(list)
+        for key, vector in self.vectors.items():
+            for term, weight in vector.items():
+                self.postings[term].append((-weight, key))
+        for entries in self.postings.values():
+            entries.sort()
+
+    def vector(self, terms):
+        """Les MAX_TERMS termes les plus pondérés, normalisés ; un terme absent de l'IDF compte comme rare"""
+        rare = math.log((1 + self.count) / 2) + 1
+        weights = {
+            term: (1 + math.log(value)) * self.idf.get(term, rare)
+            for term, value in terms.items() if term not in self.common
+        }
+        weights = dict(heapq.nlargest(MAX_TERMS, weights.items(), key=lambda item: (item[1], item[0])))
+        norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1
+        return {term: weight / norm for term, weight in weights.items()}
+
+    def update(self, kind, pk):
+        """Relit un seul contenu modifié, ou le retire s'il n'est plus publié ; l'IDF est conservé"""
+        key = (kind, pk)
+        for term, weight in self.vectors.pop(key, {}).items():
+            entries = self.postings[term]
+            index = bisect.bisect_left(entries, (-weight, key))
+            if index < len(entries) and entries[index][1] == key:
+                del entries[index]
+        for _, terms in SOURCES[kind][0]([pk]):
+            self.vectors[key] = self.vector(terms)
+            for term, weight in self.vectors[key].items():
+                bisect.insort(self.postings[term], (-weight, key))
+
+    def similarities(self, key):
+        """Similarité cosinus de key avec les contenus qui partagent un terme, parmi les mieux placés de chaque terme"""
+        scores = defaultdict(float)
+        for term, weight in self.vectors.get(key, {}).items():
+            for other_weight, other in islice(self.postings.get(term, ()), MAX_POSTINGS):
+                if other != key:
+                    scores[other] -= weight * other_weight
+        return scores
+
+    def neighbours(self, key):
+        """Lignes RelatedContent de key : les RELATED_PER_KIND plus proches de chaque type"""
+        by_kind = defaultdict(list)
+        for (kind, pk), score in self.similarities(key).items():
+            if score >= MIN_SCORE:
+                by_kind[kind].append((score, pk))
+        return [
+            RelatedContent(
+                source_kind=key[0], source_id=key[1], target_kind=kind, target_id=pk,
+                score=round(score, 6), rank=rank,
+            )
+            for kind, candidates in by_kind.items()
+            for rank, (score, pk) in enumerate(heapq.nlargest(RELATED_PER_KIND, candidates, key=lambda c: (c[0], -c[1])))
+        ]
+
+
+_index = None
+
+
+def get_index():
+    """Index de ce processus, relu entièrement au plus toutes les INDEX_TTL secondes"""
+    global _index
+    if _index is None or time.monotonic() - _index.built_at > INDEX_TTL:
+        _index = SimilarityIndex()
+    return _index
+
+
+def rebuild_related_content():
+    """Recalcule toute la table ; retourne le nombre de lignes écrites"""
+    global _index
+    index = _index = SimilarityIndex()
+    rows = [row for key in index.vectors for row in index.neighbours(key)]
+    with transaction.atomic():
+        RelatedContent.objects.all().delete()
+        RelatedContent.objects.bulk_create(rows, batch_size=2000)
+    return len(rows)
+
+
+def refresh_related_content(kind, pk):
+    """
+    Met à jour les voisins d'un contenu modifié ou supprimé, ainsi que ceux des
+    contenus qu'il rejoint ou quitte. Seul ce contenu est relu : l'index du
+    processus est réutilisé, et build_related_content corrige la lente dérive
+    des poids IDF et les modifications traitées par d'autres processus.
+    """
+    index = get_index()
+    index.update(kind, pk)
+    key = (kind, pk)
+    affected = {key}
+    # Contenus qui le citaient parmi leurs voisins
+    affected.update(
+        RelatedContent.objects.filter(target_kind=kind, target_id=pk).values_list('source_kind', 'source_id')
+    )
+    # Contenus dont il dépasse désormais le dernier voisin de ce type, lus parmi les seuls candidats
+    candidates = {other: score for other, score in index.similarities(key).items() if score >= MIN_SCORE}
+    by_kind = defaultdict(list)
+    for other_kind, other_id in candidates:
+        by_kind[other_kind].append(other_id)
+    lowest = {}
+    if by_kind:
+        sources = Q()
+        for other_kind, ids in by_kind.items():
+            sources |= Q(source_kind=other_kind, source_id__in=ids)
+        lowest = {
+            (row['source_kind'], row['source_id']): (row['lowest'], row['count'])
+            for row in RelatedContent.objects.filter(sources, target_kind=kind).values('source_kind', 'source_id')
+            .annotate(lowest=Min('score'), count=Count('pk'))
+        }
+    for other, score in candidates.items():
+        floor, count = lowest.get(other, (0, 0))
+        if count < RELATED_PER_KIND or score > floor:
+            affected.add(other)
+
+    with transaction.atomic():
+        for source_kind, source_id in affected:
+            RelatedContent.objects.filter(source_kind=source_kind, source_id=source_id).delete()
+        RelatedContent.objects.bulk_create(
+            [row for other in affected if other in index.vectors for row in index.neighbours(other)],
+            batch_size=2000,
+        )
+    return len(affected)
+
+
+def _refresh_safely(kind, pk):
+    try:
+        refresh_related_content(kind, pk)
+    except Exception:
+        logger.exception("Échec de la mise à jour des contenus liés de %s %s", kind, pk)
+    finally:
+        connection.close()
+
+
+def schedule_refresh(kind, pk, update_fields=None):
+    """Recalcule les voisins en arrière-plan une fois la transaction validée"""
+    if update_fields and not set(update_fields) & SOURCES[kind][1]:
+        return
+    transaction.on_commit(lambda: _executor.submit(_refresh_safely, kind, pk))
+
+
+def related_to(obj, queryset, limit=RELATED_PER_KIND, fallback=None):
+    """
+    Voisins précalculés de obj parmi queryset, du plus proche au plus éloigné, en une requête.
+    fallback complète la liste (voisins pas encore calculés) dans l'ordre par défaut de queryset.
+    """
+    neighbours = RelatedContent.objects.filter(
+        source_kind=obj._meta.model_name, source_id=obj.pk, target_kind=queryset.model._meta.model_name,
+    )
+    condition = Q(pk__in=neighbours.values('target_id'))
+    if fallback is not None:
+        condition |= fallback
+    return queryset.filter(condition).annotate(
+        related_rank=Subquery(neighbours.filter(target_id=OuterRef('pk')).values('rank')[:1])
+    ).order_by(F('related_rank').asc(nulls_last=True), *queryset.model._meta.ordering)[:limit]
@@ -0,0 +1,64 @@
+"""Service worker généré à partir du manifeste des fichiers statiques"""
+import hashlib
+import json
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.template.loader import render_to_string
+
+from .assets import ASSET_BUNDLES
+
+SERVICE_WORKER_NAME = 'sw.js'
+SERVICE_WORKER_TEMPLATE = 'portfolio/sw.js'
+SERVICE_WORKER_MAX_PAGES = getattr(settings, 'SERVICE_WORKER_MAX_PAGES', 50)
+SERVICE_WORKER_NO_CACHE_PREFIXES = getattr(settings, 'SERVICE_WORKER_NO_CACHE_PREFIXES', [
+    '/admin', '/admin-dashboard', '/admin-customization', '/analytics', '/i18n/',
+    '/contact', '/testimonials/add', '/download-cv', '/media-thumb',
+])
+# Préfixes des fichiers statiques mis en cache dès l'installation
+PRECACHE_PREFIXES = ('css/', 'js/', 'fonts/', 'icons/')
+PRECACHE_EXTENSIONS = ('.css', '.js', '.woff2', '.svg', '.png', '.json')
+# Réservés au tableau de bord : inutile de les imposer à chaque visiteur
+PRECACHE_EXCLUDED = ('css/dashboard.css', 'js/dashboard.js')
+
+
+def precache_names(hashed_files=None):
+    """Noms (hachés si possible) à précharger, regroupements plutôt que leurs sources"""
+    bundled_sources = {source for sources in ASSET_BUNDLES.values() for source in sources}
+    if hashed_files:
+        names = [
+            hashed for name, hashed in hashed_files.items()
+            if name.startswith(PRECACHE_PREFIXES) and name.endswith(PRECACHE_EXTENSIONS)
+            and name not in bundled_sources and name not in PRECACHE_EXCLUDED
+        ]
+        if 'manifest.json' in hashed_files:
+            names.append(hashed_files['manifest.json'])
+        return sorted(set(names))
+    # Développement : pas de manifeste, les sources sont servies séparément
+    return sorted(bundled_sources | {'manifest.json'})
+
+
+def build_service_worker(hashed_files=None):
+    """
+    Contenu de sw.js. La version dérive des URL préchargées : elle change dès
+    qu'un fichier haché change, ce qui invalide les anciens caches à l'activation.
+    """
+    urls = [settings.STATIC_URL + name for name in precache_names(hashed_files)]
+    version = hashlib.sha256('\n'.join(urls).encode()).hexdigest()[:12]
+    return render_to_string(SERVICE_WORKER_TEMPLATE, {
+        'version': version,
+        'static_url': settings.STATIC_URL,
+        'precache_urls': json.dumps(['/'] + urls),
+        'max_pages': SERVICE_WORKER_MAX_PAGES,
+        'no_cache_prefixes': json.dumps(SERVICE_WORKER_NO_CACHE_PREFIXES),
+        # Préfixes d'i18n_patterns, retirés avant de comparer un chemin aux préfixes ci-dessus
+        'language_codes': json.dumps([code for code, _ in settings.LANGUAGES if code != settings.LANGUAGE_CODE]),
+    })
+
+
+def get_service_worker():
+    """sw.js écrit par collectstatic, ou généré à la volée sans manifeste (développement)"""
+    if staticfiles_storage.exists(SERVICE_WORKER_NAME) and getattr(staticfiles_storage, 'hashed_files', None):
+        with staticfiles_storage.open(SERVICE_WORKER_NAME) as handle:
+            return handle.read().decode('utf-8')
+    return build_service_worker()
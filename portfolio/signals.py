@@ -0,0 +1,110 @@
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .images import IMAGE_FIELDS, schedule_derivatives
+from .models import (
+    Profile, Experience, Project, Certification, Skill, Testimonial, SiteCustomization, SiteSettings,
+    BlogPost, Collaboration, FAQ
+)
+from .ratelimit import invalidate_configured_limits
+from .related import schedule_refresh
+from .sitemaps import SITEMAP_IGNORED_FIELDS, invalidate_sitemaps
+from .theme import write_stylesheet
+from .uploads import schedule_normalization
+
+# Modèle source -> statistiques dérivées du profil qui en dépendent
+PROFILE_STATS_SOURCES = {
+    Experience: ('career_start_date',),
+    Project: ('projects_total',),
+    Certification: ('certifications_total',),
+    Skill: ('skills_total',),
+}
+
+
+@receiver([post_save, post_delete], sender=Experience)
+@receiver([post_save, post_delete], sender=Project)
+@receiver([post_save, post_delete], sender=Certification)
+@receiver([post_save, post_delete], sender=Skill)
+def refresh_profile_stats(sender, raw=False, **kwargs):
+    """Recalcule uniquement les statistiques du profil touchées par ce modèle"""
+    if raw:
+        return
+    Profile.refresh_derived_stats(*PROFILE_STATS_SOURCES[sender])
+
+
+@receiver(post_save, sender=Profile)
+def initialize_profile_stats(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        Profile.refresh_derived_stats()
+
+
+def generate_image_derivatives(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Déclinaisons responsives des images, calculées hors de la requête"""
+    if raw:
+        return
+    for model_name, field_name in IMAGE_FIELDS:
+        # Un enregistrement partiel sans l'image (compteur de vues...) ne la change pas
+        if sender._meta.object_name == model_name and (update_fields is None or field_name in update_fields):
+            name = getattr(instance, field_name).name
+            # Une image en attente de normalisation aura ses déclinaisons ensuite
+            if name and field_name not in getattr(instance, '_normalize_image_fields', ()):
+                transaction.on_commit(lambda name=name: schedule_derivatives(name))
+
+
+for model_name, _ in IMAGE_FIELDS:
+    post_save.connect(
+        generate_image_derivatives,
+        sender=apps.get_model('portfolio', model_name),
+        dispatch_uid=f'image_derivatives_{model_name}',
+    )
+
+
+@receiver(post_save, sender=Testimonial)
+@receiver(post_save, sender=SiteCustomization)
+def normalize_uploaded_images(sender, instance, raw=False, **kwargs):
+    """Normalise les images marquées par NormalizedImageFormMixin"""
+    if raw:
+        return
+    for field_name in getattr(instance, '_normalize_image_fields', ()):
+        schedule_normalization(instance, field_name)
+    instance._normalize_image_fields = ()
+
+
+@receiver([post_save, post_delete], sender=SiteCustomization)
+def compile_site_stylesheet(sender, raw=False, **kwargs):
+    """Recompile la feuille de style du thème actif une fois la transaction validée"""
+    if raw:
+        return
+    transaction.on_commit(
+        lambda: write_stylesheet(SiteCustomization.objects.filter(is_active=True).first())
+    )
+
+
+@receiver([post_save, post_delete], sender=SiteSettings)
+def reload_rate_limits(sender, **kwargs):
+    """Les vues relisent les limites de débit modifiées dans l'admin"""
+    invalidate_configured_limits()
+
+
+@receiver([post_save, post_delete], sender=Profile)
+@receiver([post_save, post_delete], sender=Project)
+@receiver([post_save, post_delete], sender=BlogPost)
+@receiver([post_save, post_delete], sender=Collaboration)
+@receiver([post_save, post_delete], sender=FAQ)
+def refresh_sitemaps(sender, update_fields=None, **kwargs):
+    """Régénère les sitemaps après une modification de contenu, pas après un compteur de vues"""
+    if update_fields and set(update_fields) <= SITEMAP_IGNORED_FIELDS:
+        return
+    invalidate_sitemaps()
+
+
+@receiver([post_save, post_delete], sender=BlogPost)
+@receiver([post_save, post_delete], sender=Project)
+@receiver([post_save, post_delete], sender=Collaboration)
+def refresh_related_content(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Voisins du contenu et de ceux qu'il rejoint ou quitte, recalculés hors de la requête"""
+    if raw:
+        return
+    schedule_refresh(sender._meta.model_name, instance.pk, update_fields)
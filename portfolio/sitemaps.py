@@ -1,34 +1,183 @@
+"""Sitemaps par section, déclinés en fr/en/ar avec liens hreflang, et leur cache"""
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
 from django.contrib.sitemaps import Sitemap
+from django.contrib.sitemaps import views as sitemap_views
+from django.core.cache import cache
+from django.db.models import Max
+from django.http import HttpResponse
 from django.urls import reverse
-from .models import Project
-from datetime import datetime
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+
+from .models import BlogPost, Collaboration, FAQ, Profile, Project
+
+# URLs par page de sitemap (maximum du protocole : 50 000), langues comprises
+SITEMAP_LIMIT = getattr(settings, 'SITEMAP_LIMIT', 10000)
+# Le cache est invalidé à chaque modification de contenu ; le délai couvre les caches propres à chaque processus
+SITEMAP_CACHE_TTL = getattr(settings, 'SITEMAP_CACHE_TTL', 60 * 60)
+SITEMAP_VERSION_CACHE_KEY = 'sitemap:version'
+# Compteurs modifiés à chaque consultation : sans effet sur le sitemap
+SITEMAP_IGNORED_FIELDS = frozenset({'views_count', 'helpful_votes'})
+
+
+def _published_posts():
+    return BlogPost.objects.filter(is_published=True)
+
+
+def _active_faqs():
+    return FAQ.objects.filter(is_active=True)
+
+
+def _active_collaborations():
+    return Collaboration.objects.filter(is_active=True)
+
+
+# Page statique -> contenus affichés dont la dernière modification date la page ;
+# une page sans contenu daté n'a pas de lastmod plutôt qu'une date inventée
+STATIC_PAGES = {
+    'portfolio:home': (Profile.objects.all, Project.objects.all, _published_posts),
+    'portfolio:academic': (),
+    'portfolio:experience': (),
+    'portfolio:certifications': (),
+    'portfolio:projects': (Project.objects.all,),
+    'portfolio:blog': (_published_posts,),
+    'portfolio:services': (),
+    'portfolio:faq': (_active_faqs,),
+    'portfolio:timeline': (),
+    'portfolio:resources': (),
+    'portfolio:achievements': (),
+    'portfolio:testimonials': (),
+    'portfolio:contact': (Profile.objects.all,),
+}
+
+
+def latest_update(*querysets):
+    dates = [
+        queryset.aggregate(latest=Max('updated_at'))['latest'] for queryset in querysets
+    ]
+    dates = [date for date in dates if date]
+    return max(dates) if dates else None
 
-class StaticViewSitemap(Sitemap):
+
+class PortfolioSitemap(Sitemap):
+    """Une entrée par langue de LANGUAGES, chacune avec ses alternatives hreflang"""
+    i18n = True
+    alternates = True
+    x_default = True
+    limit = SITEMAP_LIMIT
+
+
+class StaticViewSitemap(PortfolioSitemap):
     priority = 0.8
     changefreq = 'weekly'
-    
+    pages = STATIC_PAGES
+
+    def __init__(self):
+        self._lastmods = {}
+
     def items(self):
-        return [
-            'portfolio:home',
-            'portfolio:academic', 
-            'portfolio:experience',
-            'portfolio:certifications',
-            'portfolio:projects',
-            'portfolio:contact'
-        ]
-    
+        return list(self.pages)
+
     def location(self, item):
         return reverse(item)
-    
+
     def lastmod(self, item):
-        return datetime.now()
+        # Chaque page est datée une fois, quel que soit le nombre de langues
+        if item not in self._lastmods:
+            self._lastmods[item] = latest_update(*(source() for source in self.pages[item]))
+        return self._lastmods[item]
+
+    def get_latest_lastmod(self):
+        dates = [date for date in map(self.lastmod, self.items()) if date]
+        return max(dates) if dates else None
+
+
+class ModelSitemap(PortfolioSitemap):
+    """Objets d'un modèle datés par updated_at ; seuls les champs utiles sont chargés"""
+
+    def get_queryset(self):
+        raise NotImplementedError
 
-class ProjectSitemap(Sitemap):
-    changefreq = 'monthly'
-    priority = 0.6
-    
     def items(self):
-        return Project.objects.all()
-    
+        # Ordre total : la pagination de l'index reste stable
+        return self.get_queryset().order_by('pk')
+
     def lastmod(self, obj):
-        return obj.start_date
\ No newline at end of file
+        return obj.updated_at
+
+    def get_latest_lastmod(self):
+        return self.get_queryset().aggregate(latest=Max('updated_at'))['latest']
+
+
+class ProjectSitemap(ModelSitemap):
+    changefreq = 'monthly'
+    priority = 0.6
+
+    def get_queryset(self):
+        return Project.objects.only('pk', 'updated_at')
+
+
+class BlogSitemap(ModelSitemap):
+    changefreq = 'monthly'
+    priority = 0.7
+
+    def get_queryset(self):
+        return _published_posts().only('pk', 'slug', 'updated_at')
+
+
+class CollaborationSitemap(StaticViewSitemap):
+    """Les collaborations n'ont pas de page de détail : leur liste, datée par la plus récente"""
+    priority = 0.5
+    changefreq = 'monthly'
+    pages = {'portfolio:collaborations': (_active_collaborations,)}
+
+
+SITEMAPS = {
+    'static': StaticViewSitemap,
+    'projects': ProjectSitemap,
+    'blog': BlogSitemap,
+    'collaborations': CollaborationSitemap,
+}
+
+
+def invalidate_sitemaps():
+    # Nouvelle version : les réponses en cache ne sont plus lues et expirent d'elles-mêmes
+    cache.set(SITEMAP_VERSION_CACHE_KEY, time.time_ns(), None)
+
+
+def _cached(view):
+    """Réponse mise en cache jusqu'à la prochaine modification de contenu"""
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        version = cache.get_or_set(SITEMAP_VERSION_CACHE_KEY, time.time_ns, None)
+        key = 'sitemap:{}:{}:{}:{}:{}'.format(
+            version, request.scheme, request.get_host(), kwargs.get('section', 'index'), request.GET.get('p', 1),
+        )
+        cached = cache.get(key)
+        if cached is None:
+            response = view(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            response.render()
+            cached = (response.content, response['Content-Type'], response.get('Last-Modified'))
+            cache.set(key, cached, SITEMAP_CACHE_TTL)
+
+        content, content_type, last_modified = cached
+        etag = quote_etag(hashlib.md5(content).hexdigest())
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(content, content_type=content_type)
+        response['ETag'] = etag
+        response['X-Robots-Tag'] = 'noindex, noodp, noarchive'
+        if last_modified:
+            response['Last-Modified'] = last_modified
+        return response
+    return wrapper
+
+
+index = _cached(sitemap_views.index)
+sitemap = _cached(sitemap_views.sitemap)
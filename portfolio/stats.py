@@ -0,0 +1,146 @@
+"""Statistiques agrégées du tableau de bord, calculées en un minimum d'allers-retours SQL"""
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count, F, Func
+from django.utils import timezone
+
+from .models import (
+    Profile, Project, Experience, Skill, BlogPost, Contact, Testimonial, VisitorStats
+)
+
+DASHBOARD_STATS_CACHE_KEY = 'portfolio:dashboard_stats'
+PUBLIC_STATS_CACHE_KEY = 'portfolio:public_stats'
+
+# Au-delà de DASHBOARD_STATS_TTL les valeurs sont servies telles quelles pendant
+# qu'un thread les recalcule ; elles expirent réellement après STALE_TTL.
+DASHBOARD_STATS_TTL = getattr(settings, 'DASHBOARD_STATS_TTL', 60)
+DASHBOARD_STATS_STALE_TTL = getattr(settings, 'DASHBOARD_STATS_STALE_TTL', 15 * 60)
+PUBLIC_STATS_TTL = getattr(settings, 'PUBLIC_STATS_TTL', 5 * 60)
+PUBLIC_STATS_STALE_TTL = getattr(settings, 'PUBLIC_STATS_STALE_TTL', 60 * 60)
+
+
+class _CountDistinct(Func):
+    function = 'COUNT'
+    template = '%(function)s(DISTINCT %(expressions)s)'
+
+
+def _count(queryset, expression=None):
+    """Sous-requête scalaire COUNT(...) sans GROUP BY"""
+    expression = expression or Func(F('pk'), function='COUNT')
+    return queryset.order_by().values(value=expression).query.sql_with_params()
+
+
+def _fetch_counts(counters):
+    """Exécute un dictionnaire de sous-requêtes COUNT en un seul aller-retour"""
+    sql = 'SELECT ' + ', '.join(f'({query})' for query, _ in counters.values())
+    params = [param for _, query_params in counters.values() for param in query_params]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        row = cursor.fetchone()
+    return {name: value or 0 for name, value in zip(counters, row)}
+
+
+def compute_dashboard_stats():
+    """Calcule tous les compteurs du tableau de bord en une seule requête"""
+    since = timezone.now() - timedelta(days=30)
+    recent_visits = VisitorStats.objects.filter(visit_date__gte=since)
+
+    counters = {
+        'total_projects': _count(Project.objects.all()),
+        'total_experiences': _count(Experience.objects.all()),
+        'total_skills': _count(Skill.objects.all()),
+        'published_posts': _count(BlogPost.objects.filter(is_published=True)),
+        'total_contacts': _count(Contact.objects.all()),
+        'unread_contacts': _count(Contact.objects.filter(is_read=False)),
+        'total_testimonials': _count(Testimonial.objects.all()),
+        'pending_testimonials': _count(Testimonial.objects.filter(is_approved=False)),
+        'recent_visits': _count(recent_visits),
+        'unique_visitors': _count(recent_visits, _CountDistinct(F('ip_address'))),
+    }
+
+    stats = _fetch_counts(counters)
+    stats['popular_pages'] = list(
+        VisitorStats.objects.values('page_visited').annotate(
+            count=Count('id')
+        ).order_by('-count')[:5]
+    )
+    return stats
+
+
+def _refresh_in_background(cache_key, compute, stale_ttl, lock_timeout):
+    # Un seul rafraîchissement à la fois, tous processus confondus
+    lock_key = f'{cache_key}:refreshing'
+    if not cache.add(lock_key, True, lock_timeout):
+        return
+
+    def run():
+        try:
+            _store(cache_key, compute(), stale_ttl)
+        finally:
+            cache.delete(lock_key)
+            connection.close()
+
+    threading.Thread(target=run, name=f'refresh-{cache_key}', daemon=True).start()
+
+
+def _store(cache_key, value, stale_ttl):
+    cache.set(cache_key, (time.time(), value), stale_ttl)
+    return value
+
+
+def get_or_refresh(cache_key, compute, ttl, stale_ttl):
+    """Valeur en cache, servie périmée pendant son recalcul en arrière-plan"""
+    cached = cache.get(cache_key)
+    if cached is None:
+        return _store(cache_key, compute(), stale_ttl)
+
+    computed_at, value = cached
+    if time.time() - computed_at > ttl:
+        _refresh_in_background(cache_key, compute, stale_ttl, ttl)
+    return value
+
+
+def get_dashboard_stats():
+    """Statistiques du tableau de bord (cache court, rafraîchi en arrière-plan)"""
+    return get_or_refresh(
+        DASHBOARD_STATS_CACHE_KEY, compute_dashboard_stats,
+        DASHBOARD_STATS_TTL, DASHBOARD_STATS_STALE_TTL,
+    )
+
+
+def compute_public_stats():
+    """Instantané des statistiques publiques exposées par /api/stats/"""
+    since = timezone.now() - timedelta(days=7)
+    profile = Profile.objects.first()
+    if profile:
+        # Compteurs dénormalisés sur le profil (voir Profile.refresh_derived_stats)
+        stats = _fetch_counts({
+            'recent_visits': _count(VisitorStats.objects.filter(visit_date__gte=since)),
+        })
+        stats.update({
+            'total_projects': profile.projects_total,
+            'total_skills': profile.skills_total,
+            'experience_years': profile.years_of_experience,
+        })
+        return stats
+
+    stats = _fetch_counts({
+        'total_projects': _count(Project.objects.all()),
+        'total_skills': _count(Skill.objects.all()),
+        'recent_visits': _count(VisitorStats.objects.filter(visit_date__gte=since)),
+    })
+    stats['experience_years'] = 0
+    return stats
+
+
+def get_public_stats():
+    """Statistiques publiques, recalculées au plus une fois par PUBLIC_STATS_TTL"""
+    return get_or_refresh(
+        PUBLIC_STATS_CACHE_KEY, compute_public_stats,
+        PUBLIC_STATS_TTL, PUBLIC_STATS_STALE_TTL,
+    )
@@ -0,0 +1,56 @@
+"""Stockage des fichiers statiques : noms hachés, regroupements minifiés et variantes précompressées"""
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+from .assets import ASSET_BUNDLES, COMPRESSIBLE_EXTENSIONS, build_bundle, minify, precompress
+from .serviceworker import SERVICE_WORKER_NAME, build_service_worker
+
+
+class BundledManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Pendant collectstatic : minifie les CSS/JS, construit ASSET_BUNDLES, laisse
+    ManifestStaticFilesStorage ajouter le hachage du contenu aux noms, écrit
+    les variantes .gz et .br des fichiers hachés puis génère sw.js.
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        if dry_run:
+            yield from super().post_process(paths, dry_run, **options)
+            return
+
+        minified = {}
+        for name in list(paths):
+            if name.endswith(('.css', '.js')):
+                source_storage, path = paths[name]
+                with source_storage.open(path) as handle:
+                    minified[name] = minify(name, handle.read().decode('utf-8'))
+                self._replace(name, minified[name])
+                # Le hachage est calculé sur la version minifiée déjà copiée dans STATIC_ROOT
+                paths[name] = (self, name)
+
+        for bundle, sources in ASSET_BUNDLES.items():
+            missing = [source for source in sources if source not in minified]
+            if missing:
+                yield bundle, None, RuntimeError(f"Fichiers absents du regroupement {bundle} : {', '.join(missing)}")
+                continue
+            self._replace(bundle, build_bundle(bundle, [minified[source] for source in sources]))
+            paths[bundle] = (self, bundle)
+
+        yield from super().post_process(paths, dry_run, **options)
+
+        for name in set(self.hashed_files.values()):
+            if name.endswith(COMPRESSIBLE_EXTENSIONS) and self.exists(name):
+                with self.open(name) as handle:
+                    data = handle.read()
+                for suffix, compressed in precompress(data).items():
+                    self._replace(name + suffix, compressed)
+
+        # Non haché : son URL doit rester stable pour que le navigateur détecte la nouvelle version
+        self._replace(SERVICE_WORKER_NAME, build_service_worker(self.hashed_files))
+
+    def _replace(self, name, content):
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        if self.exists(name):
+            self.delete(name)
+        self._save(name, ContentFile(content))
@@ -1,80 +1,136 @@
+import functools
+import time
+from datetime import date
+
 from django import template
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.files.storage import default_storage
+from django.urls import reverse
+from django.utils.html import format_html, format_html_join
 from django.utils.safestring import mark_safe
-import re
+from portfolio.assets import ASSET_BUNDLES
+from portfolio.fonts import vendored_url
+from portfolio.critical_css import defer_stylesheets, is_enabled as critical_css_enabled, load_critical_css
+from portfolio.images import load_manifest
+from portfolio.markup import render_markdown
+from portfolio.storage import BundledManifestStaticFilesStorage
+from portfolio.theme import stylesheet_url
 
 register = template.Library()
 
+# Résultats de |split conservés par processus : les mêmes chaînes (technologies, tags) reviennent à chaque rendu
+SPLIT_CACHE_SIZE = 2048
+
+SKILL_PERCENTAGES = {
+    'beginner': 25,
+    'intermediate': 50,
+    'advanced': 75,
+    'expert': 100,
+}
+
+
+@functools.lru_cache(maxsize=SPLIT_CACHE_SIZE)
+def _split(value, delimiter):
+    return tuple(item for item in (part.strip() for part in value.split(delimiter)) if item)
+
+
 @register.filter
 def split(value, delimiter=','):
-    """Split a string by delimiter"""
-    if value:
-        return value.split(delimiter)
-    return []
+    """Split a string by delimiter into stripped, non-empty items"""
+    if not value:
+        return ()
+    return _split(str(value), delimiter)
+
 
 @register.filter
 def trim(value):
-    """Remove whitespace from string"""
-    if value:
-        return value.strip()
-    return value
+    """Remove surrounding whitespace"""
+    if value is None:
+        return ''
+    return str(value).strip()
+
 
 @register.filter
 def markdown_to_html(value):
-    """Convert basic markdown to HTML"""
+    """Convert markdown to sanitized HTML (prefer the stored rendering, see |rendered)"""
     if not value:
         return value
-    
-    # Convert **bold** to <strong>
-    value = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', value)
-    
-    # Convert *italic* to <em>
-    value = re.sub(r'\*(.*?)\*', r'<em>\1</em>', value)
-    
-    # Convert [link](url) to <a>
-    value = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2" target="_blank">\1</a>', value)
-    
-    # Convert line breaks
-    value = value.replace('\n', '<br>')
-    
-    return mark_safe(value)
+    return mark_safe(render_markdown(value)[0])
+
 
 @register.filter
-def duration(start_date, end_date=None):
-    """Calculate duration between two dates"""
-    from datetime import date
-    
-    if not start_date:
-        return ""
-    
-    if not end_date:
-        end_date = date.today()
-    
-    years = end_date.year - start_date.year
-    months = end_date.month - start_date.month
-    
-    if months < 0:
-        years -= 1
-        months += 12
-    
+def rendered(instance, field_name):
+    """HTML stored at save time for a markdown field, e.g. {{ post|rendered:"content" }}"""
+    html = getattr(instance, f'{field_name}_html', '')
+    if not html and getattr(instance, field_name, ''):
+        # Ligne antérieure au rendu à l'enregistrement, pas encore traitée par render_markdown_fields
+        html = render_markdown(getattr(instance, field_name))[0]
+    return mark_safe(html)
+
+
+@register.filter
+def table_of_contents(instance, field_name):
+    """Table of contents stored alongside a markdown field"""
+    toc = getattr(instance, f'{field_name}_toc', '')
+    if not toc and not getattr(instance, f'{field_name}_html', '') and getattr(instance, field_name, ''):
+        toc = render_markdown(getattr(instance, field_name))[1]
+    return mark_safe(toc)
+
+_today = {'date': None, 'expires': 0}
+
+
+def today():
+    """date.today(), relue au plus une fois par minute"""
+    now = time.monotonic()
+    if now >= _today['expires']:
+        _today.update(date=date.today(), expires=now + 60)
+    return _today['date']
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_duration(start_date, end_date):
+    months = (end_date.year - start_date.year) * 12 + end_date.month - start_date.month
+    years, months = divmod(max(months, 0), 12)
     if years > 0 and months > 0:
         return f"{years} an{'s' if years > 1 else ''} et {months} mois"
     elif years > 0:
         return f"{years} an{'s' if years > 1 else ''}"
     elif months > 0:
         return f"{months} mois"
-    else:
-        return "Moins d'un mois"
+    return "Moins d'un mois"
+
+
+@register.filter
+def duration(start_date, end_date=None):
+    """Calculate duration between two dates (until today by default)"""
+    if not start_date:
+        return ""
+    return _format_duration(start_date, end_date or today())
+
 
 @register.simple_tag
 def get_skill_percentage(proficiency):
     """Get percentage for skill proficiency"""
-    percentages = {
-        'beginner': 25,
-        'intermediate': 50,
-        'advanced': 75,
-        'expert': 100,
-    }
-    return percentages.get(proficiency, 0)
+    return SKILL_PERCENTAGES.get(proficiency, 0)
+
+
+@register.filter
+def filesizeformat_custom(bytes_value):
+    """Format file size in human readable format"""
+    if not bytes_value:
+        return "0 B"
+
+    try:
+        bytes_value = int(bytes_value)
+    except (ValueError, TypeError):
+        return "0 B"
+
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if bytes_value < 1024.0:
+            return f"{bytes_value:.1f} {unit}"
+        bytes_value /= 1024.0
+    return f"{bytes_value:.1f} TB"
+
 
 @register.inclusion_tag('portfolio/includes/social_links.html')
 def social_links(profile, size='normal'):
@@ -84,7 +140,90 @@ def social_links(profile, size='normal'):
         'size': size
     }
 
+
 @register.inclusion_tag('portfolio/includes/skill_badge.html')
 def skill_badge(skill):
     """Render skill badge with progress"""
-    return {'skill': skill}
\ No newline at end of file
+    return {'skill': skill}
+
+
+@register.simple_tag
+def responsive_image(image, alt='', sizes='100vw', css_class='', loading='lazy', **attrs):
+    """Render a <picture> with AVIF/WebP srcsets, falling back to the original image"""
+    if not image:
+        return ''
+
+    extra = format_html_join('', ' {}="{}"', [(key.replace('_', '-'), value) for key, value in attrs.items()])
+    manifest = load_manifest(image.name)
+    img = format_html(
+        '<img src="{}" alt="{}" class="{}" loading="{}" decoding="async"{}{}>',
+        image.url, alt, css_class, loading,
+        format_html(' width="{}" height="{}"', manifest['width'], manifest['height']) if manifest and 'width' not in attrs else '',
+        extra,
+    )
+    if not manifest:
+        return img
+
+    sources = format_html_join('', '<source type="image/{}" srcset="{}" sizes="{}">', [
+        (fmt, ', '.join(f'{default_storage.url(path)} {width}w' for width, path in variants), sizes)
+        for fmt, variants in manifest['variants'].items() if variants
+    ])
+    return format_html('<picture>{}{}</picture>', sources, img)
+
+
+@register.filter
+def thumbnail(image, spec):
+    """URL of a lazily generated thumbnail, e.g. {{ post.featured_image|thumbnail:"120x120-crop" }}"""
+    if not image:
+        return ''
+    return reverse('portfolio:thumbnail', args=[spec, image.name])
+
+
+@register.simple_tag
+def asset_bundle(name):
+    """Link a CSS/JS bundle: the collected, hashed bundle in production, its sources otherwise"""
+    if isinstance(staticfiles_storage, BundledManifestStaticFilesStorage):
+        names = [name]
+    else:
+        names = ASSET_BUNDLES[name]
+    template = '<script src="{}"></script>' if name.endswith('.js') else '<link rel="stylesheet" href="{}">'
+    return format_html_join('\n    ', template, [(staticfiles_storage.url(source),) for source in names])
+
+
+class CriticalStylesNode(template.Node):
+    def __init__(self, nodelist):
+        self.nodelist = nodelist
+
+    def render(self, context):
+        html = self.nodelist.render(context)
+        template_name = getattr(context.template, 'name', None)
+        critical = load_critical_css(template_name) if template_name and critical_css_enabled() else None
+        if not critical:
+            return html
+        css, covered_hrefs = critical
+        return format_html('<style>{}</style>', mark_safe(css)) + mark_safe(defer_stylesheets(html, covered_hrefs))
+
+
+@register.tag
+def critical_styles(parser, token):
+    """
+    Inline the page's critical CSS (see extract_critical_css) and turn the
+    enclosed stylesheet links into non-blocking preloads.
+    """
+    nodelist = parser.parse(('endcritical_styles',))
+    parser.delete_first_token()
+    return CriticalStylesNode(nodelist)
+
+
+@register.simple_tag
+def vendored_stylesheet(name, fallback_url):
+    """Self-hosted stylesheet produced by vendor_fonts, or the CDN URL until it exists"""
+    url = staticfiles_storage.url(name) if vendored_url(name) else fallback_url
+    return format_html('<link rel="stylesheet" href="{}">', url)
+
+
+@register.simple_tag
+def theme_stylesheet():
+    """Link the compiled, fingerprinted stylesheet of the active site customization"""
+    url = stylesheet_url()
+    return format_html('<link rel="stylesheet" href="{}">', url) if url else ''
@@ -0,0 +1,82 @@
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from portfolio.freeze import Freezer
+from portfolio.models import BlogPost, Profile, Project
+
+
+# Comme freeze_site : rendu sans cache ni statistiques de visite
+@override_settings(VISITOR_TRACKING=False, CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+class FreezeTests(TransactionTestCase):
+    """Export d'une petite base : les pages sont rendues par des threads, les données doivent être validées"""
+
+    def setUp(self):
+        output = tempfile.TemporaryDirectory()
+        self.addCleanup(output.cleanup)
+        self.output = Path(output.name)
+
+        Profile.objects.create(name='Freeze', title='Développeur', bio='Bio', email='freeze@example.com')
+        author = User.objects.create(username='freeze-author')
+        # bulk_create : aucun recalcul des contenus liés lancé en arrière-plan pendant le test
+        BlogPost.objects.bulk_create([
+            BlogPost(
+                title=f'Article {i}', slug=f'article-{i}', content=f'Contenu {i}', content_html=f'<p>Contenu {i}</p>',
+                tags='django, python', author=author, is_published=True,
+                published_at=timezone.now() - timedelta(days=i),
+            )
+            for i in range(8)
+        ])
+        Project.objects.bulk_create([
+            Project(title='Projet', description='Description', technologies='Python', start_date=date.today()),
+        ])
+
+    def freeze(self, incremental=False):
+        freezer = Freezer(self.output, 'http://testserver', workers=2, incremental=incremental)
+        pages = freezer.run([reverse('portfolio:blog')])
+        freezer.save(pages, [])
+        return pages
+
+    def read(self, name):
+        return (self.output / name / 'index.html').read_text(encoding='utf-8')
+
+    def test_query_links_become_paths(self):
+        self.freeze()
+        blog = self.read('blog')
+        # « Voir plus » du mode curseur et liens de tags
+        self.assertIn('href="/blog/page/2/"', blog)
+        self.assertIn('href="/blog/tag/django/"', blog)
+        self.assertNotIn('?tag=', blog)
+        self.assertNotIn('cursor=', blog)
+        self.assertTrue((self.output / 'blog/page/2/index.html').is_file())
+        self.assertTrue((self.output / 'blog/tag/django/index.html').is_file())
+
+    def test_language_switcher_becomes_links_without_csrf_tokens(self):
+        pages = self.freeze()
+        blog = self.read('blog')
+        self.assertNotIn('/i18n/setlang/', blog)
+        self.assertIn('href="/en/blog/"', blog)
+        self.assertIn('href="/ar/blog/"', blog)
+        for entry in pages.values():
+            if entry.get('file', '').endswith('.html'):
+                with self.subTest(file=entry['file']):
+                    self.assertNotIn('csrfmiddlewaretoken"', (self.output / entry['file']).read_text(encoding='utf-8'))
+
+    def test_incremental_run_rerenders_only_pages_reading_changed_tables(self):
+        first = self.freeze()
+        readers = {url for url, entry in first.items() if 'portfolio_blogpost' in entry.get('tables', ())}
+        self.assertIn(reverse('portfolio:blog'), readers)
+        self.assertLess(len(readers), len(first))
+
+        self.assertFalse(any(not entry.get('skipped') for entry in self.freeze(incremental=True).values()))
+
+        # update() : aucun signal, donc aucune autre table modifiée en arrière-plan
+        BlogPost.objects.filter(slug='article-0').update(title='Article modifié')
+        second = self.freeze(incremental=True)
+        self.assertEqual({url for url, entry in second.items() if not entry.get('skipped')}, readers)
+        self.assertIn('Article modifié', self.read('blog'))
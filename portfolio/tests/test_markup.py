@@ -0,0 +1,74 @@
+from django.test import SimpleTestCase
+
+from portfolio.markup import render_markdown
+
+
+class RenderMarkdownSafetyTests(SimpleTestCase):
+    """Le HTML stocké n'émet que les éléments produits par le rendu, jamais ceux de la source"""
+
+    def html(self, text):
+        return render_markdown(text)[0]
+
+    def test_raw_html_is_escaped(self):
+        html = self.html('<script>alert(1)</script>\n\n<img src=x onerror=alert(1)>')
+        self.assertNotIn('<script', html)
+        self.assertNotIn('<img', html)
+        self.assertIn('&lt;script&gt;alert(1)&lt;/script&gt;', html)
+
+    def test_unsafe_url_schemes_are_dropped_in_any_case(self):
+        urls = [
+            'javascript:alert(1)', 'JaVaScRiPt:alert(1)', 'data:text/html;base64,PHNjcmlwdD4=',
+            'DATA:text/html,x', 'vbscript:msgbox(1)', 'VBScript:msgbox(1)',
+            '\x01javascript:alert(1)', 'java\x1fscript:alert(1)',
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                html = self.html(f'[cliquer]({url})')
+                self.assertNotIn('<a', html)
+                self.assertNotIn('href', html)
+                self.assertIn('cliquer', html)
+
+    def test_entities_in_urls_stay_literal(self):
+        # La source est échappée avant la lecture des liens : « &#58; » n'est jamais décodé en « : »
+        self.assertEqual(
+            self.html('[x](javascript&#58;alert(1))'), '<p><a href="javascript&amp;#58;alert(1)">x</a></p>',
+        )
+
+    def test_safe_urls_become_links(self):
+        self.assertEqual(
+            self.html('[site](https://example.com/)'),
+            '<p><a href="https://example.com/" target="_blank" rel="noopener noreferrer">site</a></p>',
+        )
+        self.assertEqual(self.html('[page](/blog/)'), '<p><a href="/blog/">page</a></p>')
+        self.assertEqual(self.html('[écrire](mailto:a@example.com)'), '<p><a href="mailto:a@example.com">écrire</a></p>')
+
+    def test_link_text_cannot_break_out_of_attributes(self):
+        for text in [
+            '[x" onclick="alert(1)](https://example.com/)',
+            '![x" onerror="alert(1)](https://example.com/a.png)',
+            '[x](https://example.com/"onmouseover="alert(1))',
+            "[x](https://example.com/'onmouseover='alert(1))",
+        ]:
+            with self.subTest(text=text):
+                html = self.html(text)
+                self.assertNotIn('<img', html)
+                self.assertNotIn('" on', html)
+                self.assertNotIn('"on', html)
+                self.assertNotIn("'on", html)
+
+    def test_headings_escape_html_in_body_and_toc(self):
+        html, toc = render_markdown('# <img src=x onerror=alert(1)> Titre\n\n## <b>Suite</b>')
+        self.assertNotIn('<img', html + toc)
+        self.assertNotIn('<b>', html + toc)
+        self.assertIn('&lt;img src=x onerror=alert(1)&gt; Titre', html)
+        self.assertIn('id="img-srcx-onerroralert1-titre"', html)
+
+    def test_link_urls_keep_balanced_parentheses(self):
+        self.assertEqual(
+            self.html('[x](http://a/b(1))'),
+            '<p><a href="http://a/b(1)" target="_blank" rel="noopener noreferrer">x</a></p>',
+        )
+        self.assertEqual(
+            self.html('voir ([x](/a)) puis'),
+            '<p>voir (<a href="/a">x</a>) puis</p>',
+        )
@@ -0,0 +1,125 @@
+import re
+from datetime import date, timedelta
+from html import unescape
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from portfolio.models import BlogPost, Profile, Project
+from portfolio.pagination import KeysetPage, KeysetPaginator
+from portfolio.views import BLOG_KEYSET_ORDERING, PROJECT_KEYSET_ORDERING
+
+CURSOR_LINK_RE = re.compile(r'href="(\?[^"]*cursor=[^"]*)"')
+
+
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Profile.objects.create(name='Pagination', title='Pagination', bio='Bio', email='pagination@example.com')
+        author = User.objects.create(username='pagination-author')
+        today = date.today()
+        # Trois dates seulement : le départage par clé primaire décide de l'ordre
+        Project.objects.bulk_create([
+            Project(title=f'Projet {i}', description='Description', technologies='Python',
+                    start_date=today - timedelta(days=i % 3))
+            for i in range(23)
+        ])
+        published_at = timezone.now().replace(microsecond=0)
+        BlogPost.objects.bulk_create([
+            BlogPost(
+                title=f'Article {i}', slug=f'article-{i}', content='Contenu', author=author,
+                tags='django, python' if i % 2 else 'python', is_published=i % 5 != 0,
+                # Brouillons sans date : segment NULL en fin de liste
+                published_at=published_at - timedelta(days=i % 2) if i % 5 else None,
+            )
+            for i in range(31)
+        ])
+
+    def setUp(self):
+        cache.clear()
+
+    def walk(self, paginator):
+        seen, cursor = [], None
+        while True:
+            page = paginator.page(cursor)
+            seen += [obj.pk for obj in page]
+            if not page.has_next:
+                return seen
+            cursor = page.next_cursor
+
+    def test_walk_visits_every_row_once_despite_duplicate_keys(self):
+        cases = [
+            (Project.objects.all(), PROJECT_KEYSET_ORDERING),
+            (BlogPost.objects.all(), BLOG_KEYSET_ORDERING),
+        ]
+        for queryset, ordering in cases:
+            for per_page in (1, 4, 7, 100):
+                with self.subTest(model=queryset.model.__name__, per_page=per_page):
+                    paginator = KeysetPaginator(queryset, ordering, per_page)
+                    expected = list(paginator.ordered_queryset().values_list('pk', flat=True))
+                    self.assertEqual(self.walk(paginator), expected)
+
+    def test_list_opens_in_cursor_mode_and_follows_its_link(self):
+        response = self.client.get(reverse('portfolio:projects'))
+        self.assertIsInstance(response.context['page_obj'], KeysetPage)
+        self.assertFalse(response.context['is_paginated'])
+
+        seen = []
+        while True:
+            seen += [project.pk for project in response.context['projects']]
+            links = CURSOR_LINK_RE.findall(response.content.decode())
+            if not links:
+                break
+            response = self.client.get(reverse('portfolio:projects') + unescape(links[0]))
+        paginator = KeysetPaginator(Project.objects.all(), PROJECT_KEYSET_ORDERING, 9)
+        self.assertEqual(seen, list(paginator.ordered_queryset().values_list('pk', flat=True)))
+
+    def test_page_parameter_keeps_numbered_pagination(self):
+        response = self.client.get(reverse('portfolio:projects'), {'page': 2})
+        page = response.context['page_obj']
+        self.assertTrue(response.context['is_paginated'])
+        self.assertEqual(page.number, 2)
+        self.assertEqual(page.paginator.count, 23)
+        self.assertNotIn('next_cursor', response.context)
+        self.assertIn('?page=3', response.content.decode())
+
+        ordered = KeysetPaginator(Project.objects.all(), PROJECT_KEYSET_ORDERING, 9).ordered_queryset()
+        self.assertEqual([project.pk for project in page], [project.pk for project in ordered[9:18]])
+
+    def test_search_and_tag_are_kept_across_cursor_pages(self):
+        for params, expected in [
+            ({'tag': 'django'}, BlogPost.objects.filter(is_published=True, tags__icontains='django')),
+            ({'search': 'django'}, BlogPost.objects.filter(is_published=True, tags__icontains='django')),
+        ]:
+            with self.subTest(params=params):
+                response = self.client.get(reverse('portfolio:blog'), params)
+                seen = []
+                while True:
+                    seen += [post.pk for post in response.context['posts']]
+                    links = CURSOR_LINK_RE.findall(response.content.decode())
+                    if not links:
+                        break
+                    link = unescape(links[0])
+                    for name, value in params.items():
+                        self.assertIn(f'{name}={value}', link)
+                    response = self.client.get(reverse('portfolio:blog') + link)
+                self.assertGreater(len(seen), 6)
+                self.assertEqual(sorted(seen), sorted(expected.values_list('pk', flat=True)))
+                self.assertEqual(len(seen), len(set(seen)))
+
+    def test_feeds_reject_tampered_cursors(self):
+        for url_name in ('portfolio:project_feed_api', 'portfolio:blog_feed_api'):
+            with self.subTest(url_name=url_name):
+                url = reverse(url_name)
+                first = self.client.get(url, {'limit': 2}).json()
+                self.assertTrue(first['has_next'])
+                self.assertEqual(self.client.get(url, {'limit': 2, 'cursor': first['next_cursor']}).status_code, 200)
+
+                tampered = first['next_cursor'][:-1] + ('A' if first['next_cursor'][-1] != 'A' else 'B')
+                for cursor in (tampered, 'not-a-cursor'):
+                    response = self.client.get(url, {'cursor': cursor})
+                    self.assertEqual(response.status_code, 400)
+                    self.assertFalse(response.json()['success'])
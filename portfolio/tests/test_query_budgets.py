@@ -0,0 +1,109 @@
+import tempfile
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from portfolio.models import BlogCategory, BlogPost, Profile, Project, SiteSettings, Testimonial
+from portfolio.theme import stylesheet_url
+
+
+# Nombre maximal de requêtes SQL autorisées par page, indépendamment du volume
+# de données. Toute valeur qui grandit avec le nombre de lignes est un N+1.
+QUERY_BUDGETS = [
+    ('portfolio:home', {}, 11),
+    ('portfolio:projects', {}, 5),
+    ('portfolio:testimonials', {}, 4),
+    ('portfolio:testimonial_add', {}, 5),
+    ('portfolio:blog', {}, 7),
+    ('portfolio:blog_detail', {'slug': 'budget-post-0'}, 7),
+    ('portfolio:admin_dashboard', {}, 9),
+    ('admin:portfolio_blogpost_changelist', {}, 11),
+    ('admin:portfolio_testimonial_changelist', {}, 8),
+]
+
+
+class QueryBudgetTests(TestCase):
+    """Les listes gardent un nombre de requêtes constant sur un jeu de données réaliste"""
+
+    @classmethod
+    def setUpClass(cls):
+        # Feuille du thème et fichiers écrits par les vues : hors du MEDIA_ROOT réel
+        media = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(media.cleanup)
+        cls.enterClassContext(override_settings(MEDIA_ROOT=media.name))
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser('budget-admin', 'budget@example.com', 'budget-admin')
+        if not Profile.objects.exists():
+            Profile.objects.create(name='Budget', title='Budget', bio='Bio', email='budget@example.com')
+        if not SiteSettings.objects.exists():
+            SiteSettings.objects.create()
+
+        categories = BlogCategory.objects.bulk_create([
+            BlogCategory(name=f'Budget catégorie {i}', slug=f'budget-categorie-{i}')
+            for i in range(5)
+        ])
+        now = timezone.now()
+        BlogPost.objects.bulk_create([
+            BlogPost(
+                title=f'Budget post {i}',
+                slug=f'budget-post-{i}',
+                content='Contenu ' * 500,
+                tags='Python, Django, Performance',
+                category=categories[i % len(categories)],
+                author=cls.user,
+                is_published=True,
+                is_featured=i % 10 == 0,
+                published_at=now - timedelta(days=i),
+            )
+            for i in range(60)
+        ])
+        projects = Project.objects.bulk_create([
+            Project(
+                title=f'Budget projet {i}',
+                description='Description du projet',
+                detailed_description='Détails ' * 500,
+                technologies='Python, Django, PostgreSQL',
+                start_date=date.today() - timedelta(days=30 * i),
+                is_featured=i % 5 == 0,
+            )
+            for i in range(40)
+        ])
+        Testimonial.objects.bulk_create([
+            Testimonial(
+                name=f'Client {i}',
+                company='Entreprise',
+                content='Excellent travail ' * 20,
+                project_related=projects[i % len(projects)],
+                is_approved=True,
+                is_featured=i % 4 == 0,
+                user_agent='Mozilla/5.0 ' * 40,
+            )
+            for i in range(40)
+        ])
+
+    def setUp(self):
+        cache.clear()
+        # Feuille du thème : compilée une fois pour toute la durée du cache, pas à chaque page
+        stylesheet_url()
+        self.client.force_login(self.user)
+
+    def test_list_views_stay_within_query_budget(self):
+        for url_name, kwargs, budget in QUERY_BUDGETS:
+            url = reverse(url_name, kwargs=kwargs)
+            with self.subTest(url=url):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertLessEqual(
+                    len(queries), budget,
+                    '\n'.join(query['sql'] for query in queries.captured_queries),
+                )
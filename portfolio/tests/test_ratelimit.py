@@ -0,0 +1,105 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.views import View
+
+from portfolio import ratelimit
+from portfolio.ratelimit import RateLimitMixin, TokenBucket, check_shared_cache, get_client_ip, parse_rate
+
+SHARED_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'cache'}}
+LOCAL_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'ratelimit-tests'}}
+
+
+class LimitedView(RateLimitMixin, View):
+    rate_limit = (1, 1 / 60)
+
+    def get(self, request):
+        return HttpResponse('ok')
+
+
+class AsyncLimitedView(RateLimitMixin, View):
+    rate_limit = (1, 1 / 60)
+
+    async def get(self, request):
+        return HttpResponse('ok')
+
+
+@override_settings(CACHES=LOCAL_CACHE)
+class RateLimitTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        clock = mock.patch('portfolio.ratelimit.time.time', return_value=1000.0)
+        self.time = clock.start()
+        self.addCleanup(clock.stop)
+
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate('5/h'), (5, 5 / 3600))
+        self.assertEqual(parse_rate(' 10 / M '), (10, 10 / 60))
+        self.assertIsNone(parse_rate(''))
+        self.assertIsNone(parse_rate(None))
+        for value in ('5', '5/w', 'x/h', '0/m', '-1/s'):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                parse_rate(value)
+
+    def test_bucket_allows_a_burst_then_refills(self):
+        bucket = TokenBucket('test', capacity=2, rate=0.5)
+        self.assertEqual(bucket.consume('198.51.100.1'), (True, 0))
+        self.assertEqual(bucket.consume('198.51.100.1'), (True, 0))
+        self.assertEqual(bucket.consume('198.51.100.1'), (False, 2))
+        # Une autre IP a son propre seau
+        self.assertEqual(bucket.consume('198.51.100.2'), (True, 0))
+
+        self.time.return_value = 1001.0
+        self.assertEqual(bucket.consume('198.51.100.1'), (False, 1))
+        self.time.return_value = 1002.0
+        self.assertEqual(bucket.consume('198.51.100.1'), (True, 0))
+
+    def test_full_bucket_does_not_exceed_capacity(self):
+        bucket = TokenBucket('test', capacity=1, rate=1)
+        self.assertEqual(bucket.consume('198.51.100.1'), (True, 0))
+        self.time.return_value = 5000.0
+        self.assertEqual(bucket.consume('198.51.100.1'), (True, 0))
+        self.assertEqual(bucket.consume('198.51.100.1'), (False, 1))
+
+    def test_sync_view_returns_429_with_retry_after(self):
+        view = LimitedView.as_view()
+        self.assertEqual(view(RequestFactory().get('/')).status_code, 200)
+        response = view(RequestFactory().get('/'))
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '60')
+
+    async def test_async_view_returns_429_with_retry_after(self):
+        view = AsyncLimitedView.as_view()
+        self.assertEqual((await view(RequestFactory().get('/'))).status_code, 200)
+        response = await view(RequestFactory().get('/'))
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '60')
+
+
+class ClientIPTests(SimpleTestCase):
+    def request(self, forwarded_for):
+        return RequestFactory().get('/', REMOTE_ADDR='10.0.0.1', HTTP_X_FORWARDED_FOR=forwarded_for)
+
+    def test_forwarded_for_is_ignored_without_trusted_proxies(self):
+        with mock.patch.object(ratelimit, 'TRUSTED_PROXY_COUNT', 0):
+            self.assertEqual(get_client_ip(self.request('203.0.113.7')), '10.0.0.1')
+
+    def test_only_the_hop_added_by_the_trusted_proxy_is_read(self):
+        with mock.patch.object(ratelimit, 'TRUSTED_PROXY_COUNT', 1):
+            self.assertEqual(get_client_ip(self.request('198.51.100.9, 203.0.113.7')), '203.0.113.7')
+        with mock.patch.object(ratelimit, 'TRUSTED_PROXY_COUNT', 2):
+            self.assertEqual(get_client_ip(self.request('198.51.100.9, 203.0.113.7, 10.0.0.2')), '203.0.113.7')
+            # Moins d'entrées que de proxys : en-tête incomplet, l'adresse directe est gardée
+            self.assertEqual(get_client_ip(self.request('203.0.113.7')), '10.0.0.1')
+
+
+class SharedCacheCheckTests(SimpleTestCase):
+    def test_per_process_cache_is_reported(self):
+        with override_settings(CACHES=LOCAL_CACHE):
+            self.assertEqual([warning.id for warning in check_shared_cache()], ['portfolio.W001'])
+
+    def test_shared_cache_passes(self):
+        with override_settings(CACHES=SHARED_CACHE):
+            self.assertEqual(check_shared_cache(), [])
@@ -0,0 +1,115 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db.models import Q
+from django.test import TestCase
+from django.utils import timezone
+
+from portfolio import related
+from portfolio.models import BlogPost, RelatedContent
+from portfolio.related import rebuild_related_content, refresh_related_content, related_to
+
+
+class RelatedContentTests(TestCase):
+    """Mise à jour incrémentale de la table des voisins"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create(username='related-author')
+        now = timezone.now()
+        cls.django = cls.post('Django queryset performance', 'django, performance', now)
+        cls.orm = cls.post('Django ORM performance tuning', 'django, performance', now - timedelta(days=1))
+        cls.garden = cls.post('Vegetable garden planning', 'garden, seasons', now - timedelta(days=2))
+
+    @classmethod
+    def post(cls, title, tags, published_at, is_published=True):
+        return BlogPost.objects.create(
+            title=title, content=f'{title}. Notes about {tags}.', tags=tags, author=cls.author,
+            is_published=is_published, published_at=published_at,
+        )
+
+    def setUp(self):
+        # Chaque test part d'un index relu depuis sa propre base
+        related._index = None
+        self.addCleanup(setattr, related, '_index', None)
+
+    def neighbours(self, post):
+        return set(RelatedContent.objects.filter(
+            source_kind='blogpost', source_id=post.pk, target_kind='blogpost',
+        ).values_list('target_id', flat=True))
+
+    def cited_by(self, post):
+        return set(RelatedContent.objects.filter(
+            target_kind='blogpost', target_id=post.pk,
+        ).values_list('source_id', flat=True))
+
+    def test_rebuild_links_similar_posts_only(self):
+        rebuild_related_content()
+        self.assertEqual(self.neighbours(self.django), {self.orm.pk})
+        self.assertEqual(self.neighbours(self.garden), set())
+
+    def test_publishing_a_post_adds_it_to_its_neighbours(self):
+        draft = self.post('Django performance checklist', 'django, performance', None, is_published=False)
+        rebuild_related_content()
+        self.assertEqual(self.cited_by(draft), set())
+
+        draft.is_published = True
+        draft.save()
+        refresh_related_content('blogpost', draft.pk)
+
+        self.assertEqual(self.cited_by(draft), {self.django.pk, self.orm.pk})
+        self.assertEqual(self.neighbours(draft), {self.django.pk, self.orm.pk})
+        self.assertNotIn(draft.pk, self.neighbours(self.garden))
+
+    def test_unpublishing_a_post_removes_it_from_its_neighbours(self):
+        rebuild_related_content()
+        self.assertIn(self.orm.pk, self.neighbours(self.django))
+
+        self.orm.is_published = False
+        self.orm.save()
+        refresh_related_content('blogpost', self.orm.pk)
+
+        self.assertEqual(self.cited_by(self.orm), set())
+        self.assertEqual(self.neighbours(self.orm), set())
+        self.assertEqual(self.neighbours(self.django), set())
+
+    def test_deleting_a_post_removes_it_from_its_neighbours(self):
+        rebuild_related_content()
+        pk = self.orm.pk
+        self.orm.delete()
+        refresh_related_content('blogpost', pk)
+
+        self.assertFalse(RelatedContent.objects.filter(
+            Q(source_kind='blogpost', source_id=pk) | Q(target_kind='blogpost', target_id=pk)
+        ).exists())
+        # L'index du processus a retiré l'article : une nouvelle mise à jour ne le retrouve pas
+        refresh_related_content('blogpost', self.django.pk)
+        self.assertEqual(self.neighbours(self.django), set())
+
+    def test_counter_only_save_does_not_schedule_a_refresh(self):
+        with mock.patch.object(related._executor, 'submit') as submit:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.django.views_count += 1
+                self.django.save(update_fields=['views_count'])
+            submit.assert_not_called()
+
+            with self.captureOnCommitCallbacks(execute=True):
+                self.django.title = 'Django queryset caching'
+                self.django.save(update_fields=['title'])
+            submit.assert_called_once_with(related._refresh_safely, 'blogpost', self.django.pk)
+
+    def test_related_to_falls_back_to_queryset_order_without_rows(self):
+        bread = self.post('Sourdough bread baking', 'bread, kitchen', timezone.now() + timedelta(hours=1))
+        others = BlogPost.objects.filter(is_published=True).exclude(pk=self.django.pk)
+        self.assertEqual(list(related_to(self.django, others)), [])
+        self.assertEqual(
+            list(related_to(self.django, others, fallback=Q(is_published=True))), [bread, self.orm, self.garden],
+        )
+
+        rebuild_related_content()
+        # Les voisins calculés passent devant le complément, qui garde l'ordre du modèle
+        self.assertEqual(list(related_to(self.django, others)), [self.orm])
+        self.assertEqual(
+            list(related_to(self.django, others, fallback=Q(is_published=True))), [self.orm, bread, self.garden],
+        )
@@ -0,0 +1,61 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from portfolio.models import BlogPost, Profile
+from portfolio.sitemaps import SITEMAP_VERSION_CACHE_KEY
+
+
+class SitemapCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Profile.objects.create(name='Sitemap', title='Sitemap', bio='Bio', email='sitemap@example.com')
+        author = User.objects.create(username='sitemap-author')
+        cls.post = BlogPost.objects.create(
+            title='Article', slug='article', content='Contenu', author=author,
+            is_published=True, published_at=timezone.now(),
+        )
+        BlogPost.objects.create(title='Brouillon', slug='brouillon', content='Contenu', author=author)
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('django.contrib.sitemaps.views.sitemap', kwargs={'section': 'blog'})
+
+    def test_blog_sitemap_lists_every_language_with_hreflang_and_x_default(self):
+        content = self.client.get(self.url).content.decode()
+        self.assertEqual(content.count('<url>'), 3)
+        for language, prefix in [('fr', ''), ('en', '/en'), ('ar', '/ar'), ('x-default', '')]:
+            with self.subTest(language=language):
+                self.assertIn(f'hreflang="{language}" href="http://testserver{prefix}/blog/article/"', content)
+        self.assertIn(f'<lastmod>{self.post.updated_at.date().isoformat()}', content)
+        self.assertNotIn('brouillon', content)
+
+    def test_cached_response_runs_no_query_and_honours_etag(self):
+        first = self.client.get(self.url)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['ETag'], first['ETag'])
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_content_save_invalidates_but_counter_save_does_not(self):
+        self.client.get(self.url)
+        version = cache.get(SITEMAP_VERSION_CACHE_KEY)
+
+        self.post.views_count += 1
+        self.post.save(update_fields=['views_count'])
+        self.assertEqual(cache.get(SITEMAP_VERSION_CACHE_KEY), version)
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+        self.post.slug = 'article-renomme'
+        self.post.save()
+        self.assertNotEqual(cache.get(SITEMAP_VERSION_CACHE_KEY), version)
+        content = self.client.get(self.url).content.decode()
+        self.assertIn('/blog/article-renomme/', content)
+        self.assertNotIn('/blog/article/', content)
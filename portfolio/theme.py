@@ -0,0 +1,206 @@
+"""Feuille de style compilée à partir de la personnalisation active du site"""
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from datetime import timedelta
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+
+from .assets import minify_css
+
+THEME_DIR = getattr(settings, 'THEME_DIR', 'theme')
+THEME_CACHE_KEY = 'site-customization-stylesheet'
+# Le nom est relu en base à cette fréquence : les caches propres à chaque processus suivent l'admin
+THEME_CACHE_TTL = getattr(settings, 'THEME_CACHE_TTL', 60)
+# Une feuille remplacée reste servie ce délai pour les processus et les pages en cache qui la citent
+THEME_GRACE_PERIOD = getattr(settings, 'THEME_GRACE_PERIOD', 24 * 60 * 60)
+# Nombre de feuilles d'aperçu gardées en mémoire par processus
+THEME_PREVIEW_CACHE_SIZE = getattr(settings, 'THEME_PREVIEW_CACHE_SIZE', 32)
+
+_COLOR = re.compile(r'^#(?:[0-9a-fA-F]{3}){1,2}$')
+
+# Champ -> (variable CSS, type, bornes) ; les valeurs hors bornes reprennent la valeur par défaut
+THEME_VARIABLES = [
+    ('primary_color', '--primary-color', 'color', None),
+    ('secondary_color', '--secondary-color', 'color', None),
+    ('accent_color', '--accent-color', 'color', None),
+    ('background_color', '--background-color', 'color', None),
+    ('text_color', '--text-color', 'color', None),
+    ('font_family', '--font-family', 'font', None),
+    ('heading_font_size', '--heading-font-size', 'px', (10, 120)),
+    ('body_font_size', '--body-font-size', 'px', (8, 40)),
+    ('line_height', '--line-height', 'number', (1, 4)),
+    ('container_width', '--container-width', 'px', (320, 3840)),
+    ('border_radius', '--border-radius', 'px', (0, 100)),
+    ('spacing_unit', '--spacing-unit', 'px', (0, 100)),
+]
+
+# Les variables de style.css suivent celles de la personnalisation
+THEME_RULES = (
+    ':root{--primary:var(--primary-color);--secondary:var(--secondary-color);'
+    '--accent:var(--accent-color);--text-dark:var(--text-color)}'
+    'body{font-family:var(--font-family);font-size:var(--body-font-size);'
+    'line-height:var(--line-height);background-color:var(--background-color)}'
+    'h1{font-size:var(--heading-font-size)}'
+    '.container{max-width:var(--container-width)}'
+)
+
+
+def _field_defaults():
+    from .models import SiteCustomization
+    return {
+        field.name: field.default for field in SiteCustomization._meta.get_fields()
+        if field.name in {name for name, _, _, _ in THEME_VARIABLES}
+    }
+
+
+def _font_names():
+    from .models import SiteCustomization
+    return dict(SiteCustomization.FONT_FAMILIES)
+
+
+def _clean(value, kind, bounds, default):
+    if kind == 'color':
+        value = str(value or '').strip()
+        return value if _COLOR.match(value) else default
+    if kind == 'font':
+        return value if value in _font_names() else default
+    try:
+        number = Decimal(str(value))
+    except (InvalidOperation, ValueError):
+        return default
+    if not number.is_finite() or not bounds[0] <= number <= bounds[1]:
+        return default
+    return int(number) if kind == 'px' else number.normalize()
+
+
+def theme_values(source):
+    """
+    Valeurs validées du thème à partir d'une instance de SiteCustomization ou
+    d'un dictionnaire (données d'un formulaire). Seules des couleurs
+    hexadécimales, des polices connues et des nombres bornés sont retenus.
+    """
+    get = source.get if isinstance(source, dict) else lambda name: getattr(source, name, None)
+    defaults = _field_defaults()
+    values = {
+        name: _clean(get(name), kind, bounds, defaults[name])
+        for name, _, kind, bounds in THEME_VARIABLES
+    }
+    values['custom_css'] = get('custom_css') or ''
+    return values
+
+
+def compile_theme(values):
+    """CSS minifié : variables du thème, règles qui les appliquent, puis custom_css"""
+    fonts = _font_names()
+    declarations = []
+    for name, variable, kind, _ in THEME_VARIABLES:
+        value = values[name]
+        if kind == 'px':
+            value = f'{value}px'
+        elif kind == 'font':
+            value = f'"{fonts[value]}",sans-serif'
+        declarations.append(f'{variable}:{value}')
+    css = ':root{' + ';'.join(declarations) + '}' + THEME_RULES
+    return css + minify_css(values['custom_css'])
+
+
+def theme_hash(values):
+    payload = json.dumps(values, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def ensure_stylesheet(customization):
+    """
+    Nom de la feuille compilée, qui contient l'empreinte de son contenu : tous
+    les processus en déduisent le même nom. Écrite si absente ; '' sans
+    personnalisation active.
+    """
+    if customization is None:
+        return ''
+    css = compile_theme(theme_values(customization))
+    name = f'{THEME_DIR}/site.{hashlib.sha256(css.encode()).hexdigest()[:12]}.css'
+    if not default_storage.exists(name):
+        default_storage.save(name, ContentFile(css.encode('utf-8')))
+    return name
+
+
+def write_stylesheet(customization):
+    """
+    Écrit la feuille de la personnalisation enregistrée, retire celles remplacées
+    depuis plus de THEME_GRACE_PERIOD et retourne le nom du fichier (None sans
+    personnalisation active).
+    """
+    name = ensure_stylesheet(customization)
+    if name:
+        # Date de mise en service : une feuille réactivée ne doit pas être prise pour une ancienne
+        try:
+            os.utime(default_storage.path(name))
+        except (NotImplementedError, OSError):
+            pass
+    cache.set(THEME_CACHE_KEY, name, THEME_CACHE_TTL)
+    remove_replaced_stylesheets(name)
+    return name or None
+
+
+def remove_replaced_stylesheets(current):
+    """
+    Chaque feuille est remplacée à la date de la suivante : seules celles
+    remplacées depuis plus de THEME_GRACE_PERIOD sont supprimées.
+    """
+    try:
+        _, files = default_storage.listdir(THEME_DIR)
+    except FileNotFoundError:
+        return
+    dated = []
+    for filename in files:
+        path = f'{THEME_DIR}/{filename}'
+        try:
+            dated.append((default_storage.get_modified_time(path), path))
+        except (NotImplementedError, OSError):
+            continue
+    limit = timezone.now() - timedelta(seconds=THEME_GRACE_PERIOD)
+    replaced_at = None
+    for modified, path in sorted(dated, reverse=True):
+        if path != current and replaced_at is not None and replaced_at < limit:
+            default_storage.delete(path)
+        replaced_at = modified
+
+
+def stylesheet_url():
+    """URL de la feuille compilée pour la personnalisation active, ou None"""
+    name = cache.get(THEME_CACHE_KEY)
+    if name is None:
+        from .models import SiteCustomization
+        name = ensure_stylesheet(SiteCustomization.objects.filter(is_active=True).first())
+        cache.set(THEME_CACHE_KEY, name, THEME_CACHE_TTL)
+    return default_storage.url(name) if name else None
+
+
+_previews = OrderedDict()
+_previews_lock = threading.Lock()
+
+
+def preview_stylesheet(data):
+    """(empreinte, CSS) pour des données de formulaire, compilé une seule fois par combinaison"""
+    values = theme_values(data)
+    key = theme_hash(values)
+    with _previews_lock:
+        if key in _previews:
+            _previews.move_to_end(key)
+            return key, _previews[key]
+
+    css = compile_theme(values)
+    with _previews_lock:
+        _previews[key] = css
+        while len(_previews) > THEME_PREVIEW_CACHE_SIZE:
+            _previews.popitem(last=False)
+    return key, css
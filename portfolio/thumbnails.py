@@ -0,0 +1,245 @@
+"""Vignettes produites à la demande, conservées dans un cache disque borné (LRU)"""
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from io import BytesIO
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps, features
+
+try:
+    import fcntl
+except ImportError:  # Windows : verrou limité au processus courant
+    fcntl = None
+
+THUMBNAIL_CACHE_DIR = getattr(
+    settings, 'THUMBNAIL_CACHE_DIR', os.path.join(settings.BASE_DIR, 'cache', 'thumbnails')
+)
+THUMBNAIL_CACHE_MAX_BYTES = getattr(settings, 'THUMBNAIL_CACHE_MAX_BYTES', 512 * 1024 * 1024)
+THUMBNAIL_MAX_DIMENSION = getattr(settings, 'THUMBNAIL_MAX_DIMENSION', 2000)
+# Tailles demandées par les gabarits : toute autre taille serait un rendu et un fichier de plus
+# au choix du visiteur. None accepte toute taille valide (à réserver à un usage interne)
+THUMBNAIL_SPECS = getattr(settings, 'THUMBNAIL_SPECS', ('120x120-crop', '400x300-crop'))
+THUMBNAIL_QUALITY = getattr(settings, 'THUMBNAIL_QUALITY', 82)
+
+# « 400x300 » : contenu dans la boîte ; « 400x » : largeur seule ; « 400x300-crop » : recadré
+SPEC_RE = re.compile(r'^(?P<width>\d+)x(?P<height>\d*)(?P<crop>-crop)?$')
+
+CONTENT_TYPES = {'webp': 'image/webp', 'jpeg': 'image/jpeg', 'png': 'image/png'}
+
+# Rafraîchir la date d'accès au plus une fois par heure pour ne pas écrire à chaque hit
+TOUCH_INTERVAL = 60 * 60
+# Parcours complet du cache au plus à cet intervalle, ou dès que la taille estimée dépasse la limite
+EVICTION_INTERVAL = getattr(settings, 'THUMBNAIL_EVICTION_INTERVAL', 10 * 60)
+
+# Verrous par clé, répartis sur un nombre fixe de verrous pour borner la mémoire
+_thread_locks = [threading.Lock() for _ in range(64)]
+_eviction_lock = threading.Lock()
+# Taille du cache mesurée au dernier parcours plus les vignettes écrites depuis par ce processus
+_estimated_bytes = None
+_checked_at = 0
+
+
+class InvalidThumbnail(Exception):
+    pass
+
+
+def parse_spec(spec):
+    """Retourne (largeur, hauteur ou None, recadrage) ou lève InvalidThumbnail"""
+    match = SPEC_RE.match(spec)
+    if not match or (THUMBNAIL_SPECS is not None and spec not in THUMBNAIL_SPECS):
+        raise InvalidThumbnail(f'Format de vignette non autorisé : {spec}')
+
+    width = int(match['width'])
+    height = int(match['height']) if match['height'] else None
+    crop = bool(match['crop'])
+    if crop and not height:
+        raise InvalidThumbnail('Le recadrage nécessite une hauteur')
+    if not 0 < width <= THUMBNAIL_MAX_DIMENSION or (height is not None and not 0 < height <= THUMBNAIL_MAX_DIMENSION):
+        raise InvalidThumbnail('Dimensions hors limites')
+    return width, height, crop
+
+
+def choose_format(accept, source_format):
+    if 'image/webp' in (accept or '') and features.check('webp'):
+        return 'webp'
+    return 'png' if source_format == 'PNG' else 'jpeg'
+
+
+def cache_key(name, spec, fmt, storage=None):
+    """Adresse du fichier en cache : change dès que l'original est remplacé"""
+    storage = storage or default_storage
+    try:
+        version = f'{storage.size(name)}:{storage.get_modified_time(name).timestamp()}'
+    except (NotImplementedError, OSError):
+        version = ''
+    raw = f'{name}|{version}|{spec}|{fmt}|{THUMBNAIL_QUALITY}'
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def cache_path(key, fmt):
+    return os.path.join(THUMBNAIL_CACHE_DIR, key[:2], f'{key}.{fmt}')
+
+
+def render(name, spec, fmt, storage=None):
+    """Produit les octets de la vignette"""
+    storage = storage or default_storage
+    width, height, crop = parse_spec(spec)
+
+    with storage.open(name, 'rb') as source:
+        image = Image.open(source)
+        # Décodage JPEG directement à une résolution réduite quand c'est possible
+        image.draft('RGB', (width, height or width))
+        image = ImageOps.exif_transpose(image)
+        image.load()
+
+    if crop:
+        image = ImageOps.fit(image, (width, height), Image.LANCZOS)
+    else:
+        image.thumbnail((width, height or THUMBNAIL_MAX_DIMENSION), Image.LANCZOS)
+
+    if fmt == 'jpeg' and image.mode != 'RGB':
+        image = image.convert('RGB')
+    elif image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA')
+
+    buffer = BytesIO()
+    image.save(buffer, format=fmt.upper(), quality=THUMBNAIL_QUALITY, optimize=True)
+    return buffer.getvalue()
+
+
+class _KeyLock:
+    """
+    Verrou exclusif par clé : threads du processus puis autres processus (flock).
+    Un fichier verrou par sous-dossier, jamais supprimé : un verrou tenu par un
+    autre worker ne peut pas disparaître pendant une éviction.
+    """
+
+    def __init__(self, key):
+        self.thread_lock = _thread_locks[int(key[:8], 16) % len(_thread_locks)]
+        self.lock_path = os.path.join(THUMBNAIL_CACHE_DIR, key[:2], '.lock')
+        self.handle = None
+
+    def __enter__(self):
+        self.thread_lock.acquire()
+        if fcntl:
+            self.handle = open(self.lock_path, 'a')
+            fcntl.flock(self.handle, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.handle:
+            fcntl.flock(self.handle, fcntl.LOCK_UN)
+            self.handle.close()
+        self.thread_lock.release()
+
+
+def _touch(path):
+    try:
+        if time.time() - os.path.getmtime(path) > TOUCH_INTERVAL:
+            os.utime(path)
+    except OSError:
+        pass
+
+
+def _write_atomically(path, data):
+    # Fichier temporaire puis renommage : un lecteur ne voit jamais de vignette partielle
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as handle:
+            handle.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def get_thumbnail(name, spec, accept='', storage=None):
+    """
+    Chemin sur disque de la vignette et son format, générée au premier appel.
+    Les appels concurrents pour la même vignette attendent le premier rendu
+    au lieu de la recalculer chacun.
+    """
+    storage = storage or default_storage
+    parse_spec(spec)
+    try:
+        exists = storage.exists(name)
+    except SuspiciousFileOperation:
+        exists = False
+    if not exists:
+        raise FileNotFoundError(name)
+
+    fmt = choose_format(accept, 'PNG' if name.lower().endswith('.png') else None)
+    key = cache_key(name, spec, fmt, storage)
+    path = cache_path(key, fmt)
+    if os.path.exists(path):
+        _touch(path)
+        return path, fmt, key
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    written = 0
+    with _KeyLock(key):
+        # Un autre worker a pu terminer le rendu pendant l'attente du verrou
+        if not os.path.exists(path):
+            data = render(name, spec, fmt, storage)
+            _write_atomically(path, data)
+            written = len(data)
+    if written:
+        _evict_if_needed(written)
+    return path, fmt, key
+
+
+def _evict_if_needed(written):
+    global _estimated_bytes
+    if _estimated_bytes is not None:
+        _estimated_bytes += written
+    if (_estimated_bytes is None or _estimated_bytes > THUMBNAIL_CACHE_MAX_BYTES
+            or time.monotonic() - _checked_at > EVICTION_INTERVAL):
+        evict()
+
+
+def evict(max_bytes=None):
+    """Supprime les vignettes les moins récemment servies au-delà de la taille maximale"""
+    global _estimated_bytes, _checked_at
+    max_bytes = THUMBNAIL_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    if not _eviction_lock.acquire(blocking=False):
+        return 0
+
+    try:
+        entries, total = [], 0
+        for root, _, files in os.walk(THUMBNAIL_CACHE_DIR):
+            for filename in files:
+                if filename.endswith(('.lock', '.tmp')):
+                    continue
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        _estimated_bytes, _checked_at = total, time.monotonic()
+        if total <= max_bytes:
+            return 0
+
+        # On descend à 90 % de la limite pour ne pas évincer à chaque nouvelle vignette
+        target, removed = max_bytes * 0.9, 0
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        _estimated_bytes = total
+        return removed
+    finally:
+        _eviction_lock.release()
@@ -0,0 +1,104 @@
+"""Normalisation des images téléversées : métadonnées retirées, dimensions plafonnées, recompression"""
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+from PIL import Image, ImageOps
+
+from .images import generate_derivatives, DERIVATIVE_FORMATS
+
+logger = logging.getLogger(__name__)
+
+# Seuil anti-abus, pas de qualité : une photo de téléphone de 20 à 30 Mo doit être réduite, pas refusée.
+# Le décodage en mode brouillon garde la mémoire faible quelle que soit la taille du fichier
+UPLOAD_IMAGE_MAX_BYTES = getattr(settings, 'UPLOAD_IMAGE_MAX_BYTES', 40 * 1024 * 1024)
+UPLOAD_IMAGE_QUALITY = getattr(settings, 'UPLOAD_IMAGE_QUALITY', 82)
+
+# (modèle, champ) -> plus grande dimension conservée, en pixels
+NORMALIZED_IMAGE_FIELDS = getattr(settings, 'NORMALIZED_IMAGE_FIELDS', {
+    ('Testimonial', 'photo'): 800,
+    ('SiteCustomization', 'logo_image'): 600,
+})
+
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'UPLOAD_NORMALIZATION_WORKERS', 2),
+    thread_name_prefix='upload-normalization',
+)
+
+
+def normalize_image(source, max_dimension, quality=UPLOAD_IMAGE_QUALITY):
+    """
+    Réencode une image sans ses métadonnées (EXIF, XMP, commentaires) et la
+    plafonne à `max_dimension`. Retourne (octets, extension).
+    """
+    image = Image.open(source)
+    # Les JPEG sont décodés directement à l'échelle la plus proche : bien moins de mémoire et de CPU
+    image.draft('RGB', (max_dimension, max_dimension))
+    image = ImageOps.exif_transpose(image)
+    image.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+
+    has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+    buffer = BytesIO()
+    # Image.new + paste ne recopie aucune métadonnée de l'original ; le profil ICC est conservé
+    icc_profile = image.info.get('icc_profile')
+    if has_alpha:
+        image = image.convert('RGBA')
+        clean = Image.new('RGBA', image.size)
+        clean.paste(image)
+        clean.save(buffer, format='PNG', optimize=True, icc_profile=icc_profile)
+        return buffer.getvalue(), '.png'
+
+    image = image.convert('RGB')
+    clean = Image.new('RGB', image.size)
+    clean.paste(image)
+    clean.save(buffer, format='JPEG', quality=quality, optimize=True, progressive=True, icc_profile=icc_profile)
+    return buffer.getvalue(), '.jpg'
+
+
+def normalize_field(model_name, pk, field_name):
+    """Remplace le fichier téléversé par sa version normalisée et enregistre les tailles"""
+    model = apps.get_model('portfolio', model_name)
+    name = model.objects.filter(pk=pk).values_list(field_name, flat=True).first()
+    if not name:
+        return None
+
+    original_bytes = default_storage.size(name)
+    with default_storage.open(name, 'rb') as source:
+        data, extension = normalize_image(source, NORMALIZED_IMAGE_FIELDS[(model_name, field_name)])
+
+    # Toujours réécrit, même s'il était plus petit : l'original peut contenir une position GPS
+    new_name = default_storage.save(os.path.splitext(name)[0] + extension, ContentFile(data))
+
+    # Mise à jour conditionnelle : un nouveau fichier téléversé entre-temps n'est pas écrasé
+    updated = model.objects.filter(pk=pk, **{field_name: name}).update(**{
+        field_name: new_name,
+        f'{field_name}_original_bytes': original_bytes,
+        f'{field_name}_stored_bytes': len(data),
+    })
+    default_storage.delete(name if updated else new_name)
+    if updated and DERIVATIVE_FORMATS:
+        generate_derivatives(new_name)
+    return new_name if updated else None
+
+
+def _normalize_safely(model_name, pk, field_name):
+    try:
+        normalize_field(model_name, pk, field_name)
+    except Exception:
+        logger.exception("Échec de normalisation de %s.%s #%s", model_name, field_name, pk)
+    finally:
+        connection.close()
+
+
+def schedule_normalization(instance, field_name):
+    """Normalise l'image après la validation de la transaction, hors de la requête"""
+    model_name = instance._meta.object_name
+    transaction.on_commit(
+        lambda: _executor.submit(_normalize_safely, model_name, instance.pk, field_name)
+    )
@@ -36,6 +36,8 @@ urlpatterns = [
     path('api/contact/', views.ContactAPIView.as_view(), name='contact_api'),
     path('api/newsletter/', views.NewsletterAPIView.as_view(), name='newsletter_api'),
     path('api/stats/', views.StatsAPIView.as_view(), name='stats_api'),
+    path('api/projects/', views.ProjectFeedAPIView.as_view(), name='project_feed_api'),
+    path('api/blog/', views.BlogFeedAPIView.as_view(), name='blog_feed_api'),
     path('api/search-suggestions/', views.SearchSuggestionsAPIView.as_view(), name='search_suggestions_api'),
     path('api/tag-cloud/', views.TagCloudAPIView.as_view(), name='tag_cloud_api'),
     path('api/customization/preview/', views.CustomizationPreviewAPIView.as_view(), name='customization_preview_api'),
@@ -46,4 +48,7 @@ urlpatterns = [
     path('download-cv/', views.DownloadCVView.as_view(), name='download_cv'),
     path('download-cv/<str:cv_type>/', views.DownloadCVView.as_view(), name='download_cv_type'),
     path('cv-list/', views.CVListView.as_view(), name='cv_list'),
+    
+    # Media
+    path('media-thumb/<str:spec>/<path:path>', views.ThumbnailView.as_view(), name='thumbnail'),
 ]
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""
+Vues du portfolio, regroupées par domaine. Les imports ci-dessous gardent
+`from portfolio import views` / `views.HomeView` inchangés pour urls.py.
+Aucun de ces modules n'importe ReportLab : voir portfolio/cv_pdf.py.
+"""
+from .base import (
+    VisitorStatsMixin, BasePortfolioView, filter_blog_posts,
+    PROJECT_LIST_DEFERRED_FIELDS, TESTIMONIAL_LIST_DEFERRED_FIELDS, BLOG_LIST_DEFERRED_FIELDS,
+    PROJECT_KEYSET_ORDERING, BLOG_KEYSET_ORDERING,
+)
+from .pages import (
+    HomeView, AcademicView, ExperienceView, CertificationView, ServicesView, FAQView,
+    TimelineView, CollaborationsView, ResourcesView, AchievementsView,
+)
+from .projects import ProjectListView, ProjectDetailView
+from .blog import BlogListView, BlogDetailView
+from .contact import ContactView, ContactSuccessView
+from .testimonials import TestimonialsView, TestimonialCreateView, TestimonialSuccessView
+from .search import UniversalSearchView, SearchSuggestionsAPIView, TagCloudAPIView
+from .documents import DownloadCVView, CVListView, ResourceDownloadView
+from .media import ThumbnailView, ServiceWorkerView, PrecompressedStaticView
+from .dashboard import AdminDashboardView, AdminCustomizationView, AdvancedAnalyticsView, CustomizationPreviewAPIView
+from .api import (
+    ContactAPIView, NewsletterAPIView, NewsletterSubscribeView, StatsAPIView,
+    KeysetFeedAPIView, ProjectFeedAPIView, BlogFeedAPIView, FAQHelpfulAPIView,
+)
@@ -0,0 +1,237 @@
+from asgiref.sync import sync_to_async
+from django.shortcuts import get_object_or_404
+from django.core.mail import send_mail
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.http import JsonResponse, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+from django.views import View
+import hashlib
+import json
+from ..forms import ContactForm
+from ..models import BlogPost, FAQ, Newsletter, Project
+from ..pagination import KeysetPaginator, InvalidCursor
+from ..ratelimit import RateLimitMixin, get_client_ip
+from ..stats import get_public_stats, PUBLIC_STATS_TTL
+from .base import BLOG_KEYSET_ORDERING, BLOG_LIST_DEFERRED_FIELDS, PROJECT_KEYSET_ORDERING, filter_blog_posts
+
+class ContactAPIView(RateLimitMixin, View):
+    rate_limit = 'contact'
+    
+    async def post(self, request):
+        try:
+            data = json.loads(request.body)
+            form = ContactForm(data)
+            
+            if form.is_valid():
+                contact = form.save(commit=False)
+                contact.ip_address = get_client_ip(request)
+                await contact.asave()
+                
+                return JsonResponse({
+                    'success': True,
+                    'message': 'Message envoyé avec succès !'
+                })
+            else:
+                return JsonResponse({
+                    'success': False,
+                    'message': 'Erreur dans le formulaire',
+                    'errors': form.errors
+                })
+        except Exception as e:
+            return JsonResponse({
+                'success': False,
+                'message': str(e)
+            })
+
+class NewsletterAPIView(RateLimitMixin, View):
+    rate_limit = 'newsletter'
+    
+    async def post(self, request):
+        try:
+            data = json.loads(request.body)
+            email = data.get('email')
+            name = data.get('name', '')
+            
+            if not email:
+                return JsonResponse({
+                    'success': False,
+                    'message': 'Email requis'
+                })
+            
+            newsletter, created = await Newsletter.objects.aget_or_create(
+                email=email,
+                defaults={'name': name}
+            )
+            
+            if created:
+                # Envoyer email de notification (SMTP bloquant : exécuté dans un thread)
+                await sync_to_async(self.send_newsletter_email)(newsletter)
+                
+                return JsonResponse({
+                    'success': True,
+                    'message': 'Inscription réussie à la newsletter !'
+                })
+            else:
+                return JsonResponse({
+                    'success': False,
+                    'message': 'Cet email est déjà inscrit'
+                })
+        except Exception as e:
+            return JsonResponse({
+                'success': False,
+                'message': str(e)
+            })
+    
+    def send_newsletter_email(self, newsletter):
+        try:
+            subject = "Nouvelle inscription newsletter"
+            
+            message = f"""
+Nouvelle inscription à votre newsletter:
+
+Email: {newsletter.email}
+Nom: {newsletter.name or "Non renseigné"}
+Date d'inscription: {newsletter.subscribed_at.strftime('%d/%m/%Y à %H:%M')}
+
+Total d'abonnés actifs: {Newsletter.objects.filter(is_active=True).count()}
+
+Vous pouvez gérer les abonnés dans l'admin Django.
+"""
+            
+            send_mail(
+                subject,
+                message,
+                settings.DEFAULT_FROM_EMAIL,
+                [settings.EMAIL_HOST_USER],
+                fail_silently=False,
+            )
+        except Exception as e:
+            print(f"Erreur envoi email newsletter: {e}")
+
+class NewsletterSubscribeView(NewsletterAPIView):
+    """Ancienne adresse d'inscription, soumise à la même limite que NewsletterAPIView"""
+
+class StatsAPIView(RateLimitMixin, View):
+    # Endpoint public : 30 requêtes en rafale puis 1 toutes les 2 secondes par IP
+    rate_limit = (30, 0.5)
+    
+    async def get(self, request):
+        payload = json.dumps({
+            'success': True,
+            'stats': await sync_to_async(get_public_stats)()
+        }, sort_keys=True)
+        etag = quote_etag(hashlib.md5(payload.encode()).hexdigest())
+        
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(payload, content_type='application/json')
+        response['ETag'] = etag
+        patch_cache_control(response, public=True, max_age=PUBLIC_STATS_TTL)
+        return response
+
+class KeysetFeedAPIView(View):
+    """Flux JSON paginé par curseur pour le défilement infini"""
+    model = None
+    # Dernier champ unique (voir KeysetPaginator) ; par défaut les plus récents d'abord
+    ordering = ('-pk',)
+    per_page = 12
+    max_per_page = 50
+    
+    def get_queryset(self):
+        if self.model is None:
+            raise ImproperlyConfigured(f'{self.__class__.__name__} doit définir model ou get_queryset()')
+        return self.model._default_manager.all()
+    
+    def serialize(self, obj):
+        """Par défaut : identifiant, libellé et page de l'objet"""
+        data = {'id': obj.pk, 'title': str(obj)}
+        if hasattr(obj, 'get_absolute_url'):
+            data['url'] = obj.get_absolute_url()
+        return data
+    
+    def get(self, request):
+        try:
+            per_page = min(int(request.GET.get('limit', self.per_page)), self.max_per_page)
+        except ValueError:
+            per_page = self.per_page
+        paginator = KeysetPaginator(self.get_queryset(), self.ordering, max(per_page, 1))
+        try:
+            page = paginator.page(request.GET.get('cursor'))
+        except InvalidCursor:
+            return JsonResponse({'success': False, 'message': 'Curseur invalide'}, status=400)
+        
+        return JsonResponse({
+            'success': True,
+            'results': [self.serialize(obj) for obj in page],
+            'next_cursor': page.next_cursor,
+            'has_next': page.has_next,
+        })
+
+class ProjectFeedAPIView(KeysetFeedAPIView):
+    ordering = PROJECT_KEYSET_ORDERING
+    per_page = 9
+    
+    def get_queryset(self):
+        return Project.objects.only(
+            'title', 'description', 'technologies', 'status', 'start_date', 'end_date', 'image', 'is_featured'
+        )
+    
+    def serialize(self, project):
+        return {
+            'id': project.pk,
+            'title': project.title,
+            'description': project.description,
+            'technologies': [tech.strip() for tech in project.technologies.split(',') if tech.strip()],
+            'status': project.status,
+            'start_date': project.start_date,
+            'end_date': project.end_date,
+            'image': project.image.url if project.image else None,
+            'is_featured': project.is_featured,
+            'url': project.get_absolute_url(),
+        }
+
+class BlogFeedAPIView(KeysetFeedAPIView):
+    ordering = BLOG_KEYSET_ORDERING
+    per_page = 6
+    
+    def get_queryset(self):
+        return filter_blog_posts(
+            BlogPost.objects.filter(is_published=True).defer('content', *BLOG_LIST_DEFERRED_FIELDS).select_related('category'),
+            search=self.request.GET.get('search'),
+            tag=self.request.GET.get('tag'),
+        )
+    
+    def serialize(self, post):
+        return {
+            'title': post.title,
+            'slug': post.slug,
+            'excerpt': post.excerpt,
+            'category': post.category.name if post.category else None,
+            'tags': [tag.strip() for tag in post.tags.split(',') if tag.strip()],
+            'featured_image': post.featured_image.url if post.featured_image else None,
+            'reading_time': post.reading_time,
+            'views_count': post.views_count,
+            'published_at': post.published_at,
+            'url': post.get_absolute_url(),
+        }
+
+class FAQHelpfulAPIView(RateLimitMixin, View):
+    rate_limit = 'faq_vote'
+    
+    def post(self, request, faq_id):
+        try:
+            faq = get_object_or_404(FAQ, id=faq_id)
+            faq.helpful_votes += 1
+            faq.save(update_fields=['helpful_votes'])
+            
+            return JsonResponse({
+                'success': True,
+                'new_count': faq.helpful_votes
+            })
+        except Exception as e:
+            return JsonResponse({
+                'success': False,
+                'message': str(e)
+            })
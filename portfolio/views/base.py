@@ -0,0 +1,63 @@
+"""Briques communes des vues : statistiques de visite, ordres de pagination, listes allégées"""
+from django.conf import settings
+from django.db.models import Q
+from django.views.generic import TemplateView
+from ..models import VisitorStats
+from ..ratelimit import get_client_ip
+
+# Champs texte volumineux jamais affichés dans les listes
+PROJECT_LIST_DEFERRED_FIELDS = (
+    'detailed_description', 'detailed_description_html', 'detailed_description_toc',
+    'team_members', 'challenges_faced', 'lessons_learned', 'metrics', 'awards',
+)
+TESTIMONIAL_LIST_DEFERRED_FIELDS = ('user_agent',)
+# Rendu HTML du contenu : seules les pages de détail l'affichent
+BLOG_LIST_DEFERRED_FIELDS = ('content_html', 'content_toc')
+
+def tracking_enabled():
+    """Statistiques de visite et compteurs de vues/téléchargements (désactivés par freeze_site)"""
+    return getattr(settings, 'VISITOR_TRACKING', True)
+
+class VisitorStatsMixin:
+    """Collecte des statistiques de visite, combinable avec toute vue générique"""
+    
+    def dispatch(self, request, *args, **kwargs):
+        if tracking_enabled():
+            self.record_visit(request)
+        return super().dispatch(request, *args, **kwargs)
+    
+    def record_visit(self, request):
+        # Collecter les statistiques de visite
+        try:
+            VisitorStats.objects.create(
+                ip_address=self.get_client_ip(request),
+                user_agent=request.META.get('HTTP_USER_AGENT', '')[:500],
+                page_visited=request.path,
+                referrer=request.META.get('HTTP_REFERER', ''),
+                session_id=request.session.session_key or ''
+            )
+        except:
+            pass  # Ignore errors in stats collection
+    
+    def get_client_ip(self, request):
+        return get_client_ip(request)
+
+# Ordres totaux (départagés par la clé primaire) utilisés par la pagination par curseur
+PROJECT_KEYSET_ORDERING = ('-start_date', '-pk')
+BLOG_KEYSET_ORDERING = ('-published_at', '-created_at', '-pk')
+
+def filter_blog_posts(queryset, search=None, tag=None):
+    if search:
+        queryset = queryset.filter(
+            Q(title__icontains=search) | 
+            Q(content__icontains=search) |
+            Q(tags__icontains=search)
+        )
+    
+    if tag:
+        queryset = queryset.filter(tags__icontains=tag)
+    
+    return queryset
+
+class BasePortfolioView(VisitorStatsMixin, TemplateView):
+    """Vue de base avec collecte de statistiques"""
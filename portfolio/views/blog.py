@@ -0,0 +1,77 @@
+from django.db.models import Q
+from django.views.generic import ListView, DetailView
+from ..models import BlogPost, Profile
+from ..pagination import KeysetPaginationMixin
+from ..related import related_to
+from .base import VisitorStatsMixin, tracking_enabled, BLOG_KEYSET_ORDERING, BLOG_LIST_DEFERRED_FIELDS, filter_blog_posts
+
+class BlogListView(VisitorStatsMixin, KeysetPaginationMixin, ListView):
+    model = BlogPost
+    template_name = 'portfolio/blog.html'
+    context_object_name = 'posts'
+    paginate_by = 6
+    keyset_ordering = BLOG_KEYSET_ORDERING
+    
+    def get_queryset(self):
+        return filter_blog_posts(
+            BlogPost.objects.filter(is_published=True).select_related('category', 'author')
+            .defer(*BLOG_LIST_DEFERRED_FIELDS),
+            search=self.request.GET.get('search'),
+            tag=self.request.GET.get('tag'),
+        )
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update({
+            'featured_posts': BlogPost.objects.filter(
+                is_published=True, is_featured=True
+            ).select_related('category', 'author').defer(*BLOG_LIST_DEFERRED_FIELDS)[:3],
+            'popular_tags': self.get_popular_tags(),
+        })
+        return context
+    
+    def get_popular_tags(self):
+        # Extraire les tags populaires des articles
+        all_tags = []
+        for tags in BlogPost.objects.filter(is_published=True).exclude(tags='').values_list('tags', flat=True):
+            all_tags.extend([tag.strip() for tag in tags.split(',')])
+        
+        # Compter les occurrences
+        from collections import Counter
+        tag_counts = Counter(all_tags)
+        return [tag for tag, count in tag_counts.most_common(10)]
+
+class BlogDetailView(VisitorStatsMixin, DetailView):
+    model = BlogPost
+    template_name = 'portfolio/blog_detail.html'
+    context_object_name = 'post'
+    
+    def get_queryset(self):
+        return BlogPost.objects.filter(is_published=True).select_related('category', 'author')
+    
+    def get_object(self, queryset=None):
+        obj = super().get_object(queryset)
+        # Incrémenter le compteur de vues
+        if tracking_enabled():
+            obj.views_count += 1
+            obj.save(update_fields=['views_count'])
+        return obj
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        post = self.object
+        
+        # Articles similaires précalculés (seuls les champs affichés dans la sidebar)
+        related_fields = ('title', 'slug', 'featured_image', 'published_at', 'created_at')
+        # complétés par les articles de la même catégorie tant que les voisins ne sont pas calculés
+        related_posts = related_to(
+            post,
+            BlogPost.objects.filter(is_published=True).exclude(pk=post.pk).only(*related_fields),
+            fallback=Q(category_id=post.category_id),
+        )
+        
+        context.update({
+            'related_posts': related_posts,
+            'profile': Profile.objects.first(),
+        })
+        return context
@@ -0,0 +1,76 @@
+from django.shortcuts import render, redirect
+from django.contrib import messages
+from django.core.mail import send_mail
+from django.conf import settings
+from django.utils.translation import gettext as _
+from ..forms import ContactForm
+from ..models import Profile
+from ..ratelimit import RateLimitMixin
+from .base import BasePortfolioView
+
+class ContactView(RateLimitMixin, BasePortfolioView):
+    template_name = 'portfolio/contact.html'
+    rate_limit = 'contact'
+    rate_limit_methods = ('POST',)
+    rate_limit_template = 'portfolio/rate_limited.html'
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['form'] = ContactForm()
+        context['profile'] = Profile.objects.first()
+        return context
+    
+    def post(self, request, *args, **kwargs):
+        form = ContactForm(request.POST)
+        if form.is_valid():
+            contact = form.save(commit=False)
+            contact.ip_address = self.get_client_ip(request)
+            contact.save()
+            
+            # Envoyer email de notification
+            self.send_contact_email(contact)
+            
+            messages.success(request, _("Votre message a été envoyé avec succès !"))
+            return redirect('portfolio:contact_success')
+        
+        context = self.get_context_data(**kwargs)
+        context['form'] = form
+        return render(request, self.template_name, context)
+    
+    def send_contact_email(self, contact):
+        try:
+            subject = f"Nouveau message de {contact.name}: {contact.subject}"
+            
+            message = f"""
+Nouveau message reçu via le formulaire de contact:
+
+Informations du contact:
+- Nom: {contact.name}
+- Email: {contact.email}
+- Téléphone: {contact.phone or "Non renseigné"}
+- Entreprise: {contact.company or "Non renseignée"}
+- Budget: {contact.budget or "Non renseigné"}
+- Délai: {contact.timeline or "Non renseigné"}
+
+Sujet: {contact.subject}
+
+Message:
+{contact.message}
+
+---
+Envoyé le {contact.created_at.strftime('%d/%m/%Y à %H:%M')}
+IP: {contact.ip_address}
+"""
+            
+            send_mail(
+                subject,
+                message,
+                settings.DEFAULT_FROM_EMAIL,
+                [settings.EMAIL_HOST_USER],
+                fail_silently=False,
+            )
+        except Exception as e:
+            print(f"Erreur envoi email: {e}")
+
+class ContactSuccessView(BasePortfolioView):
+    template_name = 'portfolio/contact_success.html'
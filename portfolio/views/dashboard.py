@@ -0,0 +1,72 @@
+from django.shortcuts import render, redirect
+from django.contrib import messages
+from django.contrib.auth.mixins import UserPassesTestMixin
+from django.http import HttpResponse
+from django.utils.http import quote_etag
+from django.views import View
+from ..forms import SiteCustomizationForm
+from ..models import Contact, SiteCustomization, Testimonial
+from ..stats import get_dashboard_stats
+from ..theme import preview_stylesheet
+from .base import BasePortfolioView, TESTIMONIAL_LIST_DEFERRED_FIELDS
+
+class AdminDashboardView(UserPassesTestMixin, BasePortfolioView):
+    template_name = 'portfolio/admin/dashboard.html'
+    
+    def test_func(self):
+        return self.request.user.is_superuser
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        
+        # Statistiques (agrégées en cache, voir portfolio/stats.py)
+        context.update(get_dashboard_stats())
+        context.update({
+            'recent_contacts': Contact.objects.all()[:5],
+            'recent_testimonials': Testimonial.objects.defer(*TESTIMONIAL_LIST_DEFERRED_FIELDS)[:5],
+        })
+        return context
+
+class AdminCustomizationView(UserPassesTestMixin, BasePortfolioView):
+    template_name = 'portfolio/admin/customization.html'
+    
+    def test_func(self):
+        return self.request.user.is_superuser
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        customization = SiteCustomization.objects.filter(is_active=True).first()
+        context['form'] = SiteCustomizationForm(instance=customization)
+        return context
+    
+    def post(self, request, *args, **kwargs):
+        customization = SiteCustomization.objects.filter(is_active=True).first()
+        form = SiteCustomizationForm(request.POST, request.FILES, instance=customization)
+        
+        if form.is_valid():
+            form.save()
+            messages.success(request, "Personnalisation sauvegardée avec succès !")
+            return redirect('portfolio:admin_customization')
+        
+        context = self.get_context_data(**kwargs)
+        context['form'] = form
+        return render(request, self.template_name, context)
+
+class AdvancedAnalyticsView(UserPassesTestMixin, BasePortfolioView):
+    template_name = 'portfolio/analytics.html'
+    
+    def test_func(self):
+        return self.request.user.is_superuser
+
+class CustomizationPreviewAPIView(UserPassesTestMixin, View):
+    """Feuille de style compilée à partir du formulaire de personnalisation, sans l'enregistrer"""
+
+    def test_func(self):
+        return self.request.user.is_superuser
+
+    def post(self, request):
+        key, css = preview_stylesheet(request.POST)
+        response = HttpResponse(css, content_type='text/css; charset=utf-8')
+        response['ETag'] = quote_etag(key[:32])
+        response['Cache-Control'] = 'private, no-store'
+        return response
@@ -0,0 +1,114 @@
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import F
+from django.shortcuts import aget_object_or_404
+from django.http import FileResponse, HttpResponse, Http404, StreamingHttpResponse
+from django.utils.http import content_disposition_header
+from django.views import View
+from ..models import CVDocument, Profile, Resource
+from .base import BasePortfolioView, tracking_enabled
+import mimetypes
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _open_for_download(field_file):
+    field_file.open('rb')
+    return field_file.size
+
+
+async def _stream_chunks(field_file):
+    # Lectures dans un thread : la boucle d'événements reste libre pour les autres clients
+    read = sync_to_async(field_file.read, thread_sensitive=False)
+    try:
+        while chunk := await read(DOWNLOAD_CHUNK_SIZE):
+            yield chunk
+    finally:
+        await sync_to_async(field_file.close, thread_sensitive=False)()
+
+
+async def file_download(request, field_file, filename, content_type=None):
+    """Réponse de téléchargement servie par morceaux, sans charger le fichier en mémoire"""
+    size = await sync_to_async(_open_for_download, thread_sensitive=False)(field_file)
+    content_type = content_type or mimetypes.guess_type(field_file.name)[0] or 'application/octet-stream'
+
+    if isinstance(request, ASGIRequest):
+        response = StreamingHttpResponse(_stream_chunks(field_file), content_type=content_type)
+        response['Content-Length'] = str(size)
+        response['Content-Disposition'] = content_disposition_header(True, filename)
+        return response
+
+    # WSGI : FileResponse profite de wsgi.file_wrapper (sendfile) quand le serveur le fournit
+    return FileResponse(field_file, as_attachment=True, filename=filename, content_type=content_type)
+
+
+class DownloadCVView(View):
+    async def get(self, request, *args, **kwargs):
+        cv_type = request.GET.get('type', 'main')
+        language = request.GET.get('lang', 'fr')
+        
+        try:
+            cv = await sync_to_async(self.find_cv)(cv_type, language)
+            if cv and cv.file:
+                # Incrémenter le compteur sans repasser par CVDocument.save()
+                if tracking_enabled():
+                    await CVDocument.objects.filter(pk=cv.pk).aupdate(download_count=F('download_count') + 1)
+                
+                # Retourner le fichier
+                return await file_download(request, cv.file, f'{cv.title}.pdf', 'application/pdf')
+        except Exception:
+            # Fichier manquant ou illisible : CV généré ; une annulation (client parti) se propage
+            pass
+        
+        # Générer un CV automatique si aucun fichier n'est disponible
+        return await self.generate_auto_cv(request)
+    
+    def find_cv(self, cv_type, language):
+        # Chercher un CV correspondant
+        cv = CVDocument.objects.filter(
+            is_public=True,
+            cv_type=cv_type,
+            language=language
+        ).first()
+        
+        if not cv:
+            # Chercher le CV principal
+            cv = CVDocument.objects.filter(is_primary=True, is_public=True).first()
+        return cv
+    
+    async def generate_auto_cv(self, request):
+        profile = await Profile.objects.afirst()
+        if not profile:
+            raise Http404("CV non disponible")
+        
+        # Import différé : ReportLab n'est chargé qu'au premier CV généré
+        from ..cv_pdf import build_cv_pdf
+        
+        # ReportLab est synchrone et coûteux en CPU : la boucle d'événements n'attend pas la mise en page
+        pdf = await sync_to_async(build_cv_pdf, thread_sensitive=False)(profile)
+        response = HttpResponse(pdf, content_type='application/pdf')
+        response['Content-Disposition'] = f'attachment; filename="CV_{profile.name.replace(" ", "_")}.pdf"'
+        return response
+
+class CVListView(BasePortfolioView):
+    template_name = 'portfolio/cv_list.html'
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update({
+            'cv_documents': CVDocument.objects.filter(is_public=True),
+            'cv_types': CVDocument.CV_TYPES,
+            'languages': [('fr', 'Français'), ('en', 'English'), ('ar', 'العربية')],
+        })
+        return context
+
+class ResourceDownloadView(View):
+    async def get(self, request, resource_id):
+        resource = await aget_object_or_404(Resource, id=resource_id, is_public=True)
+        
+        # Incrémenter le compteur
+        if tracking_enabled():
+            await Resource.objects.filter(pk=resource.pk).aupdate(download_count=F('download_count') + 1)
+        
+        # Retourner le fichier
+        return await file_download(request, resource.file, resource.title)
@@ -0,0 +1,102 @@
+"""Fichiers servis par Django : vignettes, service worker et statiques précompressés"""
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import HttpResponse, Http404, FileResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag, http_date
+from django.utils.translation import gettext as _
+from django.views import View
+import hashlib
+import mimetypes
+import os
+import re
+from ..serviceworker import get_service_worker
+from ..thumbnails import get_thumbnail, InvalidThumbnail, CONTENT_TYPES as THUMBNAIL_CONTENT_TYPES
+
+class ThumbnailView(View):
+    """Vignette générée au premier appel puis servie depuis le cache disque"""
+    max_age = getattr(settings, 'THUMBNAIL_MAX_AGE', 365 * 24 * 60 * 60)
+
+    def get(self, request, spec, path):
+        handle, fmt, key = self.open_thumbnail(spec, path, request.META.get('HTTP_ACCEPT', ''))
+        etag = quote_etag(key)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = FileResponse(handle, content_type=THUMBNAIL_CONTENT_TYPES[fmt])
+        else:
+            handle.close()
+        response['ETag'] = etag
+        response['Vary'] = 'Accept'
+        patch_cache_control(response, public=True, max_age=self.max_age)
+        return response
+
+    def open_thumbnail(self, spec, path, accept):
+        # Second essai : la vignette a pu être évincée par un autre worker entre son rendu et son ouverture
+        for attempt in range(2):
+            try:
+                thumbnail_path, fmt, key = get_thumbnail(path, spec, accept)
+                return open(thumbnail_path, 'rb'), fmt, key
+            except FileNotFoundError:
+                continue
+            except (InvalidThumbnail, OSError):
+                # Format refusé ou fichier qui n'est pas une image
+                break
+        raise Http404(_("Vignette introuvable"))
+
+class ServiceWorkerView(View):
+    """sw.js servi à la racine pour contrôler tout le site"""
+
+    def get(self, request):
+        content = get_service_worker()
+        etag = quote_etag(hashlib.md5(content.encode()).hexdigest())
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(content, content_type='application/javascript; charset=utf-8')
+        response['ETag'] = etag
+        response['Service-Worker-Allowed'] = '/'
+        # Toujours revalidé : une nouvelle version doit être vue dès la prochaine navigation
+        patch_cache_control(response, no_cache=True)
+        return response
+
+class PrecompressedStaticView(View):
+    """
+    Sert STATIC_ROOT en choisissant la variante .br ou .gz écrite par collectstatic
+    selon Accept-Encoding. Les noms hachés sont mis en cache un an côté client.
+    """
+    hashed_name_re = re.compile(r'\.[0-9a-f]{12}\.[^.]+$')
+    encodings = (('br', '.br'), ('gzip', '.gz'))
+
+    def get(self, request, path):
+        try:
+            fullpath = safe_join(settings.STATIC_ROOT, path)
+        except SuspiciousFileOperation:
+            raise Http404
+        if not os.path.isfile(fullpath):
+            raise Http404
+
+        mtime = int(os.stat(fullpath).st_mtime)
+        response = get_conditional_response(request, last_modified=mtime)
+        if response is None:
+            accepted = {
+                token.split(';')[0].strip()
+                for token in request.META.get('HTTP_ACCEPT_ENCODING', '').split(',')
+            }
+            served, encoding = fullpath, None
+            for name, suffix in self.encodings:
+                if name in accepted and os.path.isfile(fullpath + suffix):
+                    served, encoding = fullpath + suffix, name
+                    break
+
+            content_type = mimetypes.guess_type(fullpath)[0] or 'application/octet-stream'
+            response = FileResponse(open(served, 'rb'), content_type=content_type)
+            if encoding:
+                response['Content-Encoding'] = encoding
+
+        response['Last-Modified'] = http_date(mtime)
+        response['Vary'] = 'Accept-Encoding'
+        if self.hashed_name_re.search(path):
+            patch_cache_control(response, public=True, max_age=365 * 24 * 60 * 60, immutable=True)
+        else:
+            patch_cache_control(response, public=True, max_age=60 * 60)
+        return response
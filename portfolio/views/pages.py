@@ -0,0 +1,115 @@
+from django.db.models import Count
+from ..models import (
+    Achievement, BlogPost, Certification, Collaboration, Education, Experience, FAQ, Profile,
+    Project, Resource, Service, Skill, Testimonial, Timeline,
+)
+from .base import (
+    BasePortfolioView, BLOG_LIST_DEFERRED_FIELDS, PROJECT_LIST_DEFERRED_FIELDS, TESTIMONIAL_LIST_DEFERRED_FIELDS,
+)
+
+class HomeView(BasePortfolioView):
+    template_name = 'portfolio/home.html'
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update({
+            'profile': Profile.objects.first(),
+            'featured_skills': Skill.objects.filter(is_featured=True)[:6],
+            'recent_experiences': Experience.objects.all()[:3],
+            'services': Service.objects.filter(is_active=True)[:4],
+            'testimonials': Testimonial.objects.filter(
+                is_approved=True, is_featured=True
+            ).select_related('project_related').defer(*TESTIMONIAL_LIST_DEFERRED_FIELDS)[:3],
+            'recent_blog_posts': BlogPost.objects.filter(
+                is_published=True
+            ).select_related('category', 'author').defer(*BLOG_LIST_DEFERRED_FIELDS)[:3],
+            'achievements': Achievement.objects.all()[:3],
+            'featured_projects': Project.objects.filter(
+                is_featured=True
+            ).defer(*PROJECT_LIST_DEFERRED_FIELDS)[:3],
+        })
+        return context
+
+class AcademicView(BasePortfolioView):
+    template_name = 'portfolio/academic.html'
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update({
+            'educations': Education.objects.all(),
+            'skills': Skill.objects.all(),
+        })
+        return context
+
+class ExperienceView(BasePortfolioView):
+    template_name = 'portfolio/experience.html'
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['experiences'] = Experience.objects.all()
+        return context
+
+class CertificationView(BasePortfolioView):
+    template_name = 'portfolio/certifications.html'
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['certifications'] = Certification.objects.all()
+        return context
+
+class ServicesView(BasePortfolioView):
+    template_name = 'portfolio/services.html'
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['services'] = Service.objects.filter(is_active=True)
+        return context
+
+class FAQView(BasePortfolioView):
+    template_name = 'portfolio/faq.html'
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update({
+            'faqs': FAQ.objects.filter(is_active=True),
+            'faq_categories': FAQ.objects.filter(is_active=True).values('category').annotate(count=Count('id')),
+        })
+        return context
+
+class TimelineView(BasePortfolioView):
+    template_name = 'portfolio/timeline.html'
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update({
+            'timeline_events': Timeline.objects.all(),
+            'categories': Timeline.objects.values('category').annotate(count=Count('id')),
+        })
+        return context
+
+class CollaborationsView(BasePortfolioView):
+    template_name = 'portfolio/collaborations.html'
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['collaborations'] = Collaboration.objects.filter(is_active=True)
+        return context
+
+class ResourcesView(BasePortfolioView):
+    template_name = 'portfolio/resources.html'
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update({
+            'resources': Resource.objects.filter(is_public=True),
+            'resource_categories': Resource.objects.filter(is_public=True).values('category').annotate(count=Count('id')),
+        })
+        return context
+
+class AchievementsView(BasePortfolioView):
+    template_name = 'portfolio/achievements.html'
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['achievements'] = Achievement.objects.all()
+        return context
@@ -0,0 +1,30 @@
+from django.views.generic import ListView, DetailView
+from ..models import BlogPost, Project
+from ..pagination import KeysetPaginationMixin
+from ..related import related_to
+from .base import VisitorStatsMixin, PROJECT_KEYSET_ORDERING, PROJECT_LIST_DEFERRED_FIELDS
+
+class ProjectListView(VisitorStatsMixin, KeysetPaginationMixin, ListView):
+    model = Project
+    template_name = 'portfolio/projects.html'
+    context_object_name = 'projects'
+    paginate_by = 9
+    keyset_ordering = PROJECT_KEYSET_ORDERING
+    
+    def get_queryset(self):
+        return Project.objects.defer(*PROJECT_LIST_DEFERRED_FIELDS)
+
+class ProjectDetailView(VisitorStatsMixin, DetailView):
+    model = Project
+    template_name = 'portfolio/project_detail.html'
+    context_object_name = 'project'
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update({
+            'related_projects': related_to(self.object, Project.objects.defer(*PROJECT_LIST_DEFERRED_FIELDS)),
+            'related_posts': related_to(self.object, BlogPost.objects.filter(is_published=True).only(
+                'title', 'slug', 'featured_image', 'published_at', 'created_at'
+            )),
+        })
+        return context
@@ -0,0 +1,289 @@
+from django.shortcuts import render
+from django.http import JsonResponse
+from django.views import View
+from django.db.models import Q, Count
+from django.urls import reverse
+from ..models import BlogPost, Certification, Experience, FAQ, Project, Resource, SearchQuery, Skill, Testimonial
+from ..ratelimit import RateLimitMixin
+from .base import BasePortfolioView
+
+class UniversalSearchView(RateLimitMixin, BasePortfolioView):
+    template_name = 'portfolio/search_results.html'
+    rate_limit = 'search'
+    rate_limit_template = 'portfolio/rate_limited.html'
+    
+    def is_rate_limited_method(self, request):
+        # Seule une recherche effective est enregistrée ; la page vide reste accessible
+        return super().is_rate_limited_method(request) and bool(request.GET.get('q', '').strip())
+    
+    def get(self, request, *args, **kwargs):
+        query = request.GET.get('q', '').strip()
+        category = request.GET.get('category', 'all')
+        
+        if not query:
+            return render(request, self.template_name, {
+                'query': query,
+                'results': {},
+                'total_results': 0,
+                'suggestions': self.get_search_suggestions(),
+                'popular_searches': self.get_popular_searches(),
+            })
+        
+        # Enregistrer la recherche
+        SearchQuery.objects.create(
+            query=query,
+            ip_address=self.get_client_ip(request),
+            user_agent=request.META.get('HTTP_USER_AGENT', ''),
+        )
+        
+        results = self.perform_search(query, category)
+        total_results = sum(len(category_results) for category_results in results.values())
+        
+        return render(request, self.template_name, {
+            'query': query,
+            'category': category,
+            'results': results,
+            'total_results': total_results,
+            'suggestions': self.get_search_suggestions() if total_results == 0 else [],
+        })
+    
+    def perform_search(self, query, category):
+        results = {}
+        
+        if category in ['all', 'projects']:
+            results['projects'] = self.search_projects(query)
+        
+        if category in ['all', 'experiences']:
+            results['experiences'] = self.search_experiences(query)
+        
+        if category in ['all', 'skills']:
+            results['skills'] = self.search_skills(query)
+        
+        if category in ['all', 'blog']:
+            results['blog'] = self.search_blog(query)
+        
+        if category in ['all', 'certifications']:
+            results['certifications'] = self.search_certifications(query)
+        
+        if category in ['all', 'testimonials']:
+            results['testimonials'] = self.search_testimonials(query)
+        
+        if category in ['all', 'faq']:
+            results['faq'] = self.search_faq(query)
+        
+        if category in ['all', 'resources']:
+            results['resources'] = self.search_resources(query)
+        
+        return results
+    
+    def search_projects(self, query):
+        projects = Project.objects.filter(
+            Q(title__icontains=query) |
+            Q(description__icontains=query) |
+            Q(technologies__icontains=query) |
+            Q(client__icontains=query)
+        )
+        
+        return [{
+            'title': project.title,
+            'description': project.description,
+            'type': 'Projet',
+            'url': project.get_absolute_url(),
+            'image': project.image.url if project.image else None,
+            'date': project.start_date,
+            'tags': project.technologies.split(',') if project.technologies else [],
+        } for project in projects]
+    
+    def search_experiences(self, query):
+        experiences = Experience.objects.filter(
+            Q(title__icontains=query) |
+            Q(company__icontains=query) |
+            Q(description__icontains=query) |
+            Q(technologies__icontains=query)
+        )
+        
+        return [{
+            'title': f"{exp.title} - {exp.company}",
+            'description': exp.description,
+            'type': 'Expérience',
+            'url': reverse('portfolio:experience'),
+            'date': exp.start_date,
+            'tags': exp.technologies.split(',') if exp.technologies else [],
+        } for exp in experiences]
+    
+    def search_skills(self, query):
+        skills = Skill.objects.filter(
+            Q(name__icontains=query) |
+            Q(category__icontains=query)
+        )
+        
+        return [{
+            'title': skill.name,
+            'description': f"{skill.get_category_display()} - {skill.get_proficiency_display()}",
+            'type': 'Compétence',
+            'url': reverse('portfolio:academic'),
+            'tags': [skill.category, skill.proficiency],
+        } for skill in skills]
+    
+    def search_blog(self, query):
+        posts = BlogPost.objects.filter(
+            is_published=True
+        ).filter(
+            Q(title__icontains=query) |
+            Q(content__icontains=query) |
+            Q(tags__icontains=query)
+        )
+        
+        return [{
+            'title': post.title,
+            'description': post.excerpt or post.content[:200],
+            'type': 'Article',
+            'url': post.get_absolute_url(),
+            'image': post.featured_image.url if post.featured_image else None,
+            'date': post.published_at,
+            'tags': post.tags.split(',') if post.tags else [],
+        } for post in posts]
+    
+    def search_certifications(self, query):
+        certifications = Certification.objects.filter(
+            Q(name__icontains=query) |
+            Q(issuing_organization__icontains=query) |
+            Q(credential_id__icontains=query)
+        )
+        
+        return [{
+            'title': cert.name,
+            'description': f"Délivré par {cert.issuing_organization}",
+            'type': 'Certification',
+            'url': reverse('portfolio:certifications'),
+            'date': cert.issue_date,
+            'tags': [cert.issuing_organization],
+        } for cert in certifications]
+    
+    def search_testimonials(self, query):
+        testimonials = Testimonial.objects.filter(
+            is_approved=True
+        ).filter(
+            Q(content__icontains=query) |
+            Q(name__icontains=query) |
+            Q(company__icontains=query)
+        )
+        
+        return [{
+            'title': f"Témoignage de {test.name if not test.is_anonymous else 'Anonyme'}",
+            'description': test.content,
+            'type': 'Témoignage',
+            'url': reverse('portfolio:testimonials'),
+            'tags': [test.company] if test.company else [],
+        } for test in testimonials]
+    
+    def search_faq(self, query):
+        faqs = FAQ.objects.filter(
+            is_active=True
+        ).filter(
+            Q(question__icontains=query) |
+            Q(answer__icontains=query)
+        )
+        
+        return [{
+            'title': faq.question,
+            'description': faq.answer[:200],
+            'type': 'FAQ',
+            'url': reverse('portfolio:faq'),
+            'tags': [faq.category],
+        } for faq in faqs]
+    
+    def search_resources(self, query):
+        resources = Resource.objects.filter(
+            is_public=True
+        ).filter(
+            Q(title__icontains=query) |
+            Q(description__icontains=query) |
+            Q(category__icontains=query)
+        )
+        
+        return [{
+            'title': resource.title,
+            'description': resource.description,
+            'type': 'Ressource',
+            'url': reverse('portfolio:resource_download', kwargs={'resource_id': resource.id}),
+            'tags': [resource.category, resource.file_type],
+        } for resource in resources]
+    
+    def get_search_suggestions(self):
+        # Suggestions basées sur les recherches populaires
+        popular = SearchQuery.objects.values('query').annotate(
+            count=Count('id')
+        ).order_by('-count')[:10]
+        
+        return [item['query'] for item in popular]
+    
+    def get_popular_searches(self):
+        return SearchQuery.objects.values('query').annotate(
+            count=Count('id')
+        ).order_by('-count')[:5]
+
+class SearchSuggestionsAPIView(View):
+    async def get(self, request):
+        query = request.GET.get('q', '').strip()
+        
+        if len(query) < 2:
+            return JsonResponse({'suggestions': []})
+        
+        # Rechercher dans différents modèles
+        suggestions = set()
+        
+        # Projets
+        projects = Project.objects.filter(title__icontains=query).values_list('title', flat=True)[:3]
+        suggestions.update([title async for title in projects])
+        
+        # Compétences
+        skills = Skill.objects.filter(name__icontains=query).values_list('name', flat=True)[:3]
+        suggestions.update([name async for name in skills])
+        
+        # Technologies
+        async for technologies in Project.objects.exclude(technologies='').values_list('technologies', flat=True):
+            techs = [t.strip() for t in technologies.split(',')]
+            for tech in techs:
+                if query.lower() in tech.lower():
+                    suggestions.add(tech)
+        
+        return JsonResponse({
+            'suggestions': list(suggestions)[:10]
+        })
+
+class TagCloudAPIView(View):
+    def get(self, request):
+        # Collecter tous les tags
+        tags_data = []
+        
+        # Tags des projets
+        for project in Project.objects.all():
+            if project.technologies:
+                techs = [t.strip() for t in project.technologies.split(',')]
+                for tech in techs:
+                    tags_data.append({
+                        'name': tech,
+                        'url': f"/search/?q={tech}",
+                        'color': '#007bff',
+                        'count': 1
+                    })
+        
+        # Compter les occurrences
+        from collections import Counter
+        tag_names = [tag['name'] for tag in tags_data]
+        tag_counts = Counter(tag_names)
+        
+        # Créer la réponse
+        tags = []
+        colors = ['#007bff', '#28a745', '#dc3545', '#ffc107', '#6f42c1', '#fd7e14']
+        
+        for i, (name, count) in enumerate(tag_counts.most_common(20)):
+            tags.append({
+                'name': name,
+                'count': count,
+                'url': f"/search/?q={name}",
+                'color': colors[i % len(colors)]
+            })
+        
+        return JsonResponse({'tags': tags})
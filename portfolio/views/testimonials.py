@@ -0,0 +1,98 @@
+from django.shortcuts import render, redirect
+from django.contrib import messages
+from django.core.mail import send_mail
+from django.conf import settings
+from django.utils import timezone
+from django.utils.translation import gettext as _
+from ..forms import TestimonialForm
+from ..models import SiteSettings, Testimonial
+from ..ratelimit import RateLimitMixin
+from .base import BasePortfolioView, TESTIMONIAL_LIST_DEFERRED_FIELDS
+
+class TestimonialsView(BasePortfolioView):
+    template_name = 'portfolio/testimonials.html'
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['testimonials'] = Testimonial.objects.filter(
+            is_approved=True
+        ).select_related('project_related').defer(*TESTIMONIAL_LIST_DEFERRED_FIELDS)
+        return context
+
+class TestimonialCreateView(RateLimitMixin, BasePortfolioView):
+    template_name = 'portfolio/testimonial_form.html'
+    rate_limit = 'testimonial'
+    rate_limit_methods = ('POST',)
+    rate_limit_template = 'portfolio/rate_limited.html'
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['form'] = TestimonialForm()
+        context['recent_testimonials'] = Testimonial.objects.filter(
+            is_approved=True
+        ).select_related('project_related').defer(*TESTIMONIAL_LIST_DEFERRED_FIELDS)[:3]
+        return context
+    
+    def post(self, request, *args, **kwargs):
+        form = TestimonialForm(request.POST, request.FILES)
+        if form.is_valid():
+            testimonial = form.save(commit=False)
+            testimonial.ip_address = self.get_client_ip(request)
+            testimonial.user_agent = request.META.get('HTTP_USER_AGENT', '')
+            
+            # Auto-approuver si les témoignages ne nécessitent pas de modération
+            site_settings = SiteSettings.objects.first()
+            if not site_settings or not site_settings.moderate_testimonials:
+                testimonial.is_approved = True
+                testimonial.approved_at = timezone.now()
+            
+            testimonial.save()
+            
+            # Envoyer email de notification
+            self.send_testimonial_email(testimonial)
+            
+            messages.success(request, _("Merci pour votre témoignage !"))
+            return redirect('portfolio:testimonial_success')
+        
+        context = self.get_context_data(**kwargs)
+        context['form'] = form
+        return render(request, self.template_name, context)
+    
+    def send_testimonial_email(self, testimonial):
+        try:
+            subject = f"Nouveau témoignage de {testimonial.name if not testimonial.is_anonymous else 'Anonyme'}"
+            
+            stars = "⭐" * testimonial.rating
+            
+            message = f"""
+Nouveau témoignage reçu:
+
+Nom: {testimonial.name if not testimonial.is_anonymous else "Anonyme"}
+Email: {testimonial.email}
+Entreprise: {testimonial.company or "Non renseignée"}
+Poste: {testimonial.position or "Non renseigné"}
+Localisation: {testimonial.location or "Non renseignée"}
+Note: {stars} ({testimonial.rating}/5 étoiles)
+
+Témoignage:
+{testimonial.content}
+
+Projet associé: {testimonial.project_related.title if testimonial.project_related else "Aucun"}
+
+---
+Statut: {"Publié automatiquement" if testimonial.is_approved else "En attente de modération"}
+Reçu le {testimonial.created_at.strftime('%d/%m/%Y à %H:%M')}
+"""
+            
+            send_mail(
+                subject,
+                message,
+                settings.DEFAULT_FROM_EMAIL,
+                [settings.EMAIL_HOST_USER],
+                fail_silently=False,
+            )
+        except Exception as e:
+            print(f"Erreur envoi email témoignage: {e}")
+
+class TestimonialSuccessView(BasePortfolioView):
+    template_name = 'portfolio/testimonial_success.html'
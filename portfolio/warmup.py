@@ -0,0 +1,52 @@
+"""Précompilation des templates dans le cache du chargeur, avant la première requête"""
+import logging
+import os
+import time
+
+from django.conf import settings
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, engines
+
+logger = logging.getLogger(__name__)
+
+# Sous-dossier de chaque répertoire de templates à précompiler
+WARMUP_TEMPLATE_DIR = getattr(settings, 'WARMUP_TEMPLATE_DIR', 'portfolio')
+WARMUP_EXTENSIONS = ('.html', '.txt', '.xml', '.js')
+
+
+def template_names(subdirectory=WARMUP_TEMPLATE_DIR):
+    """Noms de tous les templates de `subdirectory`, plus base.html dont ils héritent"""
+    names = {'base.html'}
+    for directory in settings.TEMPLATES[0]['DIRS']:
+        root = os.path.join(directory, subdirectory)
+        for path, _, files in os.walk(root):
+            for filename in files:
+                if filename.endswith(WARMUP_EXTENSIONS):
+                    names.add(os.path.relpath(os.path.join(path, filename), directory).replace(os.sep, '/'))
+    return sorted(names)
+
+
+def reset_template_cache():
+    for engine in engines.all():
+        for loader in getattr(engine, 'engine', engine).template_loaders:
+            if hasattr(loader, 'reset'):
+                loader.reset()
+
+
+def warm_templates(names=None):
+    """
+    Compile chaque template dans le cache du chargeur.
+    Retourne (nombre compilé, erreurs, secondes).
+    """
+    engine = engines['django']
+    start = time.perf_counter()
+    compiled, errors = 0, []
+    for name in names or template_names():
+        try:
+            # Les parents ({% extends %}) et inclusions font partie de la liste :
+            # le premier rendu les trouvera eux aussi dans le cache
+            engine.get_template(name)
+            compiled += 1
+        except (TemplateDoesNotExist, TemplateSyntaxError) as exc:
+            errors.append((name, exc))
+            logger.error("Template %s non précompilé : %s", name, exc)
+    return compiled, errors, time.perf_counter() - start
@@ -0,0 +1,11 @@
+import os
+from django.conf import settings
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_project.settings')
+application = get_asgi_application()
+
+if settings.TEMPLATE_WARMUP:
+    # Chaque processus compile ses templates avant de recevoir le premier visiteur
+    from portfolio.warmup import warm_templates
+    warm_templates()
@@ -21,6 +21,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.sitemaps',
     'portfolio',
 ]
 
@@ -41,8 +42,15 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
-        'APP_DIRS': True,
         'OPTIONS': {
+            # Templates compilés une seule fois par processus ; en développement,
+            # l'autoreload vide ce cache dès qu'un template est modifié
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
@@ -56,6 +64,11 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'portfolio_project.wsgi.application'
+# Mode ASGI (uvicorn, daphne...) : les API et les téléchargements sont des vues asynchrones
+ASGI_APPLICATION = 'portfolio_project.asgi.application'
+
+# Précompilation des templates au démarrage de chaque processus WSGI/ASGI
+TEMPLATE_WARMUP = config('TEMPLATE_WARMUP', default=not DEBUG, cast=bool)
 
 # Database
 DATABASES = {
@@ -65,6 +78,17 @@ DATABASES = {
     }
 }
 
+# Cache (statistiques, limitation de débit). LocMemCache est propre à chaque
+# processus : avec N workers, chaque IP dispose de N fois la limite réglée dans
+# SiteSettings. En production, utiliser un backend partagé (Redis, Memcached,
+# base de données) ; `manage.py check --deploy` le signale (portfolio.W001).
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='portfolio'),
+    }
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -107,6 +131,22 @@ STATICFILES_DIRS = [
     BASE_DIR / 'static',
 ]
 
+# En production, collectstatic minifie, regroupe (portfolio/assets.py), ajoute le
+# hachage du contenu aux noms et écrit les variantes .gz/.br de chaque fichier.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage' if DEBUG
+        else 'portfolio.storage.BundledManifestStaticFilesStorage',
+    },
+}
+
+# Servir STATIC_ROOT depuis Django (variantes précompressées incluses) quand aucun
+# serveur web frontal ne s'en charge
+SERVE_STATIC = config('SERVE_STATIC', default=False, cast=bool)
+
 # Media files
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
@@ -125,8 +165,4 @@ EMAIL_HOST_USER = config('EMAIL_HOST_USER', default='')
 EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
 DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default=EMAIL_HOST_USER)
 
-# Configuration pour les PDF
-try:
-    import reportlab
-except ImportError:
-    pass
\ No newline at end of file
+# Configuration pour les PDF : ReportLab n'est importé qu'à la première génération (portfolio/cv_pdf.py)
@@ -1,21 +1,18 @@
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, re_path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from django.conf.urls.i18n import i18n_patterns
 from django.views.i18n import set_language
-from django.contrib.sitemaps.views import sitemap
-from portfolio.sitemaps import StaticViewSitemap, ProjectSitemap
-
-sitemaps = {
-    'static': StaticViewSitemap,
-    'projects': ProjectSitemap,
-}
+from portfolio.sitemaps import SITEMAPS, index as sitemap_index, sitemap
+from portfolio.views import PrecompressedStaticView, ServiceWorkerView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('i18n/setlang/', set_language, name='set_language'),
-    path('sitemap.xml', sitemap, {'sitemaps': sitemaps}, name='django.contrib.sitemaps.views.sitemap'),
+    path('sitemap.xml', sitemap_index, {'sitemaps': SITEMAPS}, name='sitemap_index'),
+    path('sitemap-<section>.xml', sitemap, {'sitemaps': SITEMAPS}, name='django.contrib.sitemaps.views.sitemap'),
+    path('sw.js', ServiceWorkerView.as_view(), name='service_worker'),
 ]
 
 urlpatterns += i18n_patterns(
@@ -25,4 +22,8 @@ urlpatterns += i18n_patterns(
 
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
-    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
\ No newline at end of file
+    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
+elif settings.SERVE_STATIC:
+    urlpatterns += [
+        re_path(r'^%s(?P<path>.*)$' % settings.STATIC_URL.lstrip('/'), PrecompressedStaticView.as_view()),
+    ]
@@ -0,0 +1,151 @@
+// Service Worker généré par portfolio/serviceworker.py — ne pas modifier le fichier collecté
+const VERSION = '{{ version }}';
+const STATIC_URL = '{{ static_url }}';
+const PRECACHE = 'portfolio-static-' + VERSION;
+const PAGES = 'portfolio-pages-' + VERSION;
+const API = 'portfolio-api-' + VERSION;
+const RUNTIME = 'portfolio-runtime-' + VERSION;
+const CURRENT_CACHES = [PRECACHE, PAGES, API, RUNTIME];
+const PRECACHE_URLS = {{ precache_urls|safe }};
+const MAX_PAGES = {{ max_pages }};
+// Pages jamais mises en cache (administration, formulaires avec jeton CSRF)
+const NO_CACHE_PREFIXES = {{ no_cache_prefixes|safe }};
+// Langues préfixées dans l'URL (/en/contact/) ; la langue par défaut ne l'est pas
+const LANGUAGE_CODES = {{ language_codes|safe }};
+
+self.addEventListener('install', function(event) {
+    event.waitUntil(
+        caches.open(PRECACHE)
+            .then(function(cache) {
+                return cache.addAll(PRECACHE_URLS);
+            })
+            .then(function() {
+                return self.skipWaiting();
+            })
+    );
+});
+
+self.addEventListener('activate', function(event) {
+    // Supprime les caches des versions précédentes
+    event.waitUntil(
+        caches.keys()
+            .then(function(names) {
+                return Promise.all(names.filter(function(name) {
+                    return name.startsWith('portfolio-') && CURRENT_CACHES.indexOf(name) === -1;
+                }).map(function(name) {
+                    return caches.delete(name);
+                }));
+            })
+            .then(function() {
+                return self.clients.claim();
+            })
+    );
+});
+
+function trimCache(cacheName, maxEntries) {
+    return caches.open(cacheName).then(function(cache) {
+        return cache.keys().then(function(keys) {
+            if (keys.length <= maxEntries) {
+                return;
+            }
+            return cache.delete(keys[0]).then(function() {
+                return trimCache(cacheName, maxEntries);
+            });
+        });
+    });
+}
+
+function cacheFirst(request) {
+    return caches.match(request).then(function(cached) {
+        return cached || fetch(request).then(function(response) {
+            if (response.ok) {
+                const copy = response.clone();
+                caches.open(RUNTIME).then(function(cache) {
+                    cache.put(request, copy);
+                });
+            }
+            return response;
+        });
+    });
+}
+
+function networkFirst(request, cacheName) {
+    return fetch(request)
+        .then(function(response) {
+            if (response.ok) {
+                const copy = response.clone();
+                caches.open(cacheName).then(function(cache) {
+                    cache.put(request, copy);
+                });
+            }
+            return response;
+        })
+        .catch(function() {
+            return caches.match(request);
+        });
+}
+
+function staleWhileRevalidate(event, cacheName, maxEntries) {
+    const request = event.request;
+    return caches.open(cacheName).then(function(cache) {
+        return cache.match(request).then(function(cached) {
+            const network = fetch(request)
+                .then(function(response) {
+                    if (response.ok && response.type !== 'opaqueredirect') {
+                        return cache.put(request, response.clone()).then(function() {
+                            if (maxEntries) {
+                                trimCache(cacheName, maxEntries);
+                            }
+                            return response;
+                        });
+                    }
+                    return response;
+                })
+                .catch(function() {
+                    return cached;
+                });
+            // La réponse en cache est servie tout de suite, la mise à jour continue en arrière-plan
+            event.waitUntil(network);
+            return cached || network;
+        });
+    });
+}
+
+// Chemin sans son préfixe de langue : /en/contact/ -> /contact/
+function routePath(pathname) {
+    const segments = pathname.split('/');
+    if (segments.length > 2 && LANGUAGE_CODES.indexOf(segments[1]) !== -1) {
+        return '/' + segments.slice(2).join('/');
+    }
+    return pathname;
+}
+
+self.addEventListener('fetch', function(event) {
+    const request = event.request;
+    if (request.method !== 'GET') {
+        return;
+    }
+
+    const url = new URL(request.url);
+    if (url.origin !== self.location.origin) {
+        // Bootstrap, Font Awesome, polices : versionnés dans l'URL
+        if (['style', 'script', 'font'].indexOf(request.destination) !== -1) {
+            event.respondWith(staleWhileRevalidate(event, RUNTIME));
+        }
+        return;
+    }
+
+    const path = routePath(url.pathname);
+    if (NO_CACHE_PREFIXES.some(function(prefix) { return path.startsWith(prefix); })) {
+        return;
+    }
+
+    // /api/ et /<langue>/api/
+    if (path.startsWith('/api/')) {
+        event.respondWith(networkFirst(request, API));
+    } else if (url.pathname.startsWith(STATIC_URL)) {
+        event.respondWith(cacheFirst(request));
+    } else if (request.mode === 'navigate' || (request.headers.get('accept') || '').indexOf('text/html') !== -1) {
+        event.respondWith(staleWhileRevalidate(event, PAGES, MAX_PAGES));
+    }
+});